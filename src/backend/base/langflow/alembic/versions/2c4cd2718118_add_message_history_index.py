@@ -0,0 +1,39 @@
+"""Add message history index
+
+Revision ID: 2c4cd2718118
+Revises: 66f72f04a1de
+Create Date: 2025-05-12 10:14:32.518204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "2c4cd2718118"
+down_revision: Union[str, None] = "66f72f04a1de"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_message_session_id_flow_id_timestamp"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes = inspector.get_indexes("message")
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        indexes_names = [index["name"] for index in indexes]
+        if INDEX_NAME not in indexes_names:
+            batch_op.create_index(INDEX_NAME, ["session_id", "flow_id", "timestamp"], unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes = inspector.get_indexes("message")
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        indexes_names = [index["name"] for index in indexes]
+        if INDEX_NAME in indexes_names:
+            batch_op.drop_index(INDEX_NAME)
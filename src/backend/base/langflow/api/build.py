@@ -424,6 +424,7 @@ async def generate_flow_events(
             raise ValueError(msg) from exc
 
         event_manager.on_end_vertex(data={"build_data": build_data})
+        await event_manager.wait_for_capacity()
 
         if vertex_build_response.valid and vertex_build_response.next_vertices_ids:
             tasks = []
@@ -1,7 +1,7 @@
 import asyncio
 import json
 from http import HTTPStatus
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -11,49 +11,34 @@ from langflow.logging.logger import log_buffer
 log_router = APIRouter(tags=["Log"])
 
 
-NUMBER_OF_NOT_SENT_BEFORE_KEEPALIVE = 5
+KEEPALIVE_INTERVAL_SECONDS = 5
 
 
-async def event_generator(request: Request):
+async def event_generator(request: Request, sequence: int | None = None):
     global log_buffer  # noqa: PLW0602
-    last_read_item = None
-    current_not_sent = 0
-    while not await request.is_disconnected():
-        to_write: list[Any] = []
-        with log_buffer.get_write_lock():
-            if last_read_item is None:
-                last_read_item = log_buffer.buffer[len(log_buffer.buffer) - 1]
-            else:
-                found_last = False
-                for item in log_buffer.buffer:
-                    if found_last:
-                        to_write.append(item)
-                        last_read_item = item
-                        continue
-                    if item is last_read_item:
-                        found_last = True
-                        continue
-
-                # in case the last item is nomore in the buffer
-                if not found_last:
-                    for item in log_buffer.buffer:
-                        to_write.append(item)
-                        last_read_item = item
-        if to_write:
-            for ts, msg in to_write:
-                yield f"{json.dumps({ts: msg})}\n\n"
-        else:
-            current_not_sent += 1
-            if current_not_sent == NUMBER_OF_NOT_SENT_BEFORE_KEEPALIVE:
-                current_not_sent = 0
+    # Without a starting point, only the messages logged from now on are sent
+    if sequence is None:
+        sequence = log_buffer.next_sequence
+    with log_buffer.subscribe() as new_message:
+        while not await request.is_disconnected():
+            new_message.clear()
+            to_write, sequence = log_buffer.read_from(sequence)
+            if to_write:
+                for ts, msg in to_write:
+                    yield f"{json.dumps({ts: msg})}\n\n"
+                continue
+            try:
+                await asyncio.wait_for(new_message.wait(), timeout=KEEPALIVE_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
                 yield "keepalive\n\n"
 
-        await asyncio.sleep(1)
-
 
 @log_router.get("/logs-stream")
 async def stream_logs(
     request: Request,
+    timestamp: Annotated[
+        int, Query(description="The timestamp to start streaming logs from, defaults to the logs from now on")
+    ] = 0,
 ):
     """HTTP/2 Server-Sent-Event (SSE) endpoint for streaming logs.
 
@@ -67,7 +52,8 @@ async def stream_logs(
             detail="Log retrieval is disabled",
         )
 
-    return StreamingResponse(event_generator(request), media_type="text/event-stream")
+    sequence = log_buffer.sequence_at(timestamp) if timestamp > 0 else None
+    return StreamingResponse(event_generator(request, sequence), media_type="text/event-stream")
 
 
 @log_router.get("/logs")
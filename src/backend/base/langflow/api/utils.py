@@ -13,13 +13,15 @@ from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.graph.graph.base import Graph
+from langflow.memory import get_session_history_cache
+from langflow.processing.graph_cache import get_compiled_graph_cache
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import User
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.message import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
-from langflow.services.deps import get_session, session_scope
+from langflow.services.deps import get_build_log_service, get_session, session_scope
 from langflow.services.store.utils import get_lf_version_from_pypi
 
 if TYPE_CHECKING:
@@ -297,6 +299,7 @@ def parse_value(value: Any, input_type: str) -> Any:
 
 
 async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None:
+    get_build_log_service().discard(flow_id)
     try:
         # TODO: Verify if deleting messages is safe in terms of session id relevance
         # If we delete messages directly, rather than setting flow_id to null,
@@ -309,6 +312,8 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
     except Exception as e:
         msg = f"Unable to cascade delete flow: {flow_id}"
         raise RuntimeError(msg, e) from e
+    get_compiled_graph_cache().invalidate(flow_id)
+    get_session_history_cache().invalidate_flow(flow_id)
 
 
 def custom_params(
@@ -16,13 +16,13 @@ from loguru import logger
 from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
-from sqlmodel import select
+from sqlmodel import col, select
 from starlette.background import BackgroundTasks
 
 from langflow.api.v1.chat import build_flow_and_stream
 from langflow.api.v1.schemas import InputValueRequest
 from langflow.base.mcp.util import get_flow_snake_case
-from langflow.helpers.flow import json_schema_from_flow
+from langflow.helpers.flow import aget_flow_input_schemas, get_flow_schema_cache
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import Flow, User
 from langflow.services.deps import (
@@ -178,20 +178,23 @@ async def handle_list_tools():
     try:
         db_service = get_db_service()
         async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
+            # The flow data is only loaded for the flows whose schema is not cached
+            stmt = select(Flow.id, Flow.name, Flow.description, Flow.updated_at).where(col(Flow.user_id).is_not(None))
+            flows = (await session.exec(stmt)).all()
+            schemas = await aget_flow_input_schemas(session, flows)
+            get_flow_schema_cache().retain({flow.id for flow in flows})
 
             for flow in flows:
-                if flow.user_id is None:
-                    continue
-
                 flow_name = "_".join(flow.name.lower().split())
+                if flow.id not in schemas:
+                    continue
                 try:
                     tool = types.Tool(
                         name=flow_name,
                         description=f"{flow.id}: {flow.description}"
                         if flow.description
                         else f"Tool generated from flow: {flow_name}",
-                        inputSchema=json_schema_from_flow(flow),
+                        inputSchema=schemas[flow.id],
                     )
                     tools.append(tool)
                 except Exception as e:  # noqa: BLE001
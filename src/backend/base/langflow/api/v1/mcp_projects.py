@@ -15,7 +15,7 @@ from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select
 
 from langflow.api.v1.chat import build_flow_and_stream
 from langflow.api.v1.mcp import (
@@ -26,7 +26,7 @@ from langflow.api.v1.mcp import (
 )
 from langflow.api.v1.schemas import InputValueRequest, MCPSettings
 from langflow.base.mcp.util import get_flow_snake_case
-from langflow.helpers.flow import json_schema_from_flow
+from langflow.helpers.flow import aget_flow_input_schemas
 from langflow.services.auth.utils import get_current_active_user, get_current_user
 from langflow.services.database.models import Flow, Folder, User
 from langflow.services.deps import get_db_service, get_settings_service, get_storage_service
@@ -136,14 +136,23 @@ class ProjectMCPServer:
                 db_service = get_db_service()
                 async with db_service.with_session() as session:
                     # Get flows with mcp_enabled flag set to True and in this project
-                    flows = (
-                        await session.exec(
-                            select(Flow).where(Flow.mcp_enabled == True, Flow.folder_id == self.project_id)  # noqa: E712
-                        )
-                    ).all()
+                    stmt = select(
+                        Flow.id,
+                        Flow.name,
+                        Flow.description,
+                        Flow.action_name,
+                        Flow.action_description,
+                        Flow.updated_at,
+                    ).where(
+                        Flow.mcp_enabled == True,  # noqa: E712
+                        Flow.folder_id == self.project_id,
+                        col(Flow.user_id).is_not(None),
+                    )
+                    flows = (await session.exec(stmt)).all()
+                    schemas = await aget_flow_input_schemas(session, flows)
 
                     for flow in flows:
-                        if flow.user_id is None:
+                        if flow.id not in schemas:
                             continue
 
                         # Use action_name if available, otherwise construct from flow name
@@ -157,7 +166,7 @@ class ProjectMCPServer:
                         tool = types.Tool(
                             name=name,
                             description=description,
-                            inputSchema=json_schema_from_flow(flow),
+                            inputSchema=schemas[flow.id],
                         )
                         tools.append(tool)
             except Exception as e:  # noqa: BLE001
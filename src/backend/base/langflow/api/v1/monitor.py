@@ -8,8 +8,11 @@ from sqlalchemy import delete
 from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
+from langflow.memory import get_session_history_cache
+from langflow.processing.graph_cache import get_compiled_graph_cache
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
+from langflow.services.database.models.message.crud import get_messages_query
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -18,6 +21,12 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import (
+    get_build_log_service,
+    get_queue_service,
+    get_telemetry_service,
+    get_tracing_service,
+)
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -25,6 +34,7 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
     try:
+        await get_build_log_service().flush()
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -34,12 +44,37 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        get_build_log_service().discard(flow_id)
         await delete_vertex_builds_by_flow_id(session, flow_id)
         await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/graph_cache", dependencies=[Depends(get_current_active_user)])
+async def get_graph_cache_stats() -> dict:
+    """Returns the hit, miss and build time counters of the run endpoints graph cache."""
+    return get_compiled_graph_cache().stats()
+
+
+@router.get("/tracing", dependencies=[Depends(get_current_active_user)])
+async def get_tracing_stats() -> dict:
+    """Returns the exported, failed and dropped trace counters of each tracer."""
+    return get_tracing_service().export_stats()
+
+
+@router.get("/job_queues", dependencies=[Depends(get_current_active_user)])
+async def get_job_queue_stats() -> dict:
+    """Returns the depth and memory gauges of the event queue of each build job."""
+    return get_queue_service().get_queue_stats()
+
+
+@router.get("/telemetry", dependencies=[Depends(get_current_active_user)])
+async def get_telemetry_stats() -> dict:
+    """Returns the queued, sent, failed and dropped telemetry event counters."""
+    return get_telemetry_service().stats()
+
+
 @router.get("/messages")
 async def get_messages(
     session: DbSession,
@@ -48,20 +83,20 @@ async def get_messages(
     sender: Annotated[str | None, Query()] = None,
     sender_name: Annotated[str | None, Query()] = None,
     order_by: Annotated[str | None, Query()] = "timestamp",
+    limit: Annotated[int | None, Query(gt=0)] = None,
+    after: Annotated[UUID | None, Query()] = None,
 ) -> list[MessageResponse]:
     try:
-        stmt = select(MessageTable)
-        if flow_id:
-            stmt = stmt.where(MessageTable.flow_id == flow_id)
-        if session_id:
-            stmt = stmt.where(MessageTable.session_id == session_id)
-        if sender:
-            stmt = stmt.where(MessageTable.sender == sender)
-        if sender_name:
-            stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if order_by:
-            col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
+        stmt = get_messages_query(
+            flow_id=flow_id,
+            session_id=session_id,
+            sender=sender,
+            sender_name=sender_name,
+            order_by=order_by,
+            order="ASC",
+            limit=limit,
+            after=after,
+        )
         messages = await session.exec(stmt)
         return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
     except Exception as e:
@@ -73,6 +108,7 @@ async def delete_messages(message_ids: list[UUID], session: DbSession) -> None:
     try:
         await session.exec(delete(MessageTable).where(MessageTable.id.in_(message_ids)))  # type: ignore[attr-defined]
         await session.commit()
+        get_session_history_cache().discard_messages(message_ids)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -101,6 +137,7 @@ async def update_message(
         await session.refresh(db_message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    get_session_history_cache().update([MessageRead.model_validate(db_message, from_attributes=True).model_dump()])
     return db_message
 
 
@@ -138,6 +175,8 @@ async def update_session_id(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    get_session_history_cache().invalidate_session(old_session_id)
+    get_session_history_cache().invalidate_session(new_session_id)
     return message_responses
 
 
@@ -156,6 +195,7 @@ async def delete_messages_session(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    get_session_history_cache().invalidate_session(session_id)
     return {"message": "Messages deleted successfully"}
 
 
@@ -166,6 +206,7 @@ async def get_transactions(
     params: Annotated[Params | None, Depends(custom_params)],
 ) -> Page[TransactionTable]:
     try:
+        await get_build_log_service().flush()
         stmt = (
             select(TransactionTable)
             .where(TransactionTable.flow_id == flow_id)
@@ -15,6 +15,7 @@ from langflow.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from langflow.services.database.models.api_key.crud import get_api_key_cache
 from langflow.services.database.models.user import User, UserCreate, UserRead, UserUpdate
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
 from langflow.services.deps import get_settings_service
@@ -142,5 +143,6 @@ async def delete_user(
 
     await session.delete(user_db)
     await session.commit()
+    get_api_key_cache().invalidate_user(user_id)
 
     return {"detail": "User deleted"}
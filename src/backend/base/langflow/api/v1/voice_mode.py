@@ -6,7 +6,6 @@ import time
 import traceback
 import uuid
 from collections import defaultdict
-from datetime import datetime, timezone
 from functools import partial
 from typing import Any
 from uuid import UUID, uuid4
@@ -14,7 +13,6 @@ from uuid import UUID, uuid4
 import numpy as np
 import requests
 import sqlalchemy
-import webrtcvad
 import websockets
 from cryptography.fernet import InvalidToken
 from elevenlabs import ElevenLabs
@@ -33,11 +31,7 @@ from langflow.services.auth.utils import get_current_user_for_websocket
 from langflow.services.database.models import MessageTable, User
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_variable_service, session_scope
-from langflow.utils.voice_utils import (
-    BYTES_PER_24K_FRAME,
-    VAD_SAMPLE_RATE_16K,
-    resample_24k_to_16k,
-)
+from langflow.utils.voice_utils import VoiceActivityPipeline
 
 router = APIRouter(prefix="/voice", tags=["Voice"])
 
@@ -717,7 +711,6 @@ async def flow_as_tool_websocket(
 
         log_event = create_event_logger()
 
-        vad_task: asyncio.Task | None = None
         voice_config = get_voice_config(session_id)
         current_user: User = await get_current_user_for_websocket(client_websocket, session)
         current_user, openai_key = await authenticate_and_get_openai_key(session, current_user, client_websocket)
@@ -761,41 +754,13 @@ async def flow_as_tool_websocket(
             msg_handler.openai_send(session_update)
 
             # Setup for VAD processing.
-            vad_queue: asyncio.Queue = asyncio.Queue()
-            vad_audio_buffer = bytearray()
+            vad_pipeline: VoiceActivityPipeline | None = None
             bot_speaking_flag = [False]
-            vad = webrtcvad.Vad(mode=3)
-
-            async def process_vad_audio() -> None:
-                nonlocal vad_audio_buffer
-                last_speech_time = datetime.now(tz=timezone.utc)
-                while True:
-                    base64_data = await vad_queue.get()
-                    raw_chunk_24k = base64.b64decode(base64_data)
-                    vad_audio_buffer.extend(raw_chunk_24k)
-                    has_speech = False
-                    while len(vad_audio_buffer) >= BYTES_PER_24K_FRAME:
-                        frame_24k = vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        del vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        try:
-                            frame_16k = resample_24k_to_16k(frame_24k)
-                            is_speech = vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K)
-                            if is_speech:
-                                has_speech = True
-                                logger.trace("!", end="")
-                                if bot_speaking_flag[0]:
-                                    msg_handler.openai_send({"type": "response.cancel"})
-                                    bot_speaking_flag[0] = False
-                        except Exception as e:  # noqa: BLE001
-                            logger.error(f"[ERROR] VAD processing failed (ValueError): {e}")
-                            continue
-                    if has_speech:
-                        last_speech_time = datetime.now(tz=timezone.utc)
-                        logger.trace(".", end="")
-                    else:
-                        time_since_speech = (datetime.now(tz=timezone.utc) - last_speech_time).total_seconds()
-                        if time_since_speech >= 1.0:
-                            logger.trace("_", end="")
+
+            def on_speech() -> None:
+                if bot_speaking_flag[0]:
+                    msg_handler.openai_send({"type": "response.cancel"})
+                    bot_speaking_flag[0] = False
 
             def client_send_event_from_thread(event, loop) -> None:
                 return loop.call_soon_threadsafe(msg_handler.client_send, event)
@@ -932,8 +897,8 @@ async def flow_as_tool_websocket(
                             num_audio_samples += len(base64_data)
                             event = {"type": "input_audio_buffer.append", "audio": base64_data}
                             msg_handler.openai_send(event)
-                            if voice_config.barge_in_enabled:
-                                await vad_queue.put(base64_data)
+                            if vad_pipeline is not None:
+                                vad_pipeline.feed(base64_data)
                         elif msg.get("type") == "response.create":
                             create_response(msg)
                         elif msg.get("type") == "input_audio_buffer.commit":
@@ -1080,8 +1045,7 @@ async def flow_as_tool_websocket(
                     pass
 
             if voice_config.barge_in_enabled:
-                # Store the task reference to prevent it from being garbage collected
-                vad_task = asyncio.create_task(process_vad_audio())
+                vad_pipeline = VoiceActivityPipeline(on_speech, loop=asyncio.get_running_loop())
 
             try:
                 # Use gather with return_exceptions to collect any exceptions
@@ -1104,14 +1068,13 @@ async def flow_as_tool_websocket(
                     await client_websocket.close()
                     await openai_ws.close()
 
+                if vad_pipeline is not None:
+                    await asyncio.to_thread(vad_pipeline.close, 5)
+                    logger.info(f"VAD stats for voice session {session_id}: {vad_pipeline.stats()}")
                 await close()
     except Exception as e:  # noqa: BLE001
         logger.error(f"Unexpected error: {e}")
         logger.error(traceback.format_exc())
-    finally:
-        # Make sure to clean up the task
-        if vad_task and not vad_task.done():
-            vad_task.cancel()
 
 
 @router.websocket("/ws/flow_tts/{flow_id}")
@@ -1,7 +1,12 @@
 import asyncio
+import contextlib
+import hashlib
+import json
 import os
-from collections.abc import Awaitable, Callable
-from contextlib import AsyncExitStack
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Any
 from urllib.parse import urlparse
 from uuid import UUID
@@ -350,3 +355,280 @@ class MCPSseClient:
 
         msg = f"Failed to connect after {self.max_retries} attempts. Last error: {last_error}"
         raise ConnectionError(msg)
+
+
+def _options_digest(options: list[str] | dict[str, str] | None) -> str:
+    """Hashes the env vars or headers of a connection, so that secrets are not kept in the pool keys."""
+    return hashlib.sha256(json.dumps(options or [], sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class PooledMCPSession:
+    """An MCP client session shared by every component connecting to the same server.
+
+    The transports of the MCP SDK must be exited by the task that entered them, so the connection is
+    opened and closed by a dedicated task that outlives the builds using it. Concurrent calls are
+    multiplexed over the same session.
+    """
+
+    def __init__(self, key: tuple, client: MCPStdioClient | MCPSseClient, connect_args: tuple) -> None:
+        self.key = key
+        self.client = client
+        self.loop = asyncio.get_running_loop()
+        self.in_flight = 0
+        self.last_used = self.last_checked = time.monotonic()
+        self._connect_args = connect_args
+        self._tools: list | None = None
+        self._tools_listed_at = 0.0
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.leases: weakref.WeakSet[MCPSessionLease] = weakref.WeakSet()
+
+    @property
+    def session(self) -> ClientSession | None:
+        return self.client.session
+
+    @property
+    def in_use(self) -> bool:
+        return bool(self.in_flight or self.leases)
+
+    @property
+    def is_alive(self) -> bool:
+        return self._task is not None and not self._task.done() and self.session is not None
+
+    async def start(self) -> None:
+        ready = self.loop.create_future()
+        self._task = asyncio.create_task(self._run(ready), name=f"mcp-session-{self.key[1]}")
+        await ready
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        try:
+            tools = await self.client.connect_to_server(*self._connect_args)
+            self._set_tools(tools)
+            ready.set_result(None)
+            await self._closing.wait()
+        except Exception as e:  # noqa: BLE001
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.debug(f"MCP session to {self.key[1]} failed: {e!s}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+            try:
+                await self.client.exit_stack.aclose()
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"Error closing MCP session to {self.key[1]}: {e!s}")
+            self.client.session = None
+
+    def _set_tools(self, tools: list) -> None:
+        self._tools = tools
+        self._tools_listed_at = time.monotonic()
+
+    @asynccontextmanager
+    async def use(self) -> AsyncIterator[ClientSession]:
+        if self.session is None:
+            msg = f"MCP session to {self.key[1]} is closed"
+            raise ConnectionError(msg)
+        self.in_flight += 1
+        try:
+            yield self.session
+        finally:
+            self.in_flight -= 1
+            self.last_used = time.monotonic()
+
+    async def list_tools(self, ttl: float = 0) -> list:
+        """Returns the tools of the server, listing them again once they are older than `ttl` seconds."""
+        if self._tools is not None and time.monotonic() - self._tools_listed_at < ttl:
+            return self._tools
+        async with self.use() as session:
+            response = await session.list_tools()
+        self._set_tools(response.tools)
+        return response.tools
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None):
+        async with self.use() as session:
+            return await session.call_tool(tool_name, arguments=arguments)
+
+    async def ping(self, timeout: float) -> bool:
+        if not self.is_alive:
+            return False
+        try:
+            async with self.use() as session:
+                await asyncio.wait_for(session.send_ping(), timeout=timeout)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"MCP session to {self.key[1]} did not answer the ping: {e!s}")
+            return False
+        self.last_checked = time.monotonic()
+        return True
+
+    async def aclose(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            await asyncio.wait([self._task])
+
+
+class MCPSessionLease:
+    """A hold on a pooled MCP session, which is not closed for being idle while a lease on it exists.
+
+    Components get leases from the pool and hand them to the tools they build, so the session lives as
+    long as the tools do. If the session was closed anyway, e.g. because the server stopped answering,
+    the lease moves to a new session of the pool.
+    """
+
+    def __init__(self, pool: "MCPSessionPool", pooled: PooledMCPSession) -> None:
+        self._pool = pool
+        self.pooled = pooled
+        pooled.leases.add(self)
+
+    @property
+    def session(self) -> ClientSession | None:
+        return self.pooled.session
+
+    async def _get_pooled(self) -> PooledMCPSession:
+        pooled = self.pooled
+        if not pooled.is_alive:
+            self.pooled = await self._pool._get_session(pooled.key, type(pooled.client), pooled._connect_args)
+            pooled.leases.discard(self)
+            self.pooled.leases.add(self)
+        return self.pooled
+
+    async def list_tools(self, ttl: float = 0) -> list:
+        return await (await self._get_pooled()).list_tools(ttl=ttl)
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None):
+        return await (await self._get_pooled()).call_tool(tool_name, arguments=arguments)
+
+
+class MCPSessionPool:
+    """The MCP client sessions of the process, keyed by event loop, server and connection options.
+
+    A session that was not used for `health_check_interval` seconds is pinged before it is handed out
+    and reconnected if it does not answer. Once `start` is called, sessions without leases that were
+    unused for `idle_timeout` seconds are closed in the background.
+    """
+
+    def __init__(
+        self, idle_timeout: float = 300.0, health_check_interval: float = 30.0, tools_ttl: float = 60.0
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.tools_ttl = tools_ttl
+        self._sessions: dict[tuple, PooledMCPSession] = {}
+        self._locks: dict[tuple, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._reaper: asyncio.Task | None = None
+
+    async def get_stdio_session(self, command: str, env: list[str] | None = None) -> MCPSessionLease:
+        key = ("Stdio", command, _options_digest(env))
+        return MCPSessionLease(self, await self._get_session(key, MCPStdioClient, (command, env)))
+
+    async def get_sse_session(self, url: str, headers: dict[str, str] | None = None) -> MCPSessionLease:
+        key = ("SSE", url, _options_digest(headers))
+        return MCPSessionLease(self, await self._get_session(key, MCPSseClient, (url, headers)))
+
+    def start(self) -> None:
+        """Starts closing the idle sessions of the running event loop in the background."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap(), name="mcp-session-reaper")
+
+    async def _reap(self) -> None:
+        interval = max(min(self.idle_timeout / 2, 60.0), 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"Error closing idle MCP sessions: {e!s}")
+
+    async def _get_session(
+        self, key: tuple, client_class: type[MCPStdioClient | MCPSseClient], connect_args: tuple
+    ) -> PooledMCPSession:
+        loop = asyncio.get_running_loop()
+        key = (id(loop), *key)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            pooled = self._sessions.get(key)
+            if pooled is not None and pooled.loop is loop and await self._is_healthy(pooled):
+                self.hits += 1
+                return pooled
+            if pooled is not None:
+                logger.debug(f"Reconnecting the MCP session to {key[2]}")
+                await self._discard(key)
+            self.misses += 1
+            pooled = PooledMCPSession(key[1:], client_class(), connect_args)
+            await pooled.start()
+            self._sessions[key] = pooled
+            return pooled
+
+    async def _is_healthy(self, pooled: PooledMCPSession) -> bool:
+        if not pooled.is_alive:
+            return False
+        idle_for = time.monotonic() - max(pooled.last_used, pooled.last_checked)
+        if pooled.in_flight or idle_for < self.health_check_interval:
+            return True
+        return await pooled.ping(timeout=min(self.health_check_interval, 5.0))
+
+    async def _discard(self, key: tuple) -> None:
+        pooled = self._sessions.pop(key, None)
+        if pooled is None:
+            return
+        # Sessions of a closed loop died with it and can't be closed from here
+        if pooled.loop is asyncio.get_running_loop():
+            await pooled.aclose()
+
+    async def evict_idle(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        for key, pooled in list(self._sessions.items()):
+            if pooled.loop.is_closed():
+                del self._sessions[key]
+                continue
+            if pooled.loop is not loop or pooled.in_use or now - pooled.last_used < self.idle_timeout:
+                continue
+            lock = self._locks.setdefault(key, asyncio.Lock())
+            if lock.locked():
+                # The session is being handed out
+                continue
+            async with lock:
+                if self._sessions.get(key) is pooled and not pooled.in_use:
+                    self.evictions += 1
+                    await self._discard(key)
+
+    async def close_all(self) -> None:
+        """Stops closing idle sessions in the background and closes every session of the running loop."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        loop = asyncio.get_running_loop()
+        for key, pooled in list(self._sessions.items()):
+            if pooled.loop is loop or pooled.loop.is_closed():
+                await self._discard(key)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "sessions": len(self._sessions),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_mcp_session_pool: MCPSessionPool | None = None
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Returns the process-wide MCP session pool, configured from the settings."""
+    global _mcp_session_pool  # noqa: PLW0603
+    if _mcp_session_pool is None:
+        from langflow.services.deps import get_settings_service
+
+        settings = get_settings_service().settings
+        _mcp_session_pool = MCPSessionPool(
+            idle_timeout=settings.mcp_session_idle_timeout,
+            health_check_interval=settings.mcp_session_health_check_interval,
+            tools_ttl=settings.mcp_tools_cache_ttl,
+        )
+    return _mcp_session_pool
@@ -29,6 +29,7 @@ from langflow.io import (
 from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.dotdict import dotdict
+from langflow.services.deps import get_http_client_service
 
 
 class APIRequestComponent(Component):
@@ -527,23 +528,24 @@ class APIRequestComponent(Component):
 
         urls = [self.add_query_params(url, query_params) for url in urls]
 
-        async with httpx.AsyncClient() as client:
-            results = await asyncio.gather(
-                *[
-                    self.make_request(
-                        client,
-                        method,
-                        u,
-                        headers,
-                        rec,
-                        timeout,
-                        follow_redirects=follow_redirects,
-                        save_to_file=save_to_file,
-                        include_httpx_metadata=include_httpx_metadata,
-                    )
-                    for u, rec in zip(urls, bodies, strict=False)
-                ]
-            )
+        # The shared client keeps connections alive across builds, it must not be closed here
+        client = get_http_client_service().get_client()
+        results = await asyncio.gather(
+            *[
+                self.make_request(
+                    client,
+                    method,
+                    u,
+                    headers,
+                    rec,
+                    timeout,
+                    follow_redirects=follow_redirects,
+                    save_to_file=save_to_file,
+                    include_httpx_metadata=include_httpx_metadata,
+                )
+                for u, rec in zip(urls, bodies, strict=False)
+            ]
+        )
         self.status = results
         return results
 
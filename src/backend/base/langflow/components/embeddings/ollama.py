@@ -8,6 +8,7 @@ from langflow.base.models.model import LCModelComponent
 from langflow.base.models.ollama_constants import OLLAMA_EMBEDDING_MODELS, URL_LIST
 from langflow.field_typing import Embeddings
 from langflow.io import DropdownInput, MessageTextInput, Output
+from langflow.services.deps import get_http_client_service
 
 HTTP_STATUS_OK = 200
 
@@ -77,10 +78,10 @@ class OllamaEmbeddingsComponent(LCModelComponent):
         model_ids = []
         try:
             url = urljoin(base_url_value, "/api/tags")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client_service().get_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            data = response.json()
 
             model_ids = [model["name"] for model in data.get("models", [])]
             # this to ensure that not embedding models are included.
@@ -100,7 +101,7 @@ class OllamaEmbeddingsComponent(LCModelComponent):
 
     async def is_valid_ollama_url(self, url: str) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                return (await client.get(f"{url}/api/tags")).status_code == HTTP_STATUS_OK
+            client = get_http_client_service().get_client()
+            return (await client.get(f"{url}/api/tags")).status_code == HTTP_STATUS_OK
         except httpx.RequestError:
             return False
@@ -19,6 +19,7 @@ from langflow.io import (
 )
 from langflow.schema import Data
 from langflow.schema.dotdict import dotdict
+from langflow.services.deps import get_http_client_service
 
 
 class LangWatchComponent(Component):
@@ -271,8 +272,8 @@ class LangWatchComponent(Component):
             for setting_name in self.dynamic_inputs:
                 payload["settings"][setting_name] = getattr(self, setting_name, None)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, json=payload, headers=headers)
+            client = get_http_client_service().get_client()
+            response = await client.post(url, json=payload, headers=headers, timeout=self.timeout)
 
             response.raise_for_status()
             result = response.json()
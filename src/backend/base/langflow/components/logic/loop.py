@@ -1,6 +1,10 @@
+import asyncio
+from copy import deepcopy
+
 from langflow.custom import Component
-from langflow.io import DataInput, Output
+from langflow.io import BoolInput, DataInput, IntInput, Output
 from langflow.schema import Data
+from langflow.services.deps import get_settings_service
 
 
 class LoopComponent(Component):
@@ -16,6 +20,21 @@ class LoopComponent(Component):
             display_name="Data",
             info="The initial list of Data objects to iterate over.",
         ),
+        BoolInput(
+            name="parallel",
+            display_name="Parallel",
+            info="Run the loop body for several items at the same time instead of one item after the other. "
+            "Each item runs in an isolated copy of the loop body and the results keep the order of the items.",
+            value=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of items processed at the same time in parallel mode.",
+            value=4,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -61,7 +80,8 @@ class LoopComponent(Component):
         self.initialize_data()
         current_item = Data(text="")
 
-        if self.evaluate_stop_loop():
+        # In parallel mode the loop body is run by done_output, one isolated copy per item
+        if self.parallel or self.evaluate_stop_loop():
             self.stop("item")
             return Data(text="")
 
@@ -77,10 +97,14 @@ class LoopComponent(Component):
         self.update_ctx({f"{self._id}_index": current_index + 1})
         return current_item
 
-    def done_output(self) -> Data:
+    async def done_output(self) -> Data:
         """Trigger the done output when iteration is complete."""
         self.initialize_data()
 
+        if self.parallel:
+            self.stop("item")
+            return await self.parallel_output()
+
         if self.evaluate_stop_loop():
             self.stop("item")
             self.start("done")
@@ -109,3 +133,93 @@ class LoopComponent(Component):
             aggregated.append(self.item)
             self.update_ctx({f"{self._id}_aggregated": aggregated})
         return aggregated
+
+    async def parallel_output(self) -> list[Data]:
+        """Run the loop body for every item concurrently and return the results in item order."""
+        data_list = self.ctx.get(f"{self._id}_data", [])
+        body_ids, entries, tails, injected = self._loop_body()
+        if not tails:
+            msg = "Parallel mode requires the end of the loop body to be connected back to the Item output."
+            raise ValueError(msg)
+        payload = {
+            "nodes": [self.graph.get_vertex(vertex_id).to_data() for vertex_id in body_ids],
+            "edges": [
+                edge.to_data() for edge in self.graph.edges if edge.source_id in body_ids and edge.target_id in body_ids
+            ],
+        }
+        fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency or 1))
+
+        async def run_item(item: Data) -> Data:
+            async with semaphore:
+                # Building the components evaluates their code, keep it off the event loop
+                graph = await asyncio.to_thread(
+                    type(self.graph).from_payload,
+                    deepcopy(payload),
+                    flow_id=self.graph.flow_id,
+                    flow_name=self.graph.flow_name,
+                    user_id=self.graph.user_id,
+                )
+                graph.session_id = self.graph.session_id
+                for vertex_id, params in injected.items():
+                    graph.get_vertex(vertex_id).update_raw_params(dict(params), overwrite=True)
+                for vertex_id, field_name in entries:
+                    vertex = graph.get_vertex(vertex_id)
+                    value = [item] if vertex.data["node"]["template"][field_name].get("list") else item
+                    vertex.update_raw_params({field_name: value}, overwrite=True)
+                await graph.process(fallback_to_env_vars=fallback_to_env_vars)
+                # Only the first tail is aggregated, as in the sequential mode where the last value set wins
+                vertex_id, output_name = tails[0]
+                return graph.get_vertex(vertex_id).results.get(output_name)
+
+        aggregated = await asyncio.gather(*(run_item(item) for item in data_list))
+        self.update_ctx({f"{self._id}_aggregated": aggregated, f"{self._id}_index": len(data_list) + 1})
+        return aggregated
+
+    def _loop_body(self) -> tuple[set[str], list[tuple[str, str]], list[tuple[str, str]], dict[str, dict]]:
+        """Find the vertices of the loop body and how they connect to the loop.
+
+        Returns the ids of the body vertices (including the not yet built vertices they depend on), the
+        (vertex id, field name) pairs fed by the Item output, the (vertex id, output name) pairs connected back
+        to the loop and the values of already built vertices that feed the body, by target vertex and field.
+        """
+        loop_id = self._vertex.id
+        edges = self.graph.edges
+        entries = [
+            (edge.target_id, edge.target_handle.field_name)
+            for edge in edges
+            if edge.source_id == loop_id and edge.source_handle.name == "item"
+        ]
+        tails = [
+            (edge.source_id, edge.source_handle.name)
+            for edge in edges
+            if edge.target_id == loop_id and edge.target_handle.field_name == "item"
+        ]
+
+        body_ids: set[str] = set()
+        stack = [target_id for target_id, _ in entries]
+        while stack:
+            vertex_id = stack.pop()
+            if vertex_id == loop_id or vertex_id in body_ids:
+                continue
+            body_ids.add(vertex_id)
+            stack.extend(self.graph.successor_map.get(vertex_id, []))
+
+        # Vertices outside of the loop feeding the body are either reused or built again for each item
+        injected: dict[str, dict] = {}
+        stack = list(body_ids)
+        while stack:
+            vertex_id = stack.pop()
+            for edge in edges:
+                if edge.target_id != vertex_id or edge.source_id in body_ids:
+                    continue
+                source = self.graph.get_vertex(edge.source_id)
+                if edge.source_id == loop_id or source.built:
+                    if edge.source_id != loop_id:
+                        injected.setdefault(vertex_id, {})[edge.target_handle.field_name] = source.results.get(
+                            edge.source_handle.name
+                        )
+                    continue
+                body_ids.add(edge.source_id)
+                stack.append(edge.source_id)
+        return body_ids, entries, tails, injected
@@ -1,7 +1,6 @@
 from typing import Any
 from urllib.parse import urljoin
 
-import httpx
 from langchain_openai import ChatOpenAI
 from typing_extensions import override
 
@@ -9,6 +8,7 @@ from langflow.base.models.model import LCModelComponent
 from langflow.field_typing import LanguageModel
 from langflow.field_typing.range_spec import RangeSpec
 from langflow.inputs import DictInput, DropdownInput, FloatInput, IntInput, SecretStrInput, StrInput
+from langflow.services.deps import get_http_client_service
 
 
 class LMStudioModelComponent(LCModelComponent):
@@ -35,12 +35,12 @@ class LMStudioModelComponent(LCModelComponent):
     async def get_model(base_url_value: str) -> list[str]:
         try:
             url = urljoin(base_url_value, "/v1/models")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client_service().get_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            data = response.json()
 
-                return [model["id"] for model in data.get("data", [])]
+            return [model["id"] for model in data.get("data", [])]
         except Exception as e:
             msg = "Could not retrieve models. Please, make sure the LM Studio server is running."
             raise ValueError(msg) from e
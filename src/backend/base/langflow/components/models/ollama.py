@@ -10,6 +10,7 @@ from langflow.field_typing import LanguageModel
 from langflow.field_typing.range_spec import RangeSpec
 from langflow.io import BoolInput, DictInput, DropdownInput, FloatInput, IntInput, MessageTextInput, SliderInput
 from langflow.logging import logger
+from langflow.services.deps import get_http_client_service
 
 HTTP_STATUS_OK = 200
 
@@ -195,8 +196,8 @@ class ChatOllamaComponent(LCModelComponent):
 
     async def is_valid_ollama_url(self, url: str) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                return (await client.get(urljoin(url, "api/tags"))).status_code == HTTP_STATUS_OK
+            client = get_http_client_service().get_client()
+            return (await client.get(urljoin(url, "api/tags"))).status_code == HTTP_STATUS_OK
         except httpx.RequestError:
             return False
 
@@ -282,28 +283,28 @@ class ChatOllamaComponent(LCModelComponent):
             # Ollama REST API to return model capabilities
             show_url = urljoin(base_url, "api/show")
 
-            async with httpx.AsyncClient() as client:
-                # Fetch available models
-                tags_response = await client.get(tags_url)
-                tags_response.raise_for_status()
-                models = await tags_response.json()
-                logger.debug(f"Available models: {models}")
-
-                # Filter models that are NOT embedding models
-                model_ids = []
-                for model in models[self.JSON_MODELS_KEY]:
-                    model_name = model[self.JSON_NAME_KEY]
-                    logger.debug(f"Checking model: {model_name}")
-
-                    payload = {"model": model_name}
-                    show_response = await client.post(show_url, json=payload)
-                    show_response.raise_for_status()
-                    json_data = await show_response.json()
-                    capabilities = json_data.get(self.JSON_CAPABILITIES_KEY, [])
-                    logger.debug(f"Model: {model_name}, Capabilities: {capabilities}")
-
-                    if self.DESIRED_CAPABILITY in capabilities:
-                        model_ids.append(model_name)
+            client = get_http_client_service().get_client()
+            # Fetch available models
+            tags_response = await client.get(tags_url)
+            tags_response.raise_for_status()
+            models = await tags_response.json()
+            logger.debug(f"Available models: {models}")
+
+            # Filter models that are NOT embedding models
+            model_ids = []
+            for model in models[self.JSON_MODELS_KEY]:
+                model_name = model[self.JSON_NAME_KEY]
+                logger.debug(f"Checking model: {model_name}")
+
+                payload = {"model": model_name}
+                show_response = await client.post(show_url, json=payload)
+                show_response.raise_for_status()
+                json_data = await show_response.json()
+                capabilities = json_data.get(self.JSON_CAPABILITIES_KEY, [])
+                logger.debug(f"Model: {model_name}, Capabilities: {capabilities}")
+
+                if self.DESIRED_CAPABILITY in capabilities:
+                    model_ids.append(model_name)
 
         except (httpx.RequestError, ValueError) as e:
             msg = "Could not get model names from Ollama."
@@ -4,11 +4,10 @@ from typing import Any
 from langchain_core.tools import StructuredTool
 
 from langflow.base.mcp.util import (
-    MCPSseClient,
-    MCPStdioClient,
     create_input_schema_from_json_schema,
     create_tool_coroutine,
     create_tool_func,
+    get_mcp_session_pool,
 )
 from langflow.custom import Component
 from langflow.inputs import DropdownInput, TableInput
@@ -59,8 +58,6 @@ def maybe_unflatten_dict(flat: dict[str, Any]) -> dict[str, Any]:
 
 class MCPToolsComponent(Component):
     schema_inputs: list[InputTypes] = []
-    stdio_client: MCPStdioClient = MCPStdioClient()
-    sse_client: MCPSseClient = MCPSseClient()
     tools: list = []
     tool_names: list[str] = []
     _tool_cache: dict = {}  # Cache for tool objects
@@ -446,12 +443,13 @@ class MCPToolsComponent(Component):
             headers = self._process_headers(headers)
             await self._validate_connection_params(mode, command, url)
 
+            # Sessions are shared with the other components connecting to the same server
+            pool = get_mcp_session_pool()
             if mode == "Stdio":
-                if not self.stdio_client.session:
-                    self.tools = await self.stdio_client.connect_to_server(command, env)
-            elif mode == "SSE" and not self.sse_client.session:
+                session = await pool.get_stdio_session(command, env)
+            else:
                 try:
-                    self.tools = await self.sse_client.connect_to_server(url, headers)
+                    session = await pool.get_sse_session(url, headers)
                 except ValueError as e:
                     # URL validation error
                     logger.error(f"SSE URL validation error: {e}")
@@ -472,6 +470,7 @@ class MCPToolsComponent(Component):
                     logger.error(f"Unexpected SSE error: {e}")
                     msg = f"Unexpected error connecting to SSE endpoint: {e}"
                     raise ValueError(msg) from e
+            self.tools = await session.list_tools(ttl=pool.tools_ttl)
 
             if not self.tools:
                 logger.warning("No tools returned from server")
@@ -489,17 +488,12 @@ class MCPToolsComponent(Component):
                         logger.warning(f"Empty schema for tool '{tool.name}', skipping")
                         continue
 
-                    client = self.stdio_client if self.mode == "Stdio" else self.sse_client
-                    if not client or not client.session:
-                        msg = f"Invalid client session for tool '{tool.name}'"
-                        raise ValueError(msg)
-
                     tool_obj = StructuredTool(
                         name=tool.name,
                         description=tool.description or "",
                         args_schema=args_schema,
-                        func=create_tool_func(tool.name, args_schema, client.session),
-                        coroutine=create_tool_coroutine(tool.name, args_schema, client.session),
+                        func=create_tool_func(tool.name, args_schema, session),
+                        coroutine=create_tool_coroutine(tool.name, args_schema, session),
                         tags=[tool.name],
                         metadata={},
                     )
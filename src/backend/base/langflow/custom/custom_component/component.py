@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import hashlib
 import inspect
 from collections.abc import AsyncIterator, Iterator
 from copy import deepcopy
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, cast, get_type_hints
 from uuid import UUID
 
 import nanoid
@@ -28,6 +29,7 @@ from langflow.graph.state.model import create_state_model
 from langflow.graph.utils import has_chat_output
 from langflow.helpers.custom import format_type
 from langflow.memory import astore_message, aupdate_messages, delete_message
+from langflow.processing.result_cache import fingerprint_value, get_component_result_cache
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
@@ -95,6 +97,8 @@ class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
+    cacheable: ClassVar[bool] = False
+    """Whether the outputs only depend on the code and the inputs, so results can be reused across runs."""
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -295,6 +299,13 @@ class Component(CustomComponent):
         memo[id(self)] = new_component
         return new_component
 
+    def copy_for_vertex(self, vertex: Vertex, user_id: str | UUID | None = None) -> Component:
+        new_component = cast("Component", super().copy_for_vertex(vertex, user_id))
+        # Inputs and outputs hold the values of a run
+        new_component._inputs = {name: input_.model_copy() for name, input_ in self._inputs.items()}
+        new_component._outputs_map = {name: output.model_copy() for name, output in self._outputs_map.items()}
+        return new_component
+
     def set_class_code(self) -> None:
         # Get the source code of the calling class
         if self._code:
@@ -942,13 +953,84 @@ class Component(CustomComponent):
         self._pre_run_setup_if_needed()
         self._handle_tool_mode()
 
-        for output in self._get_outputs_to_process():
+        outputs = list(self._get_outputs_to_process())
+        cache_key = self._get_result_cache_key(outputs)
+        if cache_key is not None and (cached := get_component_result_cache().get(cache_key)) is not None:
+            return self._restore_cached_results(cached)
+
+        for output in outputs:
             self._current_output = output.name
             result = await self._get_output_result(output)
             results[output.name] = result
             artifacts[output.name] = self._build_artifact(result)
             self._log_output(output)
 
+        self._finalize_results(results, artifacts)
+        if cache_key is not None:
+            get_component_result_cache().set(
+                cache_key, {"results": results, "artifacts": artifacts, "status": self.status}
+            )
+        return results, artifacts
+
+    def get_result_fingerprint(self, _seen: set[str] | None = None) -> str | None:
+        """Returns a hash of the component code and of everything it reads.
+
+        Inputs are addressed by their content when possible. Opaque inputs, such as a model or an
+        embeddings client, are addressed by the fingerprint of the upstream component that built
+        them. Returns None if an input can be addressed neither way.
+        """
+        seen = _seen if _seen is not None else set()
+        if self._id in seen:
+            # Components in a cycle see different inputs on every iteration
+            return None
+        seen.add(self._id)
+        upstream_fingerprints: dict[str, str] | None = None
+        hasher = hashlib.sha256()
+        hasher.update(f"{self.__class__.__name__}\n{self._code or ''}".encode())
+        for name in sorted(self._inputs):
+            fingerprint = fingerprint_value(self._attributes.get(name))
+            if fingerprint is None:
+                if upstream_fingerprints is None:
+                    upstream_fingerprints = self._get_upstream_fingerprints(seen)
+                fingerprint = upstream_fingerprints.get(name)
+            if fingerprint is None:
+                return None
+            hasher.update(f"\n{name}={fingerprint}".encode())
+        return hasher.hexdigest()
+
+    def _get_upstream_fingerprints(self, seen: set[str]) -> dict[str, str]:
+        if self._vertex is None:
+            return {}
+        fingerprints: dict[str, list[str]] = {}
+        for edge in self._vertex.incoming_edges:
+            if edge.target_param is None:
+                continue
+            component = self._vertex.graph.get_vertex(edge.source_id).custom_component
+            fingerprint = component.get_result_fingerprint(seen) if isinstance(component, Component) else None
+            if fingerprint is None:
+                continue
+            output_name = edge.source_handle.name if edge.source_handle else ""
+            fingerprints.setdefault(edge.target_param, []).append(f"{fingerprint}:{output_name}")
+        return {name: ",".join(sorted(values)) for name, values in fingerprints.items()}
+
+    def _get_result_cache_key(self, outputs: list[Output]) -> str | None:
+        if not self.cacheable or not get_component_result_cache().enabled:
+            return None
+        output_names = sorted(output.name for output in outputs)
+        # Tools wrap this instance, they cannot be shared with other runs
+        if TOOL_OUTPUT_NAME in output_names:
+            return None
+        fingerprint = self.get_result_fingerprint()
+        if fingerprint is None:
+            return None
+        return f"{fingerprint}:{','.join(output_names)}"
+
+    def _restore_cached_results(self, cached: dict[str, Any]) -> tuple[dict, dict]:
+        results, artifacts = cached["results"], cached["artifacts"]
+        for name, result in results.items():
+            self._outputs_map[name].value = result
+            self._output_logs[name] = []
+        self.status = cached["status"]
         self._finalize_results(results, artifacts)
         return results, artifacts
 
@@ -1285,6 +1367,9 @@ class Component(CustomComponent):
                 and isinstance(message.text, AsyncIterator | Iterator)
             ):
                 complete_message = await self._stream_message(message.text, stored_message)
+                if self._event_manager:
+                    self._event_manager.flush_tokens()
+                    self._event_manager.log_token_stats()
                 stored_message.text = complete_message
                 stored_message = await self._update_stored_message(stored_message)
             else:
@@ -1393,13 +1478,13 @@ class Component(CustomComponent):
                 msg_copy = message.model_copy()
                 msg_copy.text = complete_message
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
+            data = {"chunk": chunk, "id": str(message_id)}
+            if self._event_manager.is_loop_safe("on_token"):
+                # Only enqueues the token, a thread hop per token would cost more than that
+                self._event_manager.on_token(data=data)
+            else:
+                await asyncio.to_thread(self._event_manager.on_token, data=data)
+            await self._event_manager.wait_for_capacity()
         return complete_message
 
     async def send_error(
@@ -107,6 +107,29 @@ class CustomComponent(BaseComponent):
         self._parameters = parameters
         self.set_attributes(self._parameters)
 
+    def copy_for_vertex(self, vertex: Vertex, user_id: str | uuid.UUID | None = None) -> CustomComponent:
+        """Returns a copy of the component for a vertex built from the same node.
+
+        `__init__` is skipped, since everything it computes only depends on the class and the node. The copy
+        gets its own containers, so that building one of the components does not change the other.
+
+        Args:
+            vertex: The vertex of the copy.
+            user_id: The ID of the user running the copy.
+        """
+        new_component = object.__new__(type(self))
+        new_component.__dict__.update(
+            {
+                key: value.copy() if isinstance(value, dict | list | set) else value
+                for key, value in self.__dict__.items()
+            }
+        )
+        new_component.__dict__["cache"] = TTLCache(maxsize=1024, ttl=60)
+        # Bypasses __setattr__, which refuses to change the user_id once it is set
+        new_component.__dict__["_user_id"] = user_id
+        new_component._vertex = vertex
+        return new_component
+
     @property
     def trace_name(self) -> str:
         if hasattr(self, "_id") and self._id is None:
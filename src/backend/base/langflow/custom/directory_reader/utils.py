@@ -1,4 +1,8 @@
 import asyncio
+import importlib
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 from loguru import logger
 
@@ -83,9 +87,14 @@ def build_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
-async def abuild_custom_component_list_from_path(path: str):
-    """Build a list of custom components for the langchain from a given path."""
+async def abuild_custom_component_list_from_path(path: str, *, max_workers: int = 0):
+    """Build a list of custom components for the langchain from a given path.
+
+    With `max_workers` above 0 the files are built in that many worker processes.
+    """
     file_list = await asyncio.to_thread(load_files_from_path, path)
+    if max_workers > 0 and len(file_list) > 1:
+        return merge_file_menus(await abuild_file_menus_in_processes(path, file_list, max_workers=max_workers))
     reader = DirectoryReader(path, compress_code_field=False)
 
     valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
@@ -96,6 +105,78 @@ async def abuild_custom_component_list_from_path(path: str):
     return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
 
 
+def build_file_menus(path: str, file_path: str) -> dict:
+    """Build the valid and invalid menus contributed by a single file.
+
+    This runs in worker processes, so it only takes and returns picklable values.
+    """
+    start = time.perf_counter()
+    reader = DirectoryReader(path, compress_code_field=False)
+    valid_components, invalid_components = build_and_validate_all_files(reader, [file_path])
+    return {
+        "valid": build_valid_menu(valid_components),
+        "invalid": build_invalid_menu(invalid_components),
+        "duration": time.perf_counter() - start,
+    }
+
+
+def build_file_menus_in_processes(path: str, file_paths: list[str], *, max_workers: int) -> list[dict]:
+    """Build the menus of each file in a pool of worker processes.
+
+    The menus are returned in the order of `file_paths`, whatever the order the workers finish in.
+    """
+    start = time.perf_counter()
+    # Forking a process that runs an event loop and other threads is unsafe. Spawned workers import
+    # langflow.custom first, importing this module first would be circular.
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=importlib.import_module,
+        initargs=("langflow.custom",),
+    ) as pool:
+        futures = [pool.submit(build_file_menus, path, file_path) for file_path in file_paths]
+        file_menus = []
+        for file_path, future in zip(file_paths, futures, strict=True):
+            try:
+                menus = future.result()
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).warning(f"Building {file_path} in a worker process failed, retrying")
+                menus = build_file_menus(path, file_path)
+            logger.debug(f"Built {file_path} in {menus['duration']:.2f}s")
+            file_menus.append(menus)
+    log_slowest_files(file_paths, file_menus)
+    logger.debug(f"Built {len(file_paths)} files with {max_workers} processes in {time.perf_counter() - start:.2f}s")
+    return file_menus
+
+
+async def abuild_file_menus_in_processes(path: str, file_paths: list[str], *, max_workers: int) -> list[dict]:
+    """Build the menus of each file in a pool of worker processes without blocking the event loop."""
+    return await asyncio.to_thread(build_file_menus_in_processes, path, file_paths, max_workers=max_workers)
+
+
+def log_slowest_files(file_paths: list[str], file_menus: list[dict], count: int = 5) -> None:
+    """Log the files that took the longest to build."""
+    durations = sorted(zip((menus["duration"] for menus in file_menus), file_paths, strict=True), reverse=True)[:count]
+    if durations:
+        slowest = ", ".join(f"{file_path} ({duration:.2f}s)" for duration, file_path in durations)
+        logger.info(f"Slowest component files: {slowest}")
+
+
+def merge_file_menus(file_menus: list[dict]) -> dict:
+    """Merge the menus built from single files into the menus of their directory.
+
+    The result is the same as building all the files together with `DirectoryReader`.
+    """
+    valid_menu: dict = {}
+    invalid_menu: dict = {}
+    for menus in file_menus:
+        for menu_name, items in menus["valid"].items():
+            valid_menu.setdefault(menu_name, {}).update(items)
+        for menu_name, items in menus["invalid"].items():
+            invalid_menu.setdefault(menu_name, {}).update(items)
+    return merge_nested_dicts_with_renaming(valid_menu, invalid_menu)
+
+
 def create_invalid_component_template(component, component_name):
     """Create a template for an invalid component."""
     component_code = component["code"]
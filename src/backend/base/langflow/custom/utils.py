@@ -485,8 +485,11 @@ def build_custom_components(components_paths: list[str]):
     return custom_components_from_file
 
 
-async def abuild_custom_components(components_paths: list[str]):
-    """Build custom components from the specified paths."""
+async def abuild_custom_components(components_paths: list[str], *, max_workers: int = 0):
+    """Build custom components from the specified paths.
+
+    With `max_workers` above 0 the component files are built in that many worker processes.
+    """
     if not components_paths:
         return {}
 
@@ -498,7 +501,7 @@ async def abuild_custom_components(components_paths: list[str]):
         if path_str in processed_paths:
             continue
 
-        custom_component_dict = await abuild_custom_component_list_from_path(path_str)
+        custom_component_dict = await abuild_custom_component_list_from_path(path_str, max_workers=max_workers)
         if custom_component_dict:
             category = next(iter(custom_component_dict))
             logger.info(f"Loading {len(custom_component_dict[category])} component(s) from category {category}")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
+import itertools
 import json
 import time
 import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from functools import partial
 from typing import TYPE_CHECKING, Literal
 
@@ -11,13 +15,14 @@ from fastapi.encoders import jsonable_encoder
 from loguru import logger
 from typing_extensions import Protocol
 
+from langflow.events.event_queue import EventQueue
 from langflow.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
+TOKEN_EVENT_KEYS = frozenset({"chunk", "id"})
+
 
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
@@ -27,10 +32,66 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+@dataclass
+class TokenFrame:
+    """Tokens of a message waiting to be sent together."""
+
+    message_id: str
+    chunks: list[str] = field(default_factory=list)
+    size: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class TokenStreamStats:
+    tokens: int = 0
+    frames: int = 0
+    bytes: int = 0
+    first_token_at: float | None = None
+    last_token_at: float | None = None
+    total_frame_latency: float = 0.0
+    max_frame_latency: float = 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        elapsed = (self.last_token_at or 0.0) - (self.first_token_at or 0.0)
+        return {
+            "tokens": self.tokens,
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "tokens_per_second": self.tokens / elapsed if elapsed > 0 else 0.0,
+            "avg_frame_latency": self.total_frame_latency / self.frames if self.frames else 0.0,
+            "max_frame_latency": self.max_frame_latency,
+        }
+
+
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _token_timestamp() -> str:
+    """Returns the timestamp of a token event, formatted once per second."""
+    global _timestamp_cache  # noqa: PLW0603
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        formatted = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+        _timestamp_cache = (now, formatted)
+    return _timestamp_cache[1]
+
+
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    def __init__(self, queue: asyncio.Queue, *, token_window: float = 0.0, token_window_bytes: int = 0):
+        """Creates an event manager that puts the encoded events in `queue`.
+
+        When `token_window` (in seconds) is set, the tokens of a message are sent in frames: a frame is
+        sent once it is `token_window` old or holds `token_window_bytes` bytes, whichever comes first.
+        """
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.token_window = token_window
+        self.token_window_bytes = token_window_bytes
+        self.token_stats = TokenStreamStats()
+        self._token_frames: dict[str, TokenFrame] = {}
+        self._token_event_ids = itertools.count()
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -65,7 +126,17 @@ class EventManager:
             callback_ = partial(callback, manager=self, event_type=event_type)
         self.events[name] = callback_
 
+    def is_loop_safe(self, name: str) -> bool:
+        """Whether the callback of the event only enqueues it and can be called on the event loop."""
+        callback = self.events.get(name)
+        return isinstance(callback, partial) and callback.func == self.send_event
+
     def send_event(self, *, event_type: Literal["message", "error", "warning", "info", "token"], data: LoggableType):
+        if event_type == "token" and isinstance(data, dict) and data.keys() == TOKEN_EVENT_KEYS:
+            self.send_token(str(data["chunk"]), str(data["id"]))
+            return
+        # Tokens of a message must reach the client before the events that follow them
+        self.flush_tokens()
         try:
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
                 data = create_event_by_type(event_type, **data)
@@ -79,6 +150,71 @@ class EventManager:
         str_data = json.dumps(json_data) + "\n\n"
         self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
 
+    async def wait_for_capacity(self) -> None:
+        """Waits for the consumer to catch up if the queue applies backpressure to producers."""
+        if isinstance(self.queue, EventQueue):
+            await self.queue.wait_for_capacity()
+
+    def send_token(self, chunk: str, message_id: str) -> None:
+        now = time.perf_counter()
+        stats = self.token_stats
+        stats.tokens += 1
+        if stats.first_token_at is None:
+            stats.first_token_at = now
+        stats.last_token_at = now
+        if self.token_window <= 0:
+            self._put_token_frame(chunk, message_id, now)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Frames are flushed by timers of the event loop
+            self._put_token_frame(chunk, message_id, now)
+            return
+        frame = self._token_frames.get(message_id)
+        if frame is None:
+            frame = self._token_frames[message_id] = TokenFrame(message_id=message_id, started_at=now)
+            frame.timer = loop.call_later(self.token_window, self._flush_token_frame, message_id)
+        frame.chunks.append(chunk)
+        frame.size += len(chunk)
+        if frame.size >= self.token_window_bytes > 0:
+            self._flush_token_frame(message_id)
+
+    def flush_tokens(self) -> None:
+        """Sends the tokens waiting in frames right away."""
+        for message_id in list(self._token_frames):
+            self._flush_token_frame(message_id)
+
+    def _flush_token_frame(self, message_id: str) -> None:
+        frame = self._token_frames.pop(message_id, None)
+        if frame is None:
+            return
+        if frame.timer is not None:
+            frame.timer.cancel()
+        self._put_token_frame("".join(frame.chunks), message_id, frame.started_at)
+
+    def _put_token_frame(self, chunk: str, message_id: str, started_at: float) -> None:
+        # Same payload as TokenEvent, without validating and encoding a model for every frame
+        payload = {"event": "token", "data": {"chunk": chunk, "id": message_id, "timestamp": _token_timestamp()}}
+        encoded = (json.dumps(payload) + "\n\n").encode("utf-8")
+        self.queue.put_nowait((f"token-{next(self._token_event_ids)}", encoded, time.time()))
+        latency = time.perf_counter() - started_at
+        stats = self.token_stats
+        stats.frames += 1
+        stats.bytes += len(encoded)
+        stats.total_frame_latency += latency
+        stats.max_frame_latency = max(stats.max_frame_latency, latency)
+
+    def log_token_stats(self) -> None:
+        if not self.token_stats.tokens:
+            return
+        stats = self.token_stats.as_dict()
+        logger.debug(
+            f"Streamed {stats['tokens']} tokens in {stats['frames']} frames "
+            f"({stats['tokens_per_second']:.1f} tokens/s, frame latency avg "
+            f"{stats['avg_frame_latency'] * 1000:.1f}ms, max {stats['max_frame_latency'] * 1000:.1f}ms)"
+        )
+
     def noop(self, *, data: LoggableType) -> None:
         pass
 
@@ -86,8 +222,18 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+def get_token_window_settings() -> dict[str, float | int]:
+    from langflow.services.deps import get_settings_service
+
+    settings = get_settings_service().settings
+    return {
+        "token_window": settings.stream_token_window_ms / 1000,
+        "token_window_bytes": settings.stream_token_window_bytes,
+    }
+
+
 def create_default_event_manager(queue):
-    manager = EventManager(queue)
+    manager = EventManager(queue, **get_token_window_settings())
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
@@ -101,7 +247,7 @@ def create_default_event_manager(queue):
 
 
 def create_stream_tokens_event_manager(queue):
-    manager = EventManager(queue)
+    manager = EventManager(queue, **get_token_window_settings())
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
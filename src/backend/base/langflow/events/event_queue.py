@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Literal
+
+from loguru import logger
+
+OverflowPolicy = Literal["block", "drop", "spill"]
+Event = tuple[str | None, bytes | None, float]
+
+_SPILL_HEADER = struct.Struct("!dII")
+
+
+def _merge_token_events(previous: Event, event: Event) -> Event | None:
+    """Returns a single token event holding the chunks of both, or None if they can't be merged."""
+    previous_id, previous_data, _ = previous
+    event_id, data, put_time = event
+    if not (previous_id or "").startswith("token-") or not (event_id or "").startswith("token-"):
+        return None
+    if previous_data is None or data is None:
+        return None
+    previous_payload = json.loads(previous_data)
+    payload = json.loads(data)
+    if previous_payload["data"]["id"] != payload["data"]["id"]:
+        return None
+    payload["data"]["chunk"] = previous_payload["data"]["chunk"] + payload["data"]["chunk"]
+    return previous_id, (json.dumps(payload) + "\n\n").encode("utf-8"), put_time
+
+
+class _SpillFile:
+    """A temporary file of spilled events.
+
+    The file is only touched by a dedicated thread, so producers and the consumer never block the
+    event loop on disk I/O. Writes and reads are run in the order they are submitted.
+    """
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="langflow-event-spill")
+        self._file: IO[bytes] | None = None
+        self._read_offset = 0
+        self._write_offset = 0
+
+    def write(self, item: Event) -> None:
+        self._executor.submit(self._write, item).add_done_callback(self._log_error)
+
+    async def aread(self, count: int) -> list[Event]:
+        """Reads the next `count` spilled events, once every event submitted before is written."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._read, count)
+
+    def close(self) -> None:
+        self._executor.submit(self._close)
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _log_error(future: Future) -> None:
+        if (exc := future.exception()) is not None:
+            logger.opt(exception=exc).error("Error spilling an event to disk")
+
+    def _write(self, item: Event) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="langflow-events-")  # noqa: SIM115
+        event_id, data, put_time = item
+        event_id_bytes = event_id.encode("utf-8") if event_id is not None else b"\x00"
+        data_bytes = data if data is not None else b"\x00"
+        record = _SPILL_HEADER.pack(put_time, len(event_id_bytes), len(data_bytes)) + event_id_bytes + data_bytes
+        self._file.seek(self._write_offset)
+        self._file.write(record)
+        self._write_offset += len(record)
+
+    def _read(self, count: int) -> list[Event]:
+        if self._file is None:
+            return []
+        events: list[Event] = []
+        self._file.seek(self._read_offset)
+        for _ in range(count):
+            put_time, event_id_length, data_length = _SPILL_HEADER.unpack(self._file.read(_SPILL_HEADER.size))
+            event_id_bytes = self._file.read(event_id_length)
+            data_bytes = self._file.read(data_length)
+            self._read_offset += _SPILL_HEADER.size + event_id_length + data_length
+            event_id = None if event_id_bytes == b"\x00" else event_id_bytes.decode("utf-8")
+            data = None if data_bytes == b"\x00" else data_bytes
+            events.append((event_id, data, put_time))
+        if self._read_offset == self._write_offset:
+            # Start over at the beginning of the file instead of growing it
+            self._file.truncate(0)
+            self._read_offset = self._write_offset = 0
+        return events
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class EventQueue(asyncio.Queue):
+    """The queue of a build job, bounded to `max_size` events held in memory.
+
+    What happens to the events produced while the queue is full depends on the policy:
+
+    - "block": producers that call `wait_for_capacity` wait until the consumer catches up.
+    - "drop": token events are merged into the last queued token of the same message, so the client
+      still receives the complete text in fewer frames.
+    - "spill": the events are written to a temporary file by a background thread and read back in
+      order by `get`, which refills the queue once half of it was consumed.
+
+    Other events are never dropped, they are queued past the bound so that the client always
+    receives every vertex and the end of the stream.
+    """
+
+    def __init__(self, max_size: int = 0, policy: OverflowPolicy = "drop") -> None:
+        # The bound is enforced here rather than by asyncio.Queue so that put_nowait never raises
+        super().__init__()
+        self.max_size = max_size
+        self.policy = policy
+        self.bytes = 0
+        self.max_depth = 0
+        self.merged = 0
+        self.spilled = 0
+        self._spill_file: _SpillFile | None = None
+        self._spill_count = 0
+        self._unspill_lock = asyncio.Lock()
+        self._capacity = asyncio.Event()
+        self._capacity.set()
+
+    @property
+    def is_full(self) -> bool:
+        return 0 < self.max_size <= len(self._queue)
+
+    def qsize(self) -> int:
+        return len(self._queue) + self._spill_count
+
+    def empty(self) -> bool:
+        return not self._queue and not self._spill_count
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "policy": self.policy,
+            "max_size": self.max_size,
+            "depth": self.qsize(),
+            "max_depth": self.max_depth,
+            "bytes": self.bytes,
+            "merged": self.merged,
+            "spilled": self.spilled,
+        }
+
+    async def wait_for_capacity(self) -> None:
+        """Waits until the queue is below its bound, if the policy blocks producers."""
+        if self.policy == "block":
+            await self._capacity.wait()
+
+    async def get(self) -> Event:
+        if self._spill_count and len(self._queue) <= self.max_size // 2:
+            await self._unspill()
+        return await super().get()
+
+    def get_nowait(self) -> Event:
+        # Spilled events can only be read back by `get`
+        if not self._queue:
+            raise asyncio.QueueEmpty
+        return super().get_nowait()
+
+    def close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._spill_count = 0
+
+    def _put(self, item: Event) -> None:
+        if self.is_full or self._spill_count:
+            if self.policy == "drop" and self._queue and (merged := _merge_token_events(self._queue[-1], item)):
+                self.bytes += len(merged[1] or b"") - len(self._queue[-1][1] or b"")
+                self._queue[-1] = merged
+                self.merged += 1
+                return
+            if self.policy == "spill":
+                # Once spilling, every event goes to the file to keep them in order
+                self._spill(item)
+                return
+        self._queue.append(item)
+        self.bytes += len(item[1] or b"")
+        self.max_depth = max(self.max_depth, self.qsize())
+        if self.policy == "block" and self.is_full:
+            self._capacity.clear()
+
+    def _get(self) -> Event:
+        item = self._queue.popleft()
+        self.bytes -= len(item[1] or b"")
+        if not self.is_full:
+            self._capacity.set()
+        return item
+
+    def _spill(self, item: Event) -> None:
+        if self._spill_file is None:
+            logger.debug(f"Event queue is full ({self.max_size} events), spilling to disk")
+            self._spill_file = _SpillFile()
+        self._spill_file.write(item)
+        self._spill_count += 1
+        self.spilled += 1
+        self.max_depth = max(self.max_depth, self.qsize())
+
+    async def _unspill(self) -> None:
+        """Moves spilled events back to memory, up to the bound."""
+        async with self._unspill_lock:
+            count = min(self._spill_count, self.max_size - len(self._queue))
+            if self._spill_file is None or count <= 0:
+                return
+            events = await self._spill_file.aread(count)
+            self._spill_count -= len(events)
+            # Events put while reading were spilled after these, so they still come out in order
+            for event in events:
+                self._queue.append(event)
+                self.bytes += len(event[1] or b"")
@@ -134,6 +134,10 @@ class Edge:
         self.target_reqs = state.get("target_reqs")
         self.matched_type = state.get("matched_type")
 
+    def copy_for_graph(self) -> Edge:
+        """Returns the edge to use in a clone of its graph, which is the edge itself as it holds no run state."""
+        return self
+
     def validate_edge(self, source, target) -> None:
         # If the self.source_handle has base_classes, then we are using the legacy
         # way of defining the source and target handles
@@ -231,6 +235,13 @@ class CycleEdge(Edge):
         source.has_cycle_edges = True
         target.has_cycle_edges = True
 
+    def copy_for_graph(self) -> CycleEdge:
+        new_edge = cast("CycleEdge", object.__new__(type(self)))
+        new_edge.__dict__.update(self.__dict__)
+        new_edge.is_fulfilled = False
+        new_edge.result = None
+        return new_edge
+
     async def honor(self, source: Vertex, target: Vertex) -> None:
         """Fulfills the contract by setting the result of the source vertex to the target vertex's parameter.
 
@@ -20,8 +20,9 @@ from loguru import logger
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
+from langflow.graph.graph.plan import ExecutionPlan
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
-from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from langflow.graph.graph.schema import GraphData, GraphDump, GraphScheduler, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
 from langflow.graph.graph.state_model import create_state_model_from_graph
 from langflow.graph.graph.utils import (
@@ -41,7 +42,7 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -101,6 +102,7 @@ class Graph:
         self._is_state_vertices: list[str] = []
         self.has_session_id_vertices: list[str] = []
         self._sorted_vertices_layers: list[list[str]] = []
+        self._plan: ExecutionPlan | None = None
         self._run_id = ""
         self._session_id = ""
         self._start_time = datetime.now(timezone.utc)
@@ -479,6 +481,7 @@ class Graph:
         self.successor_map[source_id].append(target_id)
         self.in_degree_map[target_id] += 1
         self.parent_child_map[source_id].append(target_id)
+        self._plan = None
 
     def add_node(self, node: NodeData) -> None:
         self._vertices.append(node)
@@ -626,6 +629,13 @@ class Graph:
             self._is_cyclic = bool(self.cycle_vertices)
         return self._is_cyclic
 
+    @property
+    def plan(self) -> ExecutionPlan:
+        """The execution plan of the graph, compiled the first time it is needed after the structure changed."""
+        if self._plan is None:
+            self._plan = ExecutionPlan.build((vertex.id for vertex in self.vertices), self.edges)
+        return self._plan
+
     @property
     def run_id(self):
         """The ID of the current run.
@@ -910,6 +920,8 @@ class Graph:
             vertices = self.vertices
 
         self.predecessor_map, self.successor_map = self.build_adjacency_maps(edges)
+        # The structure may have changed, so the plan has to be compiled again
+        self._plan = None
 
         self.in_degree_map = self.build_in_degree(edges)
         self.parent_child_map = self.build_parent_child_map(vertices)
@@ -956,14 +968,21 @@ class Graph:
 
     def mark_branch(self, vertex_id: str, state: str, output_name: str | None = None) -> None:
         self._mark_branch(vertex_id=vertex_id, state=state, output_name=output_name)
-        new_predecessor_map, _ = self.build_adjacency_maps(self.edges)
         self.run_manager.update_run_state(
-            run_predecessors=new_predecessor_map,
+            run_predecessors=self.plan.predecessor_map(),
             vertices_to_run=self.vertices_to_run,
         )
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
+        position = self.plan.edge_position(source_id, target_id)
+        if position is None:
+            return None
+        if position < len(self.edges):
+            edge = self.edges[position]
+            if edge.source_id == source_id and edge.target_id == target_id:
+                return edge
+        # A plan shared with a clone may list the edges in a different order
         for edge in self.edges:
             if edge.source_id == source_id and edge.target_id == target_id:
                 return edge
@@ -1013,6 +1032,7 @@ class Graph:
             "_is_output_vertices": self._is_output_vertices,
             "has_session_id_vertices": self.has_session_id_vertices,
             "_sorted_vertices_layers": self._sorted_vertices_layers,
+            "_plan": self._plan,
         }
 
     def __deepcopy__(self, memo):
@@ -1048,7 +1068,51 @@ class Graph:
 
         return new_graph
 
+    def clone(self, user_id: str | None = None) -> Graph:
+        """Creates a new graph with the same structure, ready to be run independently.
+
+        The clone is copy-on-write: the node and edge payloads, the edges, the parsed vertex data and the
+        execution plan are shared with this graph, since running a graph does not modify them. Each vertex
+        of the clone starts with an empty run state and its own params, and copies the component of this
+        graph's vertex the first time it uses it, so vertices that a run never reaches cost almost nothing.
+
+        Args:
+            user_id: The user ID for the new graph. Defaults to the user ID of this graph.
+
+        Returns:
+            Graph: The cloned graph.
+        """
+        new_graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=user_id if user_id is not None else self.user_id,
+            context=dict(self._context),
+        )
+        new_graph.raw_graph_data = self.raw_graph_data
+        new_graph._vertices = list(self._vertices)
+        new_graph._edges = list(self._edges)
+        new_graph._graph_data = {"nodes": new_graph._vertices, "edges": new_graph._edges}
+        new_graph.top_level_vertices = list(self.top_level_vertices)
+        new_graph._cycle_vertices = set(self.cycle_vertices)
+        new_graph._is_cyclic = self.is_cyclic
+
+        new_graph.vertices = [vertex.copy_for_graph(new_graph) for vertex in self.vertices]
+        new_graph.vertex_map = {vertex.id: vertex for vertex in new_graph.vertices}
+        for vertex in new_graph.vertices:
+            vertex.rebind_params(new_graph.vertex_map)
+        new_graph.edges = [edge.copy_for_graph() for edge in self.edges]
+        for vertex_id in [*new_graph.top_level_vertices, *new_graph.vertex_map]:
+            if vertex_id in new_graph._cycle_vertices:
+                new_graph.run_manager.add_to_cycle_vertices(vertex_id)
+        new_graph.build_graph_maps(new_graph.edges)
+        new_graph.define_vertices_lists()
+        new_graph._plan = self._plan
+        return new_graph
+
     def __setstate__(self, state):
+        state.pop("_sorted_layers_cache", None)
+        state.setdefault("_plan", None)
         run_manager = state["run_manager"]
         if isinstance(run_manager, RunnableVerticesManager):
             state["run_manager"] = run_manager
@@ -1117,6 +1181,7 @@ class Graph:
             new_edges.append(edge)
         new_edges += other_vertex.edges
         self.edges = new_edges
+        self._plan = None
 
     def vertex_data_is_identical(self, vertex: Vertex, other_vertex: Vertex) -> bool:
         data_is_equivalent = vertex == other_vertex
@@ -1215,6 +1280,7 @@ class Graph:
         """Adds a vertex to the graph."""
         self.vertices.append(vertex)
         self.vertex_map[vertex.id] = vertex
+        self._plan = None
 
     def add_vertex(self, vertex: Vertex) -> None:
         """Adds a new vertex to the graph."""
@@ -1227,12 +1293,14 @@ class Graph:
         for edge in vertex.edges:
             if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
                 self.edges.append(edge)
+                self._plan = None
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
         self.vertices = self._build_vertices()
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.edges = self._build_edges()
+        self._plan = None
 
         # This is a hack to make sure that the LLM vertex is sent to
         # the toolkit vertex
@@ -1251,10 +1319,8 @@ class Graph:
 
     def _set_cache_to_vertices_in_cycle(self) -> None:
         """Sets the cache to the vertices in cycle."""
-        edges = self._get_edges_as_list_of_tuples()
-        cycle_vertices = set(find_cycle_vertices(edges))
         for vertex in self.vertices:
-            if vertex.id in cycle_vertices:
+            if vertex.id in self.cycle_vertices:
                 vertex.apply_on_outputs(lambda output_object: setattr(output_object, "cache", False))
 
     def _instantiate_components_in_vertices(self) -> None:
@@ -1269,6 +1335,7 @@ class Graph:
             return
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
+        self._plan = None
         self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
 
     def _build_vertex_params(self) -> None:
@@ -1525,15 +1592,46 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: GraphScheduler | None = None,
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph running independent vertices in parallel.
+
+        Args:
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            start_component_id: The ID of the component to start from.
+            event_manager: The event manager for the graph.
+            scheduler: "layered" waits for a whole layer to finish before starting the next one, while
+                "as_completed" starts each vertex as soon as its own predecessors are done.
+                Defaults to the `graph_scheduler` setting.
+            max_concurrency: The maximum number of vertices built at the same time by the "as_completed"
+                scheduler. Defaults to the `graph_max_concurrency` setting, 0 means no limit.
+        """
+        settings = get_settings_service().settings
+        scheduler = scheduler or settings.graph_scheduler
+        if max_concurrency is None:
+            max_concurrency = settings.graph_max_concurrency
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
+        await self.initialize_run()
+        if scheduler == "as_completed":
+            await self._process_as_completed(
+                first_layer,
+                fallback_to_env_vars=fallback_to_env_vars,
+                event_manager=event_manager,
+                has_webhook_component=has_webhook_component,
+                max_concurrency=max_concurrency,
+            )
+            logger.debug("Graph processing complete")
+            return self
+        if scheduler != "layered":
+            msg = f"Invalid scheduler: {scheduler}. Expected 'layered' or 'as_completed'"
+            raise ValueError(msg)
+
         vertex_task_run_count: dict[str, int] = {}
         to_process = deque(first_layer)
         layer_index = 0
         chat_service = get_chat_service()
-        await self.initialize_run()
         lock = asyncio.Lock()
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
@@ -1572,6 +1670,87 @@ class Graph:
         logger.debug("Graph processing complete")
         return self
 
+    async def _process_as_completed(
+        self,
+        first_layer: list[str],
+        *,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None,
+        has_webhook_component: bool,
+        max_concurrency: int,
+    ) -> None:
+        """Builds vertices as soon as their predecessors are fulfilled instead of layer by layer.
+
+        A slow vertex only delays its own successors, so the run takes as long as the critical
+        path of the graph instead of the sum of the slowest vertex of each layer.
+        """
+        chat_service = get_chat_service()
+        lock = asyncio.Lock()
+        vertex_task_run_count: dict[str, int] = {}
+        ready: deque[str] = deque()
+        queued: set[str] = set()
+        running: dict[asyncio.Task, str] = {}
+        # Vertices that became runnable again while they were running, as in cycles, run again once they finish
+        rerun: set[str] = set()
+
+        def enqueue(vertex_ids: Iterable[str]) -> None:
+            running_ids = set(running.values())
+            for vertex_id in vertex_ids:
+                if vertex_id in running_ids:
+                    rerun.add(vertex_id)
+                elif vertex_id not in queued:
+                    queued.add(vertex_id)
+                    ready.append(vertex_id)
+
+        enqueue(first_layer)
+        while ready or running:
+            while ready and (max_concurrency <= 0 or len(running) < max_concurrency):
+                vertex_id = ready.popleft()
+                queued.discard(vertex_id)
+                task = asyncio.create_task(
+                    self.build_vertex(
+                        vertex_id=vertex_id,
+                        user_id=self.user_id,
+                        inputs_dict={},
+                        fallback_to_env_vars=fallback_to_env_vars,
+                        get_cache=chat_service.get_cache,
+                        set_cache=chat_service.set_cache,
+                        event_manager=event_manager,
+                    ),
+                    name=f"{vertex_id} Run {vertex_task_run_count.get(vertex_id, 0)}",
+                )
+                running[task] = vertex_id
+                vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                vertex_id = running.pop(task)
+                try:
+                    result = task.result()
+                except Exception as exc:
+                    logger.error(f"Task {task.get_name()} failed with exception: {exc}")
+                    if has_webhook_component:
+                        await self._log_vertex_build_from_exception(vertex_id, exc)
+                    for pending_task in running:
+                        pending_task.cancel()
+                    await asyncio.gather(*running, return_exceptions=True)
+                    raise
+                await log_vertex_build(
+                    flow_id=self.flow_id or "",
+                    vertex_id=result.vertex.id,
+                    valid=result.valid,
+                    params=result.params,
+                    data=result.result_dict,
+                    artifacts=result.artifacts,
+                )
+                self.run_manager.remove_vertex_from_runnables(vertex_id)
+                logger.debug(f"Vertex {vertex_id}, result: {result.vertex.built_result}")
+                next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=result.vertex, cache=False)
+                enqueue(next_runnable_vertices)
+                if vertex_id in rerun:
+                    rerun.discard(vertex_id)
+                    enqueue([vertex_id])
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
         for v_id in sorted(vertex_successors_ids):
@@ -1750,6 +1929,8 @@ class Graph:
         return [self.get_vertex(source_id) for source_id in self.predecessor_map.get(vertex.id, [])]
 
     def get_all_successors(self, vertex: Vertex, *, recursive=True, flat=True, visited=None):
+        if recursive and flat and visited is None:
+            return [self.vertex_map[vertex_id] for vertex_id in self.plan.descendants(vertex.id)]
         if visited is None:
             visited = set()
 
@@ -1989,19 +2170,23 @@ class Graph:
         """Sorts the vertices in the graph."""
         self.mark_all_vertices("ACTIVE")
 
-        first_layer, remaining_layers = get_sorted_vertices(
-            vertices_ids=self.get_vertex_ids(),
-            cycle_vertices=self.cycle_vertices,
-            stop_component_id=stop_component_id,
-            start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
-            in_degree_map=self.in_degree_map,
-            successor_map=self.successor_map,
-            predecessor_map=self.predecessor_map,
-            is_input_vertex=self.get_vertex_input_status,
-            get_vertex_predecessors=self.get_vertex_predecessors_ids,
-            get_vertex_successors=self.get_vertex_successors_ids,
-            is_cyclic=self.is_cyclic,
+        first_layer, remaining_layers = self.plan.sorted_layers(
+            stop_component_id,
+            start_component_id,
+            lambda: get_sorted_vertices(
+                vertices_ids=self.get_vertex_ids(),
+                cycle_vertices=self.cycle_vertices,
+                stop_component_id=stop_component_id,
+                start_component_id=start_component_id,
+                graph_dict=self.__to_dict(),
+                in_degree_map=self.in_degree_map,
+                successor_map=self.successor_map,
+                predecessor_map=self.predecessor_map,
+                is_input_vertex=self.get_vertex_input_status,
+                get_vertex_predecessors=self.get_vertex_predecessors_ids,
+                get_vertex_successors=self.get_vertex_successors_ids,
+                is_cyclic=self.is_cyclic,
+            ),
         )
 
         self.increment_run_count()
@@ -2070,10 +2255,13 @@ class Graph:
     def find_runnable_predecessors_for_successor(self, vertex_id: str) -> list[str]:
         runnable_vertices = []
         visited = set()
-
-        def find_runnable_predecessors(predecessor_id: str) -> None:
+        run_predecessors = self.run_manager.run_predecessors
+        # Depth-first, in the same order as a recursive walk would visit the predecessors
+        stack = list(reversed(run_predecessors.get(vertex_id, [])))
+        while stack:
+            predecessor_id = stack.pop()
             if predecessor_id in visited:
-                return
+                continue
             visited.add(predecessor_id)
             predecessor_vertex = self.get_vertex(predecessor_id)
             is_active = predecessor_vertex.is_active()
@@ -2081,11 +2269,7 @@ class Graph:
             if self.run_manager.is_vertex_runnable(predecessor_id, is_active=is_active, is_loop=is_loop):
                 runnable_vertices.append(predecessor_id)
             else:
-                for pred_pred_id in self.run_manager.run_predecessors.get(predecessor_id, []):
-                    find_runnable_predecessors(pred_pred_id)
-
-        for predecessor_id in self.run_manager.run_predecessors.get(vertex_id, []):
-            find_runnable_predecessors(predecessor_id)
+                stack.extend(reversed(run_predecessors.get(predecessor_id, [])))
         return runnable_vertices
 
     def remove_from_predecessors(self, vertex_id: str) -> None:
@@ -2137,10 +2321,8 @@ class Graph:
 
     def __to_dict(self) -> dict[str, dict[str, list[str]]]:
         """Converts the graph to a dictionary."""
-        result: dict = {}
-        for vertex in self.vertices:
-            vertex_id = vertex.id
-            sucessors = [i.id for i in self.get_all_successors(vertex)]
-            predecessors = [i.id for i in self.get_predecessors(vertex)]
-            result |= {vertex_id: {"successors": sucessors, "predecessors": predecessors}}
-        return result
+        plan = self.plan
+        return {
+            vertex_id: {"successors": plan.descendants(vertex_id), "predecessors": plan.predecessors(vertex_id)}
+            for vertex_id in plan.vertex_ids
+        }
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from langflow.graph.edge.base import CycleEdge
+
+SortedLayers = tuple[list[str], list[list[str]]]
+
+
+def _compressed_rows(rows: list[list[int]]) -> tuple[array, array]:
+    """Pack adjacency lists into offsets and indices arrays (compressed sparse row layout)."""
+    offsets = array("I", [0])
+    indices = array("I")
+    for row in rows:
+        indices.extend(row)
+        offsets.append(len(indices))
+    return offsets, indices
+
+
+@dataclass(frozen=True, eq=False)
+class ExecutionPlan:
+    """Structure of a graph compiled once and reused by every run of the graph.
+
+    Vertices are numbered in the order of `vertex_ids`. The successors of the vertex numbered `i`
+    are `successor_indices[successor_offsets[i]:successor_offsets[i + 1]]`, one entry per edge in
+    the order of the edges, and the predecessors are stored the same way. The plan only holds
+    ids and integers, so graphs built from the same payload can share it.
+
+    The layers computed by the layered sort are memoized per start and stop component, which is
+    the only state added to the plan after it is built.
+    """
+
+    vertex_ids: tuple[str, ...]
+    index: dict[str, int]
+    successor_offsets: array
+    successor_indices: array
+    predecessor_offsets: array
+    predecessor_indices: array
+    edge_positions: dict[tuple[str, str], int]
+    _layers: dict[tuple[str | None, str | None], SortedLayers] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, vertex_ids: Iterable[str], edges: Sequence[CycleEdge]) -> ExecutionPlan:
+        """Compile the plan of a graph.
+
+        Args:
+            vertex_ids: The ids of the vertices of the graph.
+            edges: The edges of the graph. Edges to unknown vertices are ignored.
+        """
+        ids = tuple(vertex_ids)
+        index = {vertex_id: position for position, vertex_id in enumerate(ids)}
+        successors: list[list[int]] = [[] for _ in ids]
+        predecessors: list[list[int]] = [[] for _ in ids]
+        edge_positions: dict[tuple[str, str], int] = {}
+        for position, edge in enumerate(edges):
+            source = index.get(edge.source_id)
+            target = index.get(edge.target_id)
+            if source is None or target is None:
+                continue
+            successors[source].append(target)
+            predecessors[target].append(source)
+            # get_edge returns the first edge between two vertices
+            edge_positions.setdefault((edge.source_id, edge.target_id), position)
+
+        successor_offsets, successor_indices = _compressed_rows(successors)
+        predecessor_offsets, predecessor_indices = _compressed_rows(predecessors)
+        return cls(
+            vertex_ids=ids,
+            index=index,
+            successor_offsets=successor_offsets,
+            successor_indices=successor_indices,
+            predecessor_offsets=predecessor_offsets,
+            predecessor_indices=predecessor_indices,
+            edge_positions=edge_positions,
+        )
+
+    def __len__(self) -> int:
+        return len(self.vertex_ids)
+
+    def predecessors(self, vertex_id: str) -> list[str]:
+        position = self.index[vertex_id]
+        start, end = self.predecessor_offsets[position], self.predecessor_offsets[position + 1]
+        return [self.vertex_ids[i] for i in self.predecessor_indices[start:end]]
+
+    def edge_position(self, source_id: str, target_id: str) -> int | None:
+        """Return the position in the graph edges of the first edge from `source_id` to `target_id`."""
+        return self.edge_positions.get((source_id, target_id))
+
+    def predecessor_map(self) -> dict[str, list[str]]:
+        """Return a new predecessor map, which runs can consume as vertices are built."""
+        predecessor_map: dict[str, list[str]] = defaultdict(list)
+        offsets, indices, ids = self.predecessor_offsets, self.predecessor_indices, self.vertex_ids
+        for position, vertex_id in enumerate(ids):
+            start, end = offsets[position], offsets[position + 1]
+            if start != end:
+                predecessor_map[vertex_id] = [ids[i] for i in indices[start:end]]
+        return predecessor_map
+
+    def descendants(self, vertex_id: str) -> list[str]:
+        """Return the ids of every vertex reachable from `vertex_id`, excluding itself unless in a cycle."""
+        offsets, indices = self.successor_offsets, self.successor_indices
+        start = self.index[vertex_id]
+        visited = bytearray(len(self.vertex_ids))
+        stack = list(indices[offsets[start] : offsets[start + 1]])
+        result = []
+        while stack:
+            position = stack.pop()
+            if visited[position]:
+                continue
+            visited[position] = 1
+            result.append(self.vertex_ids[position])
+            stack.extend(indices[offsets[position] : offsets[position + 1]])
+        return result
+
+    def sorted_layers(
+        self,
+        stop_component_id: str | None,
+        start_component_id: str | None,
+        sort: Callable[[], SortedLayers],
+    ) -> SortedLayers:
+        """Return a copy of the layers sorted by `sort`, which only runs once per start and stop component."""
+        key = (stop_component_id, start_component_id)
+        layers = self._layers.get(key)
+        if layers is None:
+            first_layer, remaining_layers = sort()
+            layers = self._layers[key] = (list(first_layer), [list(layer) for layer in remaining_layers])
+        first_layer, remaining_layers = layers
+        return list(first_layer), [list(layer) for layer in remaining_layers]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, NamedTuple, Protocol
+from typing import TYPE_CHECKING, Literal, NamedTuple, Protocol
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
     from langflow.schema.log import LoggableType
 
 
+GraphScheduler = Literal["layered", "as_completed"]
+
+
 class ViewPort(TypedDict):
     x: float
     y: float
@@ -18,7 +18,7 @@ from langflow.services.database.models.transactions.model import TransactionBase
 from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
 from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.deps import get_build_log_service, get_db_service, get_settings_service
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -149,6 +149,8 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
+        if get_build_log_service().enqueue_transaction(transaction):
+            return
         async with session_getter(get_db_service()) as session:
             with session.no_autoflush:
                 inserted = await crud_log_transaction(session, transaction)
@@ -179,6 +181,8 @@ async def log_vertex_build(
             data=serialize(data, max_length=MAX_TEXT_LENGTH, max_items=MAX_ITEMS_LENGTH),
             artifacts=serialize(artifacts, max_length=MAX_TEXT_LENGTH, max_items=MAX_ITEMS_LENGTH),
         )
+        if get_build_log_service().enqueue_vertex_build(vertex_build):
+            return
         async with session_getter(get_db_service()) as session:
             inserted = await crud_log_vertex_build(session, vertex_build)
             logger.debug(f"Logged vertex build: {inserted.build_id}")
@@ -43,6 +43,21 @@ class VertexStates(str, Enum):
     ERROR = "ERROR"
 
 
+def _rebind_value(value: Any, vertex_map: Mapping[str, Vertex], memo: dict[int, Any]) -> Any:
+    if isinstance(value, Vertex):
+        return vertex_map.get(value.id, value)
+    if not isinstance(value, dict | list):
+        return value
+    if id(value) in memo:
+        return memo[id(value)]
+    if isinstance(value, dict):
+        rebound: dict | list = {key: _rebind_value(item, vertex_map, memo) for key, item in value.items()}
+    else:
+        rebound = [_rebind_value(item, vertex_map, memo) for item in value]
+    memo[id(value)] = rebound
+    return rebound
+
+
 class Vertex:
     def __init__(
         self,
@@ -107,6 +122,69 @@ class Vertex:
             output["name"] for output in self.outputs if isinstance(output, dict) and "name" in output
         ]
 
+    @property
+    def custom_component(self) -> Any:
+        if self._custom_component is None and self._component_source is not None:
+            # Vertices of a cloned graph copy the component of the vertex they were copied from when first used
+            self._custom_component = self._component_source.copy_for_vertex(self, user_id=self.graph.user_id)
+            self._component_source = None
+        return self._custom_component
+
+    @custom_component.setter
+    def custom_component(self, value: Any) -> None:
+        self._custom_component = value
+        self._component_source = None
+
+    def copy_for_graph(self, graph: Graph) -> Vertex:
+        """Returns a copy of the vertex for a clone of its graph.
+
+        The parsed node data is shared with this vertex, the state of a run starts empty, and the component
+        is only copied from the component of this vertex when the copy first uses it. The params still refer
+        to the vertices of this graph until `rebind_params` is called with the vertices of the clone.
+
+        Args:
+            graph: The graph of the copy.
+        """
+        new_vertex = object.__new__(type(self))
+        new_vertex.__dict__.update(self.__dict__)
+        new_vertex._lock = asyncio.Lock()
+        new_vertex.graph = graph
+        new_vertex._component_source = (
+            self._custom_component if self._custom_component is not None else self._component_source
+        )
+        new_vertex._custom_component = None
+        new_vertex.will_stream = False
+        new_vertex.built_object = UnbuiltObject()
+        new_vertex.built_result = None
+        new_vertex.built = False
+        new_vertex._successors_ids = None
+        new_vertex.artifacts = {}
+        new_vertex.artifacts_raw = {}
+        new_vertex.artifacts_type = {}
+        new_vertex.steps = [
+            types.MethodType(step.__func__, new_vertex) if getattr(step, "__self__", None) is self else step
+            for step in self.steps
+        ]
+        new_vertex.steps_ran = []
+        new_vertex.task_id = None
+        new_vertex.layer = None
+        new_vertex.result = None
+        new_vertex.results = {}
+        new_vertex.outputs_logs = {}
+        new_vertex.logs = {}
+        new_vertex.use_result = False
+        new_vertex.build_times = []
+        new_vertex.state = VertexStates.ACTIVE
+        new_vertex.log_transaction_tasks = set()
+        return new_vertex
+
+    def rebind_params(self, vertex_map: Mapping[str, Vertex]) -> None:
+        """Copies the params of the vertex, replacing the vertices they refer to by the ones in `vertex_map`."""
+        memo: dict[int, Any] = {}
+        self.params = _rebind_value(self.params, vertex_map, memo)
+        if "raw_params" in self.__dict__:
+            self.raw_params = _rebind_value(self.raw_params, vertex_map, memo)
+
     @property
     def is_loop(self) -> bool:
         """Check if any output allows looping."""
@@ -209,12 +287,17 @@ class Vertex:
 
     def __getstate__(self):
         state = self.__dict__.copy()
+        state["_custom_component"] = self.custom_component
+        state["_component_source"] = None
         state["_lock"] = None  # Locks are not serializable
         state["built_object"] = None if isinstance(self.built_object, UnbuiltObject) else self.built_object
         state["built_result"] = None if isinstance(self.built_result, UnbuiltResult) else self.built_result
         return state
 
     def __setstate__(self, state):
+        if "custom_component" in state:
+            state["_custom_component"] = state.pop("custom_component")
+        state.setdefault("_component_source", None)
         self.__dict__.update(state)
         self._lock = asyncio.Lock()  # Reinitialize the lock
         self.built_object = state.get("built_object") or UnbuiltObject()
@@ -361,6 +444,8 @@ class Vertex:
         self.updated_raw_params = True
 
     def instantiate_component(self, user_id=None) -> None:
+        if self._component_source is not None:
+            return
         if not self.custom_component:
             self.custom_component, _ = initialize.loading.instantiate_class(
                 user_id=user_id,
@@ -24,6 +24,7 @@ from langflow.utils.util import unescape_string
 
 if TYPE_CHECKING:
     from langflow.graph.edge.base import CycleEdge
+    from langflow.graph.graph.base import Graph
     from langflow.graph.vertex.schema import NodeData
     from langflow.inputs.inputs import InputTypes
 
@@ -209,6 +210,11 @@ class InterfaceVertex(ComponentVertex):
         self.steps = [self._build, self._run]
         self.is_interface_component = True
 
+    def copy_for_graph(self, graph: Graph) -> InterfaceVertex:
+        new_vertex = cast("InterfaceVertex", super().copy_for_graph(graph))
+        new_vertex.added_message = None
+        return new_vertex
+
     def build_stream_url(self) -> str:
         return f"/api/v1/build/{self.graph.flow_id}/{self.id}/stream"
 
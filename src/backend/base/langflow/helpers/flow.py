@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
 from fastapi import HTTPException
 from loguru import logger
 from pydantic.v1 import BaseModel, Field, create_model
-from sqlmodel import select
+from sqlmodel import col, select
 
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.database.models.flow import Flow
@@ -14,13 +15,19 @@ from langflow.services.database.models.flow.model import FlowRead
 from langflow.services.deps import get_settings_service, session_scope
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Sequence
+    from datetime import datetime
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
     from langflow.graph.graph.base import Graph
     from langflow.graph.schema import RunOutputs
     from langflow.graph.vertex.base import Vertex
     from langflow.schema import Data
 
+# Number of flows whose data is loaded per query when generating input schemas
+SCHEMA_QUERY_BATCH_SIZE = 500
+
 INPUT_TYPE_MAP = {
     "ChatInput": {"type_hint": "Optional[str]", "default": '""'},
     "TextInput": {"type_hint": "Optional[str]", "default": '""'},
@@ -319,10 +326,15 @@ async def generate_unique_flow_name(flow_name, user_id, session):
 
 def json_schema_from_flow(flow: Flow) -> dict:
     """Generate JSON schema from flow input nodes."""
+    return json_schema_from_flow_data(flow.data)
+
+
+def json_schema_from_flow_data(flow_data: dict | None) -> dict:
+    """Generate JSON schema from the input nodes of the flow data."""
     from langflow.graph.graph.base import Graph
 
     # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data or {}
+    flow_data = flow_data or {}
 
     graph = Graph.from_payload(flow_data)
     input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
@@ -358,3 +370,82 @@ def json_schema_from_flow(flow: Flow) -> dict:
                     required.append(field_name)
 
     return {"type": "object", "properties": properties, "required": required}
+
+
+class FlowSchemaCache:
+    """The JSON schemas of the inputs of flows, as listed by the MCP servers.
+
+    Computing a schema builds a graph from the whole flow data, so each schema is kept until the
+    flow is saved again, which changes its `updated_at`.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[UUID, tuple[datetime | None, dict]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, flow_id: UUID, updated_at: datetime | None) -> dict | None:
+        with self._lock:
+            cached = self._schemas.get(flow_id)
+            if cached is None or cached[0] != updated_at:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return cached[1]
+
+    def set(self, flow_id: UUID, updated_at: datetime | None, schema: dict) -> None:
+        with self._lock:
+            self._schemas[flow_id] = (updated_at, schema)
+
+    def retain(self, flow_ids: set[UUID]) -> None:
+        """Forgets the schemas of the flows that are not in `flow_ids`, e.g. deleted flows."""
+        with self._lock:
+            for flow_id in self._schemas.keys() - flow_ids:
+                del self._schemas[flow_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._schemas), "hits": self.hits, "misses": self.misses}
+
+
+_flow_schema_cache = FlowSchemaCache()
+
+
+def get_flow_schema_cache() -> FlowSchemaCache:
+    return _flow_schema_cache
+
+
+async def aget_flow_input_schemas(session: AsyncSession, flows: Sequence[Any]) -> dict[UUID, dict]:
+    """Returns the JSON schema of the inputs of each flow, keyed by flow id.
+
+    `flows` only needs the `id` and `updated_at` of each flow. The data of a flow is loaded only
+    if its schema is not cached yet, so listing the tools costs one query for the flows that
+    changed since the last listing. Flows whose schema can't be generated are left out.
+    """
+    cache = get_flow_schema_cache()
+    schemas: dict[UUID, dict] = {}
+    missing: list[UUID] = []
+    for flow in flows:
+        schema = cache.get(flow.id, flow.updated_at)
+        if schema is None:
+            missing.append(flow.id)
+        else:
+            schemas[flow.id] = schema
+
+    for start in range(0, len(missing), SCHEMA_QUERY_BATCH_SIZE):
+        batch = missing[start : start + SCHEMA_QUERY_BATCH_SIZE]
+        stmt = select(Flow.id, Flow.name, Flow.data, Flow.updated_at).where(col(Flow.id).in_(batch))
+        for flow_id, name, data, updated_at in (await session.exec(stmt)).all():
+            try:
+                schema = json_schema_from_flow_data(data)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Error generating the input schema of flow {name}: {e!s}")
+                continue
+            cache.set(flow_id, updated_at, schema)
+            schemas[flow_id] = schema
+    return schemas
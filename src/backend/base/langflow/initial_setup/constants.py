@@ -1,2 +1,4 @@
 STARTER_FOLDER_NAME = "Starter Projects"
 STARTER_FOLDER_DESCRIPTION = "Starter projects to help you get started in Langflow."
+# Digests of the starter projects as of the last sync, stored in the config dir
+STARTER_PROJECT_DIGESTS_FILE = "starter_projects_digests.json"
@@ -1,5 +1,6 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
 import os
@@ -27,7 +28,11 @@ from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.base.constants import FIELD_FORMAT_ATTRIBUTES, NODE_FORMAT_ATTRIBUTES, ORJSON_OPTIONS
-from langflow.initial_setup.constants import STARTER_FOLDER_DESCRIPTION, STARTER_FOLDER_NAME
+from langflow.initial_setup.constants import (
+    STARTER_FOLDER_DESCRIPTION,
+    STARTER_FOLDER_NAME,
+    STARTER_PROJECT_DIGESTS_FILE,
+)
 from langflow.services.auth.utils import create_super_user
 from langflow.services.database.models.flow.model import Flow, FlowCreate
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
@@ -155,17 +160,24 @@ def scape_json_parse(json_string: str) -> dict:
     return json.loads(parsed_string)
 
 
+def _index_nodes_by_id(nodes: list[dict]) -> dict[str, dict]:
+    """Map the id of each node to the node, keeping the first node of duplicated ids."""
+    nodes_by_id: dict[str, dict] = {}
+    for node in nodes:
+        nodes_by_id.setdefault(node.get("id"), node)
+    return nodes_by_id
+
+
 def update_new_output(data):
     nodes = copy.deepcopy(data["nodes"])
     edges = copy.deepcopy(data["edges"])
+    nodes_by_id = _index_nodes_by_id(nodes)
 
     for edge in edges:
         if "sourceHandle" in edge and "targetHandle" in edge:
             new_source_handle = scape_json_parse(edge["sourceHandle"])
             new_target_handle = scape_json_parse(edge["targetHandle"])
-            id_ = new_source_handle["id"]
-            source_node_index = next((index for (index, d) in enumerate(nodes) if d["id"] == id_), -1)
-            source_node = nodes[source_node_index] if source_node_index != -1 else None
+            source_node = nodes_by_id.get(new_source_handle["id"])
 
             if "baseClasses" in new_source_handle:
                 if "output_types" not in new_source_handle:
@@ -266,6 +278,9 @@ def update_edges_with_latest_component_versions(project_data):
     # Create a deep copy to avoid modifying the original data
     project_data_copy = deepcopy(project_data)
 
+    # Index the original nodes by id, the handles are looked up for every edge
+    nodes_by_id = _index_nodes_by_id(project_data.get("nodes", []))
+
     # Create a mapping of node types to node IDs for node reconciliation
     node_type_map = {}
     for node in project_data_copy.get("nodes", []):
@@ -284,14 +299,8 @@ def update_edges_with_latest_component_versions(project_data):
         target_handle = scape_json_parse(target_handle)
 
         # Find the corresponding source and target nodes
-        source_node = next(
-            (node for node in project_data.get("nodes", []) if node.get("id") == edge.get("source")),
-            None,
-        )
-        target_node = next(
-            (node for node in project_data.get("nodes", []) if node.get("id") == edge.get("target")),
-            None,
-        )
+        source_node = nodes_by_id.get(edge.get("source"))
+        target_node = nodes_by_id.get(edge.get("target"))
 
         # Try to reconcile missing nodes by type
         if source_node is None and source_handle and "dataType" in source_handle:
@@ -308,10 +317,7 @@ def update_edges_with_latest_component_versions(project_data):
                 source_handle["id"] = new_node_id
 
                 # Find the new source node
-                source_node = next(
-                    (node for node in project_data.get("nodes", []) if node.get("id") == new_node_id),
-                    None,
-                )
+                source_node = nodes_by_id.get(new_node_id)
 
                 # Update edge ID (complex as it contains encoded handles)
                 # This is a simplified approach - in production you'd need to parse and rebuild the ID
@@ -337,10 +343,7 @@ def update_edges_with_latest_component_versions(project_data):
                     target_handle["id"] = new_node_id
 
                     # Find the new target node
-                    target_node = next(
-                        (node for node in project_data.get("nodes", []) if node.get("id") == new_node_id),
-                        None,
-                    )
+                    target_node = nodes_by_id.get(new_node_id)
 
                     # Update edge ID (simplified approach)
                     old_id_suffix = edge.get("id", "").split("}-")[1] if "}-" in edge.get("id", "") else ""
@@ -613,15 +616,18 @@ def update_existing_project(
     project_data,
     project_icon,
     project_icon_bg_color,
+    project_gradient=None,
+    project_tags=None,
 ) -> None:
     logger.info(f"Updating starter project {project_name}")
     existing_project.data = project_data
-    existing_project.folder = STARTER_FOLDER_NAME
     existing_project.description = project_description
     existing_project.is_component = project_is_component
     existing_project.updated_at = updated_at_datetime
     existing_project.icon = project_icon
     existing_project.icon_bg_color = project_icon_bg_color
+    existing_project.gradient = project_gradient
+    existing_project.tags = project_tags
 
 
 def create_new_project(
@@ -659,6 +665,58 @@ async def get_all_flows_similar_to_project(session: AsyncSession, folder_id: UUI
     return list((await session.exec(stmt)).first().flows)
 
 
+def get_starter_project_digest(project: dict, component_digests: dict[str, str] | None = None) -> str:
+    """Hash a starter project together with the templates of the components it uses.
+
+    `component_digests` maps component types to the hash of their latest template, as computed by
+    `get_component_digests`. Starter projects are only synced again when their digest changes.
+    """
+    digest = hashlib.sha256(orjson.dumps(project, option=orjson.OPT_SORT_KEYS))
+    if component_digests is not None:
+        nodes = (project.get("data") or {}).get("nodes", [])
+        node_types = {node.get("data", {}).get("type") for node in nodes}
+        for node_type in sorted(node_type for node_type in node_types if node_type in component_digests):
+            digest.update(f"{node_type}:{component_digests[node_type]}".encode())
+    return digest.hexdigest()
+
+
+def get_component_digests(all_types_dict: dict) -> dict[str, str]:
+    """Hash the template of every component type in `all_types_dict`."""
+    return {
+        key: hashlib.sha256(orjson.dumps(component, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        for category in all_types_dict.values()
+        for key, component in category.items()
+    }
+
+
+def get_starter_project_digests_path() -> anyio.Path | None:
+    config_dir = get_storage_service().settings_service.settings.config_dir
+    return anyio.Path(config_dir) / STARTER_PROJECT_DIGESTS_FILE if config_dir else None
+
+
+async def load_starter_project_digests() -> dict[str, str]:
+    """Load the digests of the starter projects as of the last sync, by project name."""
+    path = get_starter_project_digests_path()
+    if path is None or not await path.exists():
+        return {}
+    try:
+        digests = orjson.loads(await path.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Error loading starter project digests, syncing every starter project: {e}")
+        return {}
+    return digests if isinstance(digests, dict) else {}
+
+
+async def save_starter_project_digests(digests: dict[str, str]) -> None:
+    path = get_starter_project_digests_path()
+    if path is None:
+        return
+    try:
+        await path.write_bytes(orjson.dumps(digests, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    except OSError as e:
+        logger.warning(f"Error saving starter project digests: {e}")
+
+
 async def delete_start_projects(session, folder_id) -> None:
     flows = await get_all_flows_similar_to_project(session, folder_id)
     for flow in flows:
@@ -871,16 +929,36 @@ async def find_existing_flow(session, flow_id, flow_endpoint_name):
 async def create_or_update_starter_projects(all_types_dict: dict, *, do_create: bool = True) -> None:
     """Create or update starter projects.
 
+    Each project is hashed with the templates of the components it uses, and only the projects whose digest
+    changed since the last sync, or that are missing from the starter folder, are updated to the latest
+    component versions, written back to their file and upserted. Flows of the starter folder that are no
+    longer starter projects are deleted.
+
     Args:
         all_types_dict (dict): Dictionary containing all component types and their templates
         do_create (bool, optional): Whether to create new projects. Defaults to True.
     """
+    do_update_starter_projects = os.environ.get("LANGFLOW_UPDATE_STARTER_PROJECTS", "true").lower() == "true"
+    component_digests = get_component_digests(all_types_dict) if do_update_starter_projects else None
     async with session_scope() as session:
         new_folder = await create_starter_folder(session)
         starter_projects = await load_starter_projects()
-        await delete_start_projects(session, new_folder.id)
         await copy_profile_pictures()
+        existing_flows: dict[str, Flow] = {}
+        for flow in await get_all_flows_similar_to_project(session, new_folder.id):
+            if flow.name in existing_flows:
+                await session.delete(flow)
+            else:
+                existing_flows[flow.name] = flow
+        previous_digests = await load_starter_project_digests()
+        digests: dict[str, str] = {}
+        synced = 0
         for project_path, project in starter_projects:
+            project_name = project.get("name")
+            digest = get_starter_project_digest(project, component_digests)
+            if previous_digests.get(project_name) == digest and (not do_create or project_name in existing_flows):
+                digests[project_name] = digest
+                continue
             (
                 project_name,
                 project_description,
@@ -892,7 +970,6 @@ async def create_or_update_starter_projects(all_types_dict: dict, *, do_create:
                 project_gradient,
                 project_tags,
             ) = get_project_data(project)
-            do_update_starter_projects = os.environ.get("LANGFLOW_UPDATE_STARTER_PROJECTS", "true").lower() == "true"
             if do_update_starter_projects:
                 updated_project_data = update_projects_components_with_latest_component_versions(
                     project_data.copy(), all_types_dict
@@ -902,24 +979,47 @@ async def create_or_update_starter_projects(all_types_dict: dict, *, do_create:
                     project_data = updated_project_data
                     # We also need to update the project data in the file
                     await update_project_file(project_path, project, updated_project_data)
+                    digest = get_starter_project_digest(project, component_digests)
             if do_create and project_name and project_data:
-                existing_flows = await get_all_flows_similar_to_project(session, new_folder.id)
-                for existing_project in existing_flows:
-                    await session.delete(existing_project)
-
-                create_new_project(
-                    session=session,
-                    project_name=project_name,
-                    project_description=project_description,
-                    project_is_component=project_is_component,
-                    updated_at_datetime=updated_at_datetime,
-                    project_data=project_data,
-                    project_icon=project_icon,
-                    project_icon_bg_color=project_icon_bg_color,
-                    project_gradient=project_gradient,
-                    project_tags=project_tags,
-                    new_folder_id=new_folder.id,
-                )
+                if existing_project := existing_flows.get(project_name):
+                    update_existing_project(
+                        existing_project=existing_project,
+                        project_name=project_name,
+                        project_description=project_description,
+                        project_is_component=project_is_component,
+                        updated_at_datetime=updated_at_datetime,
+                        project_data=project_data,
+                        project_icon=project_icon,
+                        project_icon_bg_color=project_icon_bg_color,
+                        project_gradient=project_gradient,
+                        project_tags=project_tags,
+                    )
+                    session.add(existing_project)
+                else:
+                    create_new_project(
+                        session=session,
+                        project_name=project_name,
+                        project_description=project_description,
+                        project_is_component=project_is_component,
+                        updated_at_datetime=updated_at_datetime,
+                        project_data=project_data,
+                        project_icon=project_icon,
+                        project_icon_bg_color=project_icon_bg_color,
+                        project_gradient=project_gradient,
+                        project_tags=project_tags,
+                        new_folder_id=new_folder.id,
+                    )
+            digests[project_name] = digest
+            synced += 1
+        if do_create:
+            for flow_name, flow in existing_flows.items():
+                if flow_name not in digests:
+                    logger.info(f"Deleting starter project {flow_name}")
+                    await session.delete(flow)
+    # Saved once the projects are committed, a failed sync must be retried on the next start
+    if digests != previous_digests:
+        await save_starter_project_digests(digests)
+    logger.debug(f"Synced {synced} of {len(digests)} starter projects")
 
 
 async def initialize_super_user_if_needed() -> None:
@@ -0,0 +1,220 @@
+"""A persisted index of the component templates found in the components paths.
+
+Building the types dict imports and templates every component file, which dominates the start-up
+time of each worker. The index keeps the templates built from each file together with the file's
+modification time, size and content hash in the config directory. On the next start only the
+files that changed are built again, unless Langflow itself or its bundled components changed, and
+workers that start together wait for the first one to write the index instead of all building it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import orjson
+from filelock import FileLock, Timeout
+from loguru import logger
+
+from langflow.custom.directory_reader.utils import (
+    abuild_file_menus_in_processes,
+    build_invalid_menu,
+    build_valid_menu,
+    load_files_from_path,
+    merge_file_menus,
+    merge_nested_dicts_with_renaming,
+)
+
+INDEX_FILE_NAME = "component_index.json"
+INDEX_VERSION = 1
+"""Bump whenever the layout of the index file changes."""
+INDEX_LOCK_TIMEOUT = 300
+TEMPLATE_ENV_VARS = ("ASTRA_ENHANCED",)
+"""Environment variables that bundled components read while building their templates."""
+
+_LANGFLOW_ROOT = Path(__file__).resolve().parent.parent
+
+
+def get_environment_fingerprint() -> str:
+    """Returns a hash of everything besides the component files that shapes the templates.
+
+    Templates are generated by Langflow's own modules (inputs, frontend nodes, base classes), so
+    any change to them, including an upgrade, invalidates the whole index. The bundled components
+    import each other (the Agent embeds the inputs of the Message History component, for example),
+    so they are fingerprinted as a whole, as are the environment variables their templates read.
+    Whether a component file loads, and the template it builds, also depend on the packages it
+    imports, so installing, removing or upgrading any distribution invalidates the index too.
+    """
+    from langflow.utils.version import get_version_info
+
+    hasher = hashlib.sha256()
+    hasher.update(f"{INDEX_VERSION}:{sys.version}:{get_version_info()['version']}".encode())
+    hasher.update("\n".join(_list_distributions()).encode())
+    hasher.update(orjson.dumps({name: os.environ.get(name) for name in TEMPLATE_ENV_VARS}))
+    for path in sorted(_LANGFLOW_ROOT.rglob("*.py")):
+        stat = path.stat()
+        hasher.update(f"{path.relative_to(_LANGFLOW_ROOT)}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return hasher.hexdigest()
+
+
+def _list_distributions() -> list[str]:
+    # The metadata directories of the installed distributions are named after their name and version, listing
+    # them is much faster than reading the metadata of every distribution through importlib.metadata
+    names: set[str] = set()
+    for entry in sys.path:
+        path = Path(entry or ".")
+        if path.is_dir():
+            names.update(child.name for child in path.iterdir() if child.suffix in {".dist-info", ".egg-info"})
+    return sorted(names)
+
+
+def _list_files(path: str) -> list[str]:
+    return load_files_from_path(path) if Path(path).exists() else []
+
+
+def _stat_file(file_path: str) -> dict[str, int]:
+    stat = Path(file_path).stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _hash_file(file_path: str) -> str:
+    return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+
+
+def _read_index(index_path: Path) -> dict[str, Any] | None:
+    try:
+        index = orjson.loads(index_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError):
+        logger.warning(f"Ignoring unreadable component index {index_path}")
+        return None
+    return index if isinstance(index, dict) and index.get("version") == INDEX_VERSION else None
+
+
+def _write_index(index_path: Path, index: dict[str, Any]) -> None:
+    try:
+        payload = orjson.dumps(index, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        logger.opt(exception=True).warning("Component templates are not serializable, the index is not saved")
+        return
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix(".tmp")
+    tmp_path.write_bytes(payload)
+    # Readers never see a partially written index
+    tmp_path.replace(index_path)
+
+
+async def abuild_file_entry(path: str, file_path: str) -> dict[str, Any]:
+    """Builds the menus contributed by a single component file."""
+    from langflow.custom.directory_reader import DirectoryReader
+    from langflow.custom.directory_reader.utils import abuild_and_validate_all_files
+
+    reader = DirectoryReader(path, compress_code_field=False)
+    valid_components, invalid_components = await abuild_and_validate_all_files(reader, [file_path])
+    return {"valid": build_valid_menu(valid_components), "invalid": build_invalid_menu(invalid_components)}
+
+
+def assemble_types_dict(components_paths: list[str], files_by_path: dict[str, list[str]], entries: dict) -> dict:
+    """Merges the entries of every file the same way the paths are built from scratch."""
+    types_dict: dict = {}
+    for path in components_paths:
+        path_dict = merge_file_menus([entries[file_path] for file_path in files_by_path.get(path, [])])
+        if path_dict:
+            category = next(iter(path_dict))
+            logger.info(f"Loading {len(path_dict[category])} component(s) from category {category}")
+            types_dict = merge_nested_dicts_with_renaming(types_dict, path_dict)
+    return types_dict
+
+
+class ComponentIndex:
+    """Builds the types dict from the persisted index, rebuilding only the files that changed."""
+
+    def __init__(self, index_path: Path, *, max_workers: int = 0) -> None:
+        self.index_path = index_path
+        self.max_workers = max_workers
+        self.lock_path = index_path.with_suffix(".lock")
+        self.reused = 0
+        self.rebuilt = 0
+
+    async def aget_types_dict(self, components_paths: list[str]) -> dict:
+        # Acquired and released from different worker threads
+        lock = FileLock(self.lock_path, timeout=INDEX_LOCK_TIMEOUT, thread_local=False)
+        await asyncio.to_thread(self.lock_path.parent.mkdir, parents=True, exist_ok=True)
+        try:
+            await asyncio.to_thread(lock.acquire)
+        except Timeout:
+            logger.warning("Timed out waiting for another worker to build the component index")
+            return await self._abuild(components_paths, save=False)
+        try:
+            return await self._abuild(components_paths, save=True)
+        finally:
+            await asyncio.to_thread(lock.release)
+
+    async def _abuild(self, components_paths: list[str], *, save: bool) -> dict:
+        paths = list(dict.fromkeys(str(path) for path in components_paths))
+        fingerprint, index = await asyncio.gather(
+            asyncio.to_thread(get_environment_fingerprint), asyncio.to_thread(_read_index, self.index_path)
+        )
+        if index is None or index.get("fingerprint") != fingerprint:
+            index = {"files": {}}
+        previous_files: dict[str, dict[str, Any]] = index["files"]
+
+        files_by_path: dict[str, list[str]] = {}
+        for path in paths:
+            files_by_path[path] = await asyncio.to_thread(_list_files, path)
+
+        files: dict[str, dict[str, Any]] = {}
+        to_build: list[tuple[str, str, dict[str, Any]]] = []
+        for path, file_paths in files_by_path.items():
+            for file_path in file_paths:
+                key = f"{path}::{file_path}"
+                stat = await asyncio.to_thread(_stat_file, file_path)
+                previous = previous_files.get(key)
+                unchanged = previous is not None and (previous["mtime_ns"], previous["size"]) == (
+                    stat["mtime_ns"],
+                    stat["size"],
+                )
+                if unchanged:
+                    files[key] = previous
+                    continue
+                file_hash = await asyncio.to_thread(_hash_file, file_path)
+                if previous is not None and previous["sha256"] == file_hash:
+                    # Touched but not modified, e.g. by a checkout
+                    files[key] = {**previous, **stat}
+                    continue
+                to_build.append((path, file_path, {**stat, "sha256": file_hash}))
+        metadata_by_file = {file_path: metadata for _, file_path, metadata in to_build}
+
+        built = await self._abuild_entries([(path, file_path) for path, file_path, _ in to_build])
+        for path, file_path, entry in built:
+            files[f"{path}::{file_path}"] = {**metadata_by_file[file_path], "entry": entry}
+        self.rebuilt = len(to_build)
+        self.reused = len(files) - self.rebuilt
+        logger.debug(f"Component index: reused {self.reused} file(s), rebuilt {self.rebuilt} file(s)")
+
+        if save and (to_build or len(files) != len(previous_files)):
+            await asyncio.to_thread(
+                _write_index, self.index_path, {"version": INDEX_VERSION, "fingerprint": fingerprint, "files": files}
+            )
+
+        entries = {
+            file_path: files[f"{path}::{file_path}"]["entry"] for path in paths for file_path in files_by_path[path]
+        }
+        return assemble_types_dict(paths, files_by_path, entries)
+
+    async def _abuild_entries(self, files: list[tuple[str, str]]) -> list[tuple[str, str, dict[str, Any]]]:
+        if self.max_workers <= 0 or len(files) < 2:  # noqa: PLR2004
+            return [(path, file_path, await abuild_file_entry(path, file_path)) for path, file_path in files]
+        file_paths_by_path: dict[str, list[str]] = {}
+        for path, file_path in files:
+            file_paths_by_path.setdefault(path, []).append(file_path)
+        entries = []
+        for path, file_paths in file_paths_by_path.items():
+            file_menus = await abuild_file_menus_in_processes(path, file_paths, max_workers=self.max_workers)
+            entries.extend((path, file_path, menus) for file_path, menus in zip(file_paths, file_menus, strict=True))
+        return entries
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -7,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.custom.utils import abuild_custom_components
+from langflow.interface.component_index import INDEX_FILE_NAME, ComponentIndex
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
@@ -30,13 +32,22 @@ async def get_and_cache_all_types_dict(
     if component_cache.all_types_dict is None:
         logger.debug("Building langchain types dict")
 
-        if settings_service.settings.lazy_load_components:
+        settings = settings_service.settings
+        index_path = get_component_index_path(settings_service)
+        if index_path is not None and (not settings.lazy_load_components or await asyncio.to_thread(index_path.exists)):
+            # Full templates from the index, only the files that changed since it was written are built
+            logger.debug(f"Using component index {index_path}")
+            index = ComponentIndex(index_path, max_workers=settings.component_build_workers)
+            component_cache.all_types_dict = await index.aget_types_dict(settings.components_path)
+        elif settings.lazy_load_components:
             # Partial loading mode - just load component metadata
             logger.debug("Using partial component loading")
-            component_cache.all_types_dict = await aget_component_metadata(settings_service.settings.components_path)
+            component_cache.all_types_dict = await aget_component_metadata(settings.components_path)
         else:
             # Traditional full loading
-            component_cache.all_types_dict = await aget_all_types_dict(settings_service.settings.components_path)
+            component_cache.all_types_dict = await aget_all_types_dict(
+                settings.components_path, max_workers=settings.component_build_workers
+            )
 
         # Log loading stats
         component_count = sum(len(comps) for comps in component_cache.all_types_dict.get("components", {}).values())
@@ -45,9 +56,17 @@ async def get_and_cache_all_types_dict(
     return component_cache.all_types_dict
 
 
-async def aget_all_types_dict(components_paths: list[str]):
+def get_component_index_path(settings_service: SettingsService) -> Path | None:
+    """Returns where the component index is stored, or None if it is disabled."""
+    settings = settings_service.settings
+    if not settings.cache_component_index or not settings.config_dir:
+        return None
+    return Path(settings.config_dir) / INDEX_FILE_NAME
+
+
+async def aget_all_types_dict(components_paths: list[str], *, max_workers: int = 0):
     """Get all types dictionary with full component loading."""
-    return await abuild_custom_components(components_paths=components_paths)
+    return await abuild_custom_components(components_paths=components_paths, max_workers=max_workers)
 
 
 async def aget_component_metadata(components_paths: list[str]):
@@ -1,9 +1,12 @@
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import sys
-from collections import deque
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator
 from pathlib import Path
 from threading import Lock, Semaphore
 from typing import TypedDict
@@ -26,6 +29,19 @@ DEFAULT_LOG_FORMAT = (
 )
 
 
+class _TimestampIndex:
+    """Read-only view of the monotonic timestamps of a `SizedLogBuffer`, in order, for `bisect`."""
+
+    def __init__(self, buffer: "SizedLogBuffer"):
+        self._buffer = buffer
+
+    def __getitem__(self, position: int) -> int:
+        return self._buffer._index[self._buffer._slot(position)]
+
+    def __len__(self) -> int:
+        return self._buffer._count
+
+
 class SizedLogBuffer:
     def __init__(
         self,
@@ -35,8 +51,19 @@ class SizedLogBuffer:
 
         The buffer can be overwritten by an env variable LANGFLOW_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
+
+        Messages are stored in a ring of preallocated slots. Each message gets a sequence number, used by the
+        live tail to resume where it stopped, and the running maximum of the timestamps is kept next to it, so
+        that lookups by timestamp are binary searches even if messages logged by different threads arrive
+        slightly out of order.
         """
-        self.buffer: deque = deque()
+        self._timestamps: array = array("q")
+        self._index: array = array("q")
+        self._texts: list[str | None] = []
+        self._start = 0
+        self._count = 0
+        self._next_sequence = 0
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
 
         self._max_readers = max_readers
         self._wlock = Lock()
@@ -47,65 +74,144 @@ class SizedLogBuffer:
         return self._wlock
 
     def write(self, message: str) -> None:
-        record = json.loads(message)
-        log_entry = record["text"]
-        epoch = int(record["record"]["time"]["timestamp"] * 1000)
+        """Sink for the logger, with messages formatted as text.
+
+        Messages serialized as JSON by the logger are still accepted, but cost a round trip through JSON.
+        """
+        record = getattr(message, "record", None)
+        if record is not None:
+            log_entry = str(message)
+            epoch = int(record["time"].timestamp() * 1000)
+        else:
+            serialized = json.loads(message)
+            log_entry = serialized["text"]
+            epoch = int(serialized["record"]["time"]["timestamp"] * 1000)
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
-            self.buffer.append((epoch, log_entry))
+            self._append(epoch, log_entry)
+            waiters = list(self._waiters) if self._waiters else None
+        if waiters:
+            for loop, event in waiters:
+                with contextlib.suppress(RuntimeError):
+                    loop.call_soon_threadsafe(event.set)
+
+    def _append(self, epoch: int, log_entry: str) -> None:
+        size = self.max
+        if size != len(self._texts):
+            self._resize(size)
+        if size <= 0:
+            return
+        last_index = self._index[self._slot(self._count - 1)] if self._count else epoch
+        if self._count == size:
+            self._start = (self._start + 1) % size
+            self._count -= 1
+        slot = self._slot(self._count)
+        self._timestamps[slot] = epoch
+        self._index[slot] = max(epoch, last_index)
+        self._texts[slot] = log_entry
+        self._count += 1
+        self._next_sequence += 1
+
+    def _resize(self, size: int) -> None:
+        # Keeps the most recent messages that fit in the new size
+        entries = self._entries(max(self._count - size, 0), self._count, with_index=True)
+        self._timestamps = array("q", bytes(8 * size))
+        self._index = array("q", bytes(8 * size))
+        self._texts = [None] * size
+        self._start = 0
+        self._count = len(entries)
+        for slot, (epoch, index, log_entry) in enumerate(entries):
+            self._timestamps[slot] = epoch
+            self._index[slot] = index
+            self._texts[slot] = log_entry
+
+    def _slot(self, position: int) -> int:
+        return (self._start + position) % len(self._texts)
+
+    def _entries(self, first: int, last: int, *, with_index: bool = False) -> list:
+        entries = []
+        for position in range(first, last):
+            slot = self._slot(position)
+            if with_index:
+                entries.append((self._timestamps[slot], self._index[slot], self._texts[slot]))
+            else:
+                entries.append((self._timestamps[slot], self._texts[slot]))
+        return entries
+
+    def _position(self, timestamp: int) -> int:
+        """Position of the first message logged at or after the timestamp."""
+        return bisect_left(_TimestampIndex(self), timestamp, 0, self._count)
+
+    @property
+    def buffer(self) -> list[tuple[int, str]]:
+        """A copy of the messages of the buffer, as (timestamp, text) tuples from the oldest to the newest."""
+        with self._wlock:
+            return self._entries(0, self._count)
 
     def __len__(self) -> int:
-        return len(self.buffer)
+        return self._count
 
     def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
-        rc = {}
-
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
+                first = self._position(timestamp)
+                return dict(self._entries(first, min(first + max(lines, 0), self._count)))
         finally:
             self._rsemaphore.release()
 
-        return rc
-
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
+                last = self._position(timestamp)
+                if last < self._count:
+                    return dict(self._entries(max(last - lines, 0), last))
         finally:
             self._rsemaphore.release()
+        return self.get_last_n(lines)
 
     def get_last_n(self, last_idx: int) -> dict[int, str]:
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
+                first = max(self._count - last_idx, 0) if last_idx > 0 else 0
+                return dict(self._entries(first, self._count))
         finally:
             self._rsemaphore.release()
 
+    @property
+    def next_sequence(self) -> int:
+        """The sequence number the next message will get."""
+        return self._next_sequence
+
+    def sequence_at(self, timestamp: int) -> int:
+        """The sequence number of the first message logged at or after the timestamp."""
+        with self._wlock:
+            return self._next_sequence - self._count + self._position(timestamp)
+
+    def read_from(self, sequence: int, limit: int = 1000) -> tuple[list[tuple[int, str]], int]:
+        """Returns up to `limit` messages from a sequence number, and the sequence number to read from next.
+
+        Messages that were overwritten since `sequence` was returned are skipped.
+        """
+        with self._wlock:
+            first_sequence = self._next_sequence - self._count
+            first = max(sequence - first_sequence, 0)
+            last = min(first + limit, self._count)
+            return self._entries(first, last), first_sequence + last
+
+    @contextlib.contextmanager
+    def subscribe(self) -> Iterator[asyncio.Event]:
+        """Yields an event set in the running event loop whenever a message is written."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._wlock:
+            self._waiters.add(waiter)
+        try:
+            yield waiter[1]
+        finally:
+            with self._wlock:
+                self._waiters.discard(waiter)
+
     @property
     def max(self) -> int:
         # Get it dynamically to allow for env variable changes
@@ -263,7 +369,7 @@ def configure(
             logger.exception("Error setting up log file")
 
     if log_buffer.enabled():
-        logger.add(sink=log_buffer.write, format="{time} {level} {message}", serialize=True)
+        logger.add(sink=log_buffer.write, format="{time} {level} {message}")
 
     logger.debug(f"Logger set up with log level: {log_level}")
 
@@ -24,6 +24,7 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 
 from langflow.api import health_check_router, log_router, router
 from langflow.api.v1.mcp_projects import init_mcp_servers
+from langflow.base.mcp.util import get_mcp_session_pool
 from langflow.initial_setup.setup import (
     create_or_update_starter_projects,
     initialize_super_user_if_needed,
@@ -34,8 +35,9 @@ from langflow.initial_setup.setup import (
 from langflow.interface.components import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
 from langflow.logging.logger import configure
-from langflow.middleware import ContentSizeLimitMiddleware
+from langflow.middleware import ContentSizeLimitMiddleware, RequestCancelledMiddleware
 from langflow.services.deps import (
+    get_build_log_service,
     get_queue_service,
     get_settings_service,
     get_telemetry_service,
@@ -53,32 +55,6 @@ _tasks: list[asyncio.Task] = []
 MAX_PORT = 65535
 
 
-class RequestCancelledMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app) -> None:
-        super().__init__(app)
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        sentinel = object()
-
-        async def cancel_handler():
-            while True:
-                if await request.is_disconnected():
-                    return sentinel
-                await asyncio.sleep(0.1)
-
-        handler_task = asyncio.create_task(call_next(request))
-        cancel_task = asyncio.create_task(cancel_handler())
-
-        done, pending = await asyncio.wait([handler_task, cancel_task], return_when=asyncio.FIRST_COMPLETED)
-
-        for task in pending:
-            task.cancel()
-
-        if cancel_task in done:
-            return Response("Request was cancelled", status_code=499)
-        return await handler_task
-
-
 class JavaScriptMIMETypeMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         try:
@@ -161,6 +137,7 @@ def get_lifespan(*, fix_migration=False, version=None):
             logger.debug("Starting telemetry service")
             telemetry_service.start()
             logger.debug(f"started telemetry service in {asyncio.get_event_loop().time() - current_time:.2f}s")
+            get_build_log_service().start()
 
             current_time = asyncio.get_event_loop().time()
             logger.debug("Loading flows")
@@ -174,6 +151,7 @@ def get_lifespan(*, fix_migration=False, version=None):
             current_time = asyncio.get_event_loop().time()
             logger.debug("Loading mcp servers for projects")
             await init_mcp_servers()
+            get_mcp_session_pool().start()
             logger.debug(f"mcp servers loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             total_time = asyncio.get_event_loop().time() - start_time
@@ -190,6 +168,7 @@ def get_lifespan(*, fix_migration=False, version=None):
             if sync_flows_from_fs_task:
                 sync_flows_from_fs_task.cancel()
                 await asyncio.wait([sync_flows_from_fs_task])
+            await get_mcp_session_pool().close_all()
             await teardown_services()
 
             await asyncio.sleep(0.1)  # let logger flush async logs
@@ -277,6 +256,10 @@ def create_app():
         return await call_next(request)
 
     settings = get_settings_service().settings
+    if settings.cancel_requests_on_disconnect:
+        # Added last so that it wraps the other middlewares, which are cancelled along with the endpoint
+        app.add_middleware(RequestCancelledMiddleware)
+
     if prome_port_str := os.environ.get("LANGFLOW_PROMETHEUS_PORT"):
         # set here for create_app() entry point
         prome_port = int(prome_port_str)
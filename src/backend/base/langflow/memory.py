@@ -1,20 +1,240 @@
 import asyncio
+import bisect
 import json
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID
 
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
 from sqlalchemy import delete
-from sqlmodel import col, select
+from sqlmodel import col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
+from langflow.services.database.models.message.crud import get_messages_query
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.utils.async_helpers import run_until_complete
 
+HistoryKey = tuple[str | None, str]
+
+
+def _timestamp_key(row: dict[str, Any]) -> datetime:
+    timestamp = row["timestamp"]
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+class SessionHistoryCache:
+    """An LRU cache of the chat history of the most recently used sessions.
+
+    Memory components read the whole history of a session on every turn, although the only
+    new messages are usually the ones this process has just stored. Each entry holds the
+    non-error messages of a (flow_id, session_id) pair as plain rows in ascending timestamp
+    order, where a flow_id of None stands for every flow. Messages added, updated or deleted
+    through this module are written through to the cached entries, and the monitor endpoints
+    invalidate the sessions they modify.
+
+    The cache is process-local, so it must only be enabled when a single process, one worker of
+    one replica, writes messages.
+    """
+
+    def __init__(self, max_sessions: int = 1000, max_messages: int = 1000) -> None:
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self._entries: OrderedDict[HistoryKey, list[dict[str, Any]]] = OrderedDict()
+        self._keys_by_message: dict[str, set[HistoryKey]] = {}
+        # The generation grows on every load and every write to a session that is being loaded, so a load
+        # is stale if its session was written at a later generation than the one it started at
+        self._generation = 0
+        self._loads_in_flight: dict[str, int] = {}
+        self._written_at: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_sessions > 0 and self.max_messages > 0
+
+    @staticmethod
+    def build_key(flow_id: str | UUID | None, session_id: str | UUID) -> HistoryKey:
+        return (str(flow_id) if flow_id else None, str(session_id))
+
+    def get(self, flow_id: str | UUID | None, session_id: str | UUID) -> list[dict[str, Any]] | None:
+        """Returns a copy of the cached history of a session, oldest message first."""
+        key = self.build_key(flow_id, session_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry)
+
+    def start_load(self, session_id: str | UUID) -> int:
+        """Marks the history of a session as being loaded. Pass the returned token to `set`, then call `end_load`."""
+        session_id = str(session_id)
+        with self._lock:
+            self._loads_in_flight[session_id] = self._loads_in_flight.get(session_id, 0) + 1
+            self._generation += 1
+            return self._generation
+
+    def end_load(self, session_id: str | UUID) -> None:
+        """Forgets a load of the history of a session, whether it was cached or not."""
+        session_id = str(session_id)
+        with self._lock:
+            loads = self._loads_in_flight.get(session_id, 0) - 1
+            if loads > 0:
+                self._loads_in_flight[session_id] = loads
+            else:
+                # Loads started from now on get a later generation than any write seen so far
+                self._loads_in_flight.pop(session_id, None)
+                self._written_at.pop(session_id, None)
+
+    def set(self, flow_id: str | UUID | None, session_id: str | UUID, rows: list[dict[str, Any]], token: int) -> bool:
+        """Caches the history loaded since `start_load`, unless the session was written in the meantime."""
+        key = self.build_key(flow_id, session_id)
+        with self._lock:
+            if self._written_at.get(key[1], 0) > token or len(rows) > self.max_messages:
+                return False
+            self._remove_entry(key)
+            self._entries[key] = sorted(rows, key=_timestamp_key)
+            for row in rows:
+                self._keys_by_message.setdefault(str(row["id"]), set()).add(key)
+            while len(self._entries) > self.max_sessions:
+                self._remove_entry(next(iter(self._entries)))
+            return True
+
+    def add(self, rows: list[dict[str, Any]]) -> None:
+        """Writes newly stored messages through to the cached histories they belong to."""
+        with self._lock:
+            for row in rows:
+                self._insert(row)
+
+    def update(self, rows: list[dict[str, Any]]) -> None:
+        """Writes updated messages through, moving them if their session changed."""
+        with self._lock:
+            for row in rows:
+                self._discard(str(row["id"]))
+                self._insert(row)
+
+    def discard_messages(self, message_ids: Sequence[str | UUID]) -> None:
+        with self._lock:
+            for message_id in message_ids:
+                self._discard(str(message_id))
+
+    def invalidate_session(self, session_id: str | UUID) -> None:
+        session_id = str(session_id)
+        with self._lock:
+            self._mark_written(session_id)
+            for key in [key for key in self._entries if key[1] == session_id]:
+                self._remove_entry(key)
+
+    def invalidate_flow(self, flow_id: str | UUID) -> None:
+        flow_id = str(flow_id)
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if key[0] == flow_id or any(str(row.get("flow_id")) == flow_id for row in entry):
+                    self._mark_written(key[1])
+                    self._remove_entry(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_message.clear()
+            for session_id in self._loads_in_flight:
+                self._mark_written(session_id)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "sessions": len(self._entries),
+                "messages": sum(len(entry) for entry in self._entries.values()),
+                "max_sessions": self.max_sessions,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _mark_written(self, session_id: str) -> None:
+        if session_id in self._loads_in_flight:
+            self._generation += 1
+            self._written_at[session_id] = self._generation
+
+    def _insert(self, row: dict[str, Any]) -> None:
+        session_id = str(row["session_id"])
+        self._mark_written(session_id)
+        if row.get("error"):
+            return
+        for key in {self.build_key(row.get("flow_id"), session_id), self.build_key(None, session_id)}:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            if len(entry) >= self.max_messages:
+                self._remove_entry(key)
+                continue
+            # Messages with the same timestamp keep their insertion order, as in the database
+            entry.insert(bisect.bisect_right(entry, _timestamp_key(row), key=_timestamp_key), row)
+            self._keys_by_message.setdefault(str(row["id"]), set()).add(key)
+
+    def _discard(self, message_id: str) -> None:
+        for key in self._keys_by_message.pop(message_id, set()):
+            self._mark_written(key[1])
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[:] = [row for row in entry if str(row["id"]) != message_id]
+
+    def _remove_entry(self, key: HistoryKey) -> None:
+        entry = self._entries.pop(key, None)
+        for row in entry or []:
+            keys = self._keys_by_message.get(str(row["id"]))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_message[str(row["id"])]
+
+
+_session_history_cache: SessionHistoryCache | None = None
+
+
+def get_session_history_cache() -> SessionHistoryCache:
+    """Returns the process-wide session history cache, sized from the settings."""
+    global _session_history_cache  # noqa: PLW0603
+    if _session_history_cache is None:
+        settings = get_settings_service().settings
+        # Other workers would write messages this process never sees
+        max_sessions = settings.message_history_cache_size if settings.workers <= 1 else 0
+        _session_history_cache = SessionHistoryCache(
+            max_sessions=max_sessions, max_messages=settings.message_history_cache_max_messages
+        )
+    return _session_history_cache
+
+
+def _filter_history(
+    rows: list[dict[str, Any]],
+    sender: str | None,
+    sender_name: str | None,
+    order: str | None,
+    limit: int | None,
+) -> list[dict[str, Any]]:
+    if sender:
+        rows = [row for row in rows if row["sender"] == sender]
+    if sender_name:
+        rows = [row for row in rows if row["sender_name"] == sender_name]
+    if order == "DESC":
+        # sorted is stable, so messages with the same timestamp stay in insertion order like in the database
+        rows = sorted(rows, key=_timestamp_key, reverse=True)
+    return rows[:limit] if limit else rows
+
 
 def _get_variable_query(
     sender: str | None = None,
@@ -24,22 +244,19 @@ def _get_variable_query(
     order: str | None = "DESC",
     flow_id: UUID | None = None,
     limit: int | None = None,
+    after: UUID | str | None = None,
 ):
-    stmt = select(MessageTable).where(MessageTable.error == False)  # noqa: E712
-    if sender:
-        stmt = stmt.where(MessageTable.sender == sender)
-    if sender_name:
-        stmt = stmt.where(MessageTable.sender_name == sender_name)
-    if session_id:
-        stmt = stmt.where(MessageTable.session_id == session_id)
-    if flow_id:
-        stmt = stmt.where(MessageTable.flow_id == flow_id)
-    if order_by:
-        col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
-        stmt = stmt.order_by(col)
-    if limit:
-        stmt = stmt.limit(limit)
-    return stmt
+    return get_messages_query(
+        sender=sender,
+        sender_name=sender_name,
+        session_id=session_id,
+        flow_id=flow_id,
+        order_by=order_by,
+        order=order,
+        limit=limit,
+        after=after,
+        exclude_errors=True,
+    )
 
 
 def get_messages(
@@ -78,6 +295,7 @@ async def aget_messages(
     order: str | None = "DESC",
     flow_id: UUID | None = None,
     limit: int | None = None,
+    after: UUID | str | None = None,
 ) -> list[Message]:
     """Retrieves messages from the monitor service based on the provided filters.
 
@@ -89,14 +307,35 @@ async def aget_messages(
         order (Optional[str]): The order in which to retrieve the messages. Defaults to "DESC".
         flow_id (Optional[UUID]): The flow ID associated with the messages.
         limit (Optional[int]): The maximum number of messages to retrieve.
+        after (Optional[UUID]): The ID of the last message of the previous page. Only the messages
+            that come after it in the requested order are retrieved.
 
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
+    cache = get_session_history_cache()
+    if cache.enabled and session_id and order_by == "timestamp" and not after:
+        history = cache.get(flow_id, session_id)
+        if history is None:
+            token = cache.start_load(session_id)
+            try:
+                async with session_scope() as session:
+                    # One row more than the cache holds tells whether the history fits in it
+                    stmt = _get_variable_query(
+                        session_id=session_id, order="ASC", flow_id=flow_id, limit=cache.max_messages + 1
+                    )
+                    history = [row._asdict() for row in await session.exec(stmt)]
+                if not cache.set(flow_id, session_id, history, token) and len(history) > cache.max_messages:
+                    history = None
+            finally:
+                cache.end_load(session_id)
+        if history is not None:
+            return await Message.create_many(_filter_history(history, sender, sender_name, order, limit))
+
     async with session_scope() as session:
-        stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
-        messages = await session.exec(stmt)
-        return [await Message.create(**d.model_dump()) for d in messages]
+        stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit, after)
+        rows = await session.exec(stmt)
+        return await Message.create_many([row._asdict() for row in rows])
 
 
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
@@ -121,7 +360,7 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
         async with session_scope() as session:
             messages_models = await aadd_messagetables(messages_models, session)
-        return [await Message.create(**message.model_dump()) for message in messages_models]
+        return await Message.create_many([message.model_dump() for message in messages_models])
     except Exception as e:
         logger.exception(e)
         raise
@@ -148,7 +387,9 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
                 error_message = f"Message with id {message.id} not found"
                 logger.warning(error_message)
                 raise ValueError(error_message)
-        return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+        updated = [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+        get_session_history_cache().update([message.model_dump() for message in updated])
+        return updated
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
@@ -179,7 +420,9 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         msg.category = msg.category or ""
         new_messages.append(msg)
 
-    return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    stored_messages = [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    get_session_history_cache().add([message.model_dump() for message in stored_messages])
+    return stored_messages
 
 
 def delete_messages(session_id: str) -> None:
@@ -206,6 +449,7 @@ async def adelete_messages(session_id: str) -> None:
             .execution_options(synchronize_session="fetch")
         )
         await session.exec(stmt)
+    get_session_history_cache().invalidate_session(session_id)
 
 
 async def delete_message(id_: str) -> None:
@@ -219,6 +463,7 @@ async def delete_message(id_: str) -> None:
         if message:
             await session.delete(message)
             await session.commit()
+    get_session_history_cache().discard_messages([id_])
 
 
 def store_message(
@@ -1,3 +1,6 @@
+import asyncio
+import sys
+
 from fastapi import HTTPException
 from loguru import logger
 
@@ -57,3 +60,63 @@ class ContentSizeLimitMiddleware:
 
         wrapper = self.receive_wrapper(receive)
         await self.app(scope, wrapper, send)
+
+
+class RequestCancelledMiddleware:
+    """Cancels the handling of a request when the client disconnects before the response is complete.
+
+    A single task per request forwards the messages of the client to the application and waits for the next
+    one, so the `http.disconnect` message is noticed as soon as the server delivers it, without polling.
+    The forwarding queue holds one message, so request bodies are still streamed to the application.
+
+    Args:
+      app (ASGI application): ASGI application
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        handler_task = asyncio.current_task()
+        messages: asyncio.Queue[dict] = asyncio.Queue(maxsize=1)
+        response_complete = False
+        cancelled = False
+
+        async def forward_messages():
+            nonlocal cancelled
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    # The server also reports a disconnect once the response is sent, e.g. while
+                    # background tasks run, which must not be cancelled
+                    if not response_complete and handler_task is not None:
+                        cancelled = True
+                        handler_task.cancel()
+                    # Handlers that never read the request leave it in the queue, it is stale now
+                    while not messages.empty():
+                        messages.get_nowait()
+                    messages.put_nowait(message)
+                    return
+                await messages.put(message)
+
+        async def send_wrapper(message):
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        forward_task = asyncio.create_task(forward_messages())
+        try:
+            await self.app(scope, messages.get, send_wrapper)
+        except asyncio.CancelledError:
+            if not cancelled or handler_task is None:
+                raise
+            if sys.version_info >= (3, 11):
+                handler_task.uncancel()
+            logger.debug(f"Client disconnected, cancelled {scope['method']} {scope['path']}")
+        finally:
+            forward_task.cancel()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from loguru import logger
+
+from langflow.graph.graph.utils import find_start_component_id
+from langflow.processing.process import process_tweaks
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.graph.graph.base import Graph
+    from langflow.schema.graph import Tweaks
+    from langflow.services.database.models.flow.model import Flow, FlowRead
+
+
+def hash_tweaks(tweaks: Tweaks | dict[str, Any] | None, *, stream: bool = False) -> str:
+    """Returns a stable hash for the tweaks applied to a flow before it is built."""
+    if tweaks is None:
+        tweaks_dict: dict[str, Any] = {}
+    elif isinstance(tweaks, dict):
+        tweaks_dict = tweaks
+    else:
+        tweaks_dict = tweaks.model_dump()
+    payload = orjson.dumps(
+        {"tweaks": tweaks_dict, "stream": stream},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+class CompiledGraphCache:
+    """An LRU cache of prepared graphs for the run endpoints.
+
+    Building a graph from a flow payload (flattening group nodes, validating edges, resolving
+    vertex classes, instantiating components and sorting the vertices in layers) is repeated on
+    every run even though the flow rarely changes between requests. This cache keeps one
+    template graph per (flow id, flow version, tweaks) and hands out a clone of it for each run,
+    so the template itself is never executed.
+    """
+
+    def __init__(self, max_size: int = 100) -> None:
+        self.max_size = max_size
+        self._templates: OrderedDict[tuple[str, str, str], Graph] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.build_time_total = 0.0
+        self.clone_time_total = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @staticmethod
+    def build_key(flow: Flow | FlowRead, tweaks_hash: str) -> tuple[str, str, str]:
+        version = flow.updated_at.isoformat() if flow.updated_at else ""
+        return str(flow.id), version, tweaks_hash
+
+    def get_graph(
+        self,
+        flow: Flow | FlowRead,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        *,
+        stream: bool = False,
+        user_id: str | None = None,
+    ) -> Graph:
+        """Returns a graph ready to be run for the given flow and tweaks.
+
+        Args:
+            flow: The flow to build the graph from.
+            tweaks: The tweaks to apply to the flow data.
+            stream: Whether the graph will be run in streaming mode.
+            user_id: The ID of the user running the graph.
+
+        Returns:
+            Graph: A graph that is owned by the caller.
+        """
+        if flow.data is None:
+            msg = f"Flow {flow.id} has no data"
+            raise ValueError(msg)
+        if not self.enabled:
+            return self._build_template(flow, tweaks, stream=stream, user_id=user_id)
+
+        key = self.build_key(flow, hash_tweaks(tweaks, stream=stream))
+        flow_id, version, _ = key
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+        if template is None:
+            start_time = time.perf_counter()
+            template = self._build_template(flow, tweaks, stream=stream, user_id=user_id)
+            # Sorting once here means clones reuse the layers instead of sorting on every run
+            template.sort_vertices(start_component_id=find_start_component_id(template._is_input_vertices))
+            build_time = time.perf_counter() - start_time
+            with self._lock:
+                self.misses += 1
+                self.build_time_total += build_time
+                # Older versions of the same flow can never be hit again
+                for stale_key in [k for k in self._templates if k[0] == flow_id and k[1] != version]:
+                    del self._templates[stale_key]
+                self._templates[key] = template
+                while len(self._templates) > self.max_size:
+                    self._templates.popitem(last=False)
+            logger.debug(f"Built graph template for flow {flow_id} in {build_time:.4f}s")
+
+        start_time = time.perf_counter()
+        graph = template.clone(user_id=str(user_id) if user_id is not None else None)
+        if user_id is None:
+            # Templates are shared by every user, the clone must not inherit the user of the template
+            graph.user_id = None
+        with self._lock:
+            self.clone_time_total += time.perf_counter() - start_time
+        return graph
+
+    @staticmethod
+    def _build_template(
+        flow: Flow | FlowRead,
+        tweaks: Tweaks | dict[str, Any] | None,
+        *,
+        stream: bool,
+        user_id: str | None,
+    ) -> Graph:
+        from langflow.graph.graph.base import Graph
+
+        graph_data = copy.deepcopy(flow.data)
+        graph_data = process_tweaks(graph_data, copy.deepcopy(tweaks) if tweaks else {}, stream=stream)
+        return Graph.from_payload(graph_data, flow_id=str(flow.id), user_id=str(user_id), flow_name=flow.name)
+
+    def invalidate(self, flow_id: str | UUID) -> None:
+        """Removes every cached graph of a flow."""
+        flow_id = str(flow_id)
+        with self._lock:
+            stale_keys = [key for key in self._templates if key[0] == flow_id]
+            for key in stale_keys:
+                del self._templates[key]
+            if stale_keys:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._templates),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "build_time_total": self.build_time_total,
+                "avg_build_time": self.build_time_total / self.misses if self.misses else 0.0,
+                "avg_clone_time": self.clone_time_total / lookups if lookups else 0.0,
+            }
+
+
+_compiled_graph_cache: CompiledGraphCache | None = None
+
+
+def get_compiled_graph_cache() -> CompiledGraphCache:
+    """Returns the process-wide compiled graph cache, sized from the settings."""
+    global _compiled_graph_cache  # noqa: PLW0603
+    if _compiled_graph_cache is None:
+        from langflow.services.deps import get_settings_service
+
+        max_size = get_settings_service().settings.run_graph_cache_size
+        _compiled_graph_cache = CompiledGraphCache(max_size=max_size)
+    return _compiled_graph_cache
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+import pandas as pd
+from loguru import logger
+from pydantic import BaseModel
+
+from langflow.schema.data import Data
+from langflow.services.cache.codec import estimate_size
+
+_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _update_with_value(hasher, value: Any) -> bool:
+    """Feeds a value into the hasher, returns False if its content cannot be addressed."""
+    if value is None or isinstance(value, str | int | float | bool):
+        hasher.update(orjson.dumps(value))
+    elif isinstance(value, Data):
+        # Messages are hashed with their session, sender and timestamp, components may copy them into their results
+        hasher.update(orjson.dumps({"data": value.data, "text_key": value.text_key}, option=_JSON_OPTIONS, default=str))
+    elif isinstance(value, pd.DataFrame):
+        hasher.update(orjson.dumps(list(map(str, value.columns))))
+        try:
+            hasher.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        except TypeError:
+            # Cells holding lists or dicts cannot be hashed by pandas
+            hasher.update(orjson.dumps(value.to_dict(orient="split"), option=_JSON_OPTIONS, default=str))
+    elif isinstance(value, BaseModel):
+        hasher.update(orjson.dumps(value.model_dump(mode="json"), option=_JSON_OPTIONS))
+    elif isinstance(value, list | tuple):
+        hasher.update(b"[")
+        for item in value:
+            if not _update_with_value(hasher, item):
+                return False
+            hasher.update(b",")
+        hasher.update(b"]")
+    elif isinstance(value, dict):
+        hasher.update(b"{")
+        for key in sorted(value, key=str):
+            hasher.update(orjson.dumps(str(key)))
+            if not _update_with_value(hasher, value[key]):
+                return False
+        hasher.update(b"}")
+    else:
+        return False
+    return True
+
+
+def fingerprint_value(value: Any) -> str | None:
+    """Returns a hash of the content of a value, or None for opaque objects such as clients."""
+    hasher = hashlib.sha256()
+    try:
+        if not _update_with_value(hasher, value):
+            return None
+    except (TypeError, ValueError, orjson.JSONEncodeError):
+        return None
+    return hasher.hexdigest()
+
+
+class ComponentResultCache:
+    """A content-addressed cache of the results of cacheable components.
+
+    Components that declare `cacheable = True` promise that their outputs only depend on their code
+    and their inputs. Their results are stored under a hash of the component code, the resolved
+    input values and the fingerprints of the upstream components, so the same results are reused
+    across runs, sessions, flows and users. Entries expire after `ttl` seconds and the least
+    recently used entries are evicted once the cached results hold more than `max_bytes` bytes.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: float | None = 3600) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Returns a copy of the cached entry, so callers may mutate the results they get."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and self.ttl is not None and time.monotonic() - item["time"] >= self.ttl:
+                self._pop(key)
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            entry = item["entry"]
+        return copy.deepcopy(entry)
+
+    def set(self, key: str, entry: dict[str, Any]) -> bool:
+        """Stores a copy of the entry, returns False if it cannot be copied or does not fit the budget."""
+        try:
+            entry = copy.deepcopy(entry)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Not caching component results for {key}")
+            return False
+        size = estimate_size(entry)
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            self._pop(key)
+            while self._entries and self.total_bytes + size > self.max_bytes:
+                _, item = self._entries.popitem(last=False)
+                self.total_bytes -= item["size"]
+                self.evictions += 1
+            self._entries[key] = {"entry": entry, "size": size, "time": time.monotonic()}
+            self.total_bytes += size
+            self.stores += 1
+        return True
+
+    def _pop(self, key: str) -> None:
+        if (item := self._entries.pop(key, None)) is not None:
+            self.total_bytes -= item["size"]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+            }
+
+
+_component_result_cache: ComponentResultCache | None = None
+
+
+def get_component_result_cache() -> ComponentResultCache:
+    """Returns the process-wide component result cache, sized from the settings."""
+    global _component_result_cache  # noqa: PLW0603
+    if _component_result_cache is None:
+        from langflow.services.deps import get_settings_service
+
+        settings = get_settings_service().settings
+        _component_result_cache = ComponentResultCache(
+            max_bytes=settings.component_result_cache_max_bytes,
+            ttl=settings.component_result_cache_ttl or None,
+        )
+    return _component_result_cache
@@ -4,7 +4,7 @@ import asyncio
 import json
 import re
 import traceback
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterator, Sequence
 from datetime import datetime, timezone
 from typing import Annotated, Any, Literal
 from uuid import UUID
@@ -276,6 +276,16 @@ class Message(Data):
             return await asyncio.to_thread(cls, **kwargs)
         return cls(**kwargs)
 
+    @classmethod
+    async def create_many(cls, rows: Sequence[dict[str, Any]]) -> list[Message]:
+        """Create a message for each row, switching to a worker thread at most once for the whole batch.
+
+        Only messages that actually have files need the thread, as is_image_file is blocking.
+        """
+        if any(row.get("files") for row in rows):
+            return await asyncio.to_thread(lambda: [cls(**row) for row in rows])
+        return [cls(**row) for row in rows]
+
 
 class DefaultModel(BaseModel):
     class Config:
@@ -3,7 +3,7 @@ import random
 import warnings
 from collections.abc import Coroutine
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Annotated
+from typing import Annotated
 from uuid import UUID
 
 from cryptography.fernet import Fernet
@@ -14,15 +14,12 @@ from loguru import logger
 from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.websockets import WebSocket
 
-from langflow.services.database.models.api_key.crud import check_key
+from langflow.services.database.models.api_key.crud import check_key_cached
 from langflow.services.database.models.user.crud import get_user_by_id, get_user_by_username, update_user_last_login_at
 from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.deps import get_db_service, get_session, get_settings_service
 from langflow.services.settings.service import SettingsService
 
-if TYPE_CHECKING:
-    from langflow.services.database.models.api_key.model import ApiKey
-
 oauth2_login = OAuth2PasswordBearer(tokenUrl="api/v1/login", auto_error=False)
 
 API_KEY_NAME = "x-api-key"
@@ -39,7 +36,7 @@ async def api_key_security(
     header_param: Annotated[str, Security(api_key_header)],
 ) -> UserRead | None:
     settings_service = get_settings_service()
-    result: ApiKey | User | None
+    result: UserRead | User | None
 
     async with get_db_service().with_session() as db:
         if settings_service.auth_settings.AUTO_LOGIN:
@@ -59,7 +56,7 @@ async def api_key_security(
                 stacklevel=2,
             )
             if query_param or header_param:
-                result = await check_key(db, query_param or header_param)
+                result = await check_key_cached(db, query_param or header_param)
             else:
                 result = await get_user_by_username(db, settings_service.auth_settings.SUPERUSER)
 
@@ -70,16 +67,18 @@ async def api_key_security(
             )
 
         elif query_param:
-            result = await check_key(db, query_param)
+            result = await check_key_cached(db, query_param)
 
         else:
-            result = await check_key(db, header_param)
+            result = await check_key_cached(db, header_param)
 
         if not result:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Invalid or missing API key",
             )
+        if isinstance(result, UserRead):
+            return result
         if isinstance(result, User):
             return UserRead.model_validate(result, from_attributes=True)
     msg = "Invalid result type"
@@ -104,7 +103,7 @@ async def ws_api_key_security(
                 stacklevel=2,
             )
             if api_key:
-                result = await check_key(db, api_key)
+                result = await check_key_cached(db, api_key)
             else:
                 result = await get_user_by_username(db, settings.auth_settings.SUPERUSER)
 
@@ -115,7 +114,7 @@ async def ws_api_key_security(
                     code=status.WS_1008_POLICY_VIOLATION,
                     reason="An API key must be passed as query or header",
                 )
-            result = await check_key(db, api_key)
+            result = await check_key_cached(db, api_key)
 
         # key was invalid or missing
         if not result:
@@ -124,6 +123,8 @@ async def ws_api_key_security(
                 reason="Invalid or missing API key",
             )
 
+        if isinstance(result, UserRead):
+            return result
         # convert SQL-model User → pydantic UserRead
         if isinstance(result, User):
             return UserRead.model_validate(result, from_attributes=True)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.build_log.service import BuildLogService
+from langflow.services.factory import ServiceFactory
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class BuildLogServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(BuildLogService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return BuildLogService(settings_service)
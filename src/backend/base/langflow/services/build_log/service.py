@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import log_transactions, prune_transactions
+from langflow.services.database.models.vertex_builds.crud import log_vertex_builds, prune_vertex_builds
+from langflow.services.database.utils import session_getter
+from langflow.services.deps import get_db_service
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from langflow.services.database.models.transactions.model import TransactionBase
+    from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+    from langflow.services.settings.service import SettingsService
+
+
+class BuildLogService(Service):
+    """Write-behind logger for vertex builds and transactions.
+
+    Every built vertex used to open its own database session to insert one row and run the
+    retention deletes. This service buffers the records in memory instead and writes them with
+    a single bulk insert once `build_log_batch_size` records are pending or
+    `build_log_flush_interval` seconds have passed. The retention limits are enforced every
+    `build_log_prune_interval` seconds for the flows and vertices written since the last run.
+
+    While the service is not started, `enqueue_*` return False and callers are expected to write
+    the record themselves.
+    """
+
+    name = "build_log_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.batch_size = settings.build_log_batch_size
+        self.flush_interval = settings.build_log_flush_interval
+        self.prune_interval = settings.build_log_prune_interval
+        self.running = False
+        self.worker_task: asyncio.Task | None = None
+
+        self._vertex_builds: list[VertexBuildBase] = []
+        self._transactions: list[TransactionBase] = []
+        self._vertices_to_prune: set[tuple[UUID, str]] = set()
+        self._flows_to_prune: set[UUID] = set()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._last_prune = time.monotonic()
+
+        self.written = 0
+        self.failed = 0
+        self.flushes = 0
+        self.prunes = 0
+
+    def start(self) -> None:
+        if self.running or self.batch_size <= 0:
+            return
+        self.running = True
+        self._last_prune = time.monotonic()
+        self.worker_task = asyncio.create_task(self._worker())
+
+    def enqueue_vertex_build(self, vertex_build: VertexBuildBase) -> bool:
+        """Buffers a vertex build. Returns False if the service is not running."""
+        if not self.running:
+            return False
+        self._vertex_builds.append(vertex_build)
+        self._vertices_to_prune.add((vertex_build.flow_id, vertex_build.id))
+        self._request_flush_if_full()
+        return True
+
+    def enqueue_transaction(self, transaction: TransactionBase) -> bool:
+        """Buffers a transaction. Returns False if the service is not running."""
+        if not self.running:
+            return False
+        self._transactions.append(transaction)
+        self._flows_to_prune.add(transaction.flow_id)
+        self._request_flush_if_full()
+        return True
+
+    def discard(self, flow_id: UUID) -> None:
+        """Drops the buffered records of a flow, e.g. because the flow was deleted."""
+        self._vertex_builds = [build for build in self._vertex_builds if build.flow_id != flow_id]
+        self._transactions = [transaction for transaction in self._transactions if transaction.flow_id != flow_id]
+        self._vertices_to_prune = {key for key in self._vertices_to_prune if key[0] != flow_id}
+        self._flows_to_prune.discard(flow_id)
+
+    @property
+    def pending(self) -> int:
+        return len(self._vertex_builds) + len(self._transactions)
+
+    def _request_flush_if_full(self) -> None:
+        if self.pending >= self.batch_size:
+            self._flush_requested.set()
+
+    async def _worker(self) -> None:
+        while self.running:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+                if time.monotonic() - self._last_prune >= self.prune_interval:
+                    await self.prune()
+            except Exception:  # noqa: BLE001
+                logger.exception("Error in build log worker")
+
+    async def flush(self) -> None:
+        """Writes every buffered record to the database."""
+        async with self._flush_lock:
+            vertex_builds, self._vertex_builds = self._vertex_builds, []
+            transactions, self._transactions = self._transactions, []
+            if not vertex_builds and not transactions:
+                return
+            if vertex_builds:
+                self.written += await self._write(log_vertex_builds, vertex_builds, "vertex builds")
+            if transactions:
+                self.written += await self._write(log_transactions, transactions, "transactions")
+            self.flushes += 1
+
+    async def _write(
+        self,
+        write: Callable[[AsyncSession, list[Any]], Awaitable[Any]],
+        records: list[Any],
+        kind: str,
+    ) -> int:
+        try:
+            async with session_getter(get_db_service()) as session:
+                await write(session, records)
+        except Exception:  # noqa: BLE001
+            if len(records) == 1:
+                self.failed += 1
+                logger.exception(f"Error logging {kind}")
+                return 0
+            # A single bad record should not take the rest of the batch with it
+            logger.warning(f"Bulk insert of {len(records)} {kind} failed, retrying one at a time")
+            written = 0
+            for record in records:
+                written += await self._write(write, [record], kind)
+            return written
+        logger.debug(f"Logged {len(records)} {kind}")
+        return len(records)
+
+    async def prune(self) -> None:
+        """Enforces the retention limits for the flows and vertices written since the last run."""
+        self._last_prune = time.monotonic()
+        vertex_keys, self._vertices_to_prune = self._vertices_to_prune, set()
+        flow_ids, self._flows_to_prune = self._flows_to_prune, set()
+        if not vertex_keys and not flow_ids:
+            return
+        try:
+            async with session_getter(get_db_service()) as session:
+                if vertex_keys:
+                    await prune_vertex_builds(session, vertex_keys)
+                if flow_ids:
+                    await prune_transactions(session, flow_ids)
+        except Exception:  # noqa: BLE001
+            logger.exception("Error pruning vertex builds and transactions")
+            return
+        self.prunes += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "pending": self.pending,
+            "written": self.written,
+            "failed": self.failed,
+            "flushes": self.flushes,
+            "prunes": self.prunes,
+        }
+
+    async def stop(self) -> None:
+        self.running = False
+        if self.worker_task:
+            # Wake the worker up so it finishes its current flush and leaves the loop
+            self._flush_requested.set()
+            await self.worker_task
+            self.worker_task = None
+        await self.flush()
+        await self.prune()
+
+    async def teardown(self) -> None:
+        await self.stop()
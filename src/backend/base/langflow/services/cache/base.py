@@ -13,6 +13,8 @@ class CacheService(Service, Generic[LockType]):
     """Abstract base class for a cache."""
 
     name = "cache_service"
+    stores_references = False
+    """Whether values are kept in this process by reference instead of being serialized."""
 
     @abc.abstractmethod
     def get(self, key, lock: LockType | None = None):
@@ -111,6 +113,8 @@ class AsyncBaseCacheService(Service, Generic[AsyncLockType]):
     """Abstract base class for a async cache."""
 
     name = "cache_service"
+    stores_references = False
+    """Whether values are kept in this process by reference instead of being serialized."""
 
     @abc.abstractmethod
     async def get(self, key, lock: AsyncLockType | None = None):
@@ -1,5 +1,4 @@
 import asyncio
-import pickle
 import time
 from typing import Generic
 
@@ -7,12 +6,15 @@ from diskcache import Cache
 from loguru import logger
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.codec import CodecError, decode_payload, encode_payload
 from langflow.services.cache.utils import CACHE_MISS
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
-        self.cache = Cache(cache_dir)
+    def __init__(self, cache_dir, max_size=None, expiration_time=3600, max_bytes=None) -> None:
+        # diskcache keeps the directory under `size_limit` bytes by culling the least recently used items
+        settings = {"size_limit": max_bytes, "eviction_policy": "least-recently-used"} if max_bytes else {}
+        self.cache = Cache(cache_dir, **settings)
         # Let's clear the cache for now to maintain a similar
         # behavior as the in-memory cache
         # Later we should implement endpoints for the frontend to grab
@@ -22,6 +24,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         self.lock = asyncio.Lock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.max_bytes = max_bytes
 
     async def get(self, key, lock: asyncio.Lock | None = None):
         if not lock:
@@ -35,7 +38,12 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         if item:
             if time.time() - item["time"] < self.expiration_time:
                 self.cache.touch(key)  # Refresh the expiry time
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+                try:
+                    return decode_payload(item["value"])
+                except CodecError:
+                    logger.debug(f"Dropping cache item for key '{key}' written by another codec version")
+                    self.cache.delete(key)
+                    return CACHE_MISS
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             self.cache.delete(key)  # Log before deleting the expired item
         return CACHE_MISS
@@ -50,7 +58,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
     async def _set(self, key, value) -> None:
         if self.max_size and len(self.cache) >= self.max_size:
             await asyncio.to_thread(self.cache.cull)
-        item = {"value": pickle.dumps(value) if not isinstance(value, str | bytes) else value, "time": time.time()}
+        item = {"value": await asyncio.to_thread(encode_payload, value), "time": time.time()}
         await asyncio.to_thread(self.cache.set, key, item)
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
@@ -32,13 +32,15 @@ class CacheServiceFactory(ServiceFactory):
                 expiration_time=settings_service.settings.redis_cache_expire,
             )
 
+        max_bytes = settings_service.settings.cache_max_bytes or None
         if settings_service.settings.cache_type == "memory":
-            return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire, max_bytes=max_bytes)
         if settings_service.settings.cache_type == "async":
-            return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire, max_bytes=max_bytes)
         if settings_service.settings.cache_type == "disk":
             return AsyncDiskCache(
                 cache_dir=settings_service.settings.config_dir,
                 expiration_time=settings_service.settings.cache_expire,
+                max_bytes=max_bytes,
             )
         return None
@@ -1,11 +1,9 @@
 import asyncio
-import pickle
 import threading
 import time
 from collections import OrderedDict
-from typing import Generic, Union
+from typing import Any, Generic, Union
 
-import dill
 from loguru import logger
 from typing_extensions import override
 
@@ -16,19 +14,49 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.codec import CodecError, decode_payload, encode_payload, estimate_size
 from langflow.services.cache.utils import CACHE_MISS
 
 
+def _evict_to_fit(cache: OrderedDict, total_bytes: int, size: int, max_size: int | None, max_bytes: int | None) -> int:
+    """Evicts least recently used items until one of `size` bytes fits, returns the new total."""
+    while cache and ((max_size and len(cache) >= max_size) or (max_bytes and total_bytes + size > max_bytes)):
+        _, item = cache.popitem(last=False)
+        total_bytes -= item["size"]
+    return total_bytes
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    if old is new:
+        return True
+    # ChatService wraps every value in a new {"result": ..., "type": ...} dict
+    return (
+        isinstance(old, dict)
+        and isinstance(new, dict)
+        and old.keys() == new.keys()
+        and all(old[key] is new[key] for key in new)
+    )
+
+
+def _item_size(existing: dict[str, Any] | None, value: Any) -> int:
+    # Callers re-set the same object (e.g. a graph after every vertex), so reuse its measurement
+    if existing is not None and _same_value(existing["value"], value):
+        return existing["size"]
+    return estimate_size(value)
+
+
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
     """A simple in-memory cache using an OrderedDict.
 
-    This cache supports setting a maximum size and expiration time for cached items.
+    This cache supports setting a maximum size, a byte budget and expiration time for cached items.
     When the cache is full, it uses a Least Recently Used (LRU) eviction policy.
+    Values are stored by reference, so nothing is copied or pickled.
     Thread-safe using a threading Lock.
 
     Attributes:
         max_size (int, optional): Maximum number of items to store in the cache.
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+        max_bytes (int, optional): Approximate number of bytes the cached values may hold.
 
     Example:
         cache = InMemoryCache(max_size=3, expiration_time=5)
@@ -43,17 +71,22 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, max_size=None, expiration_time=60 * 60) -> None:
+    stores_references = True
+
+    def __init__(self, max_size=None, expiration_time=60 * 60, max_bytes=None) -> None:
         """Initialize a new InMemoryCache instance.
 
         Args:
             max_size (int, optional): Maximum number of items to store in the cache.
             expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+            max_bytes (int, optional): Approximate number of bytes the cached values may hold.
         """
         self._cache: OrderedDict = OrderedDict()
         self._lock = threading.RLock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
 
     def get(self, key, lock: Union[threading.Lock, None] = None):  # noqa: UP007
         """Retrieve an item from the cache.
@@ -74,8 +107,7 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             if self.expiration_time is None or time.time() - item["time"] < self.expiration_time:
                 # Move the key to the end to make it recently used
                 self._cache.move_to_end(key)
-                # Check if the value is pickled
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+                return item["value"]
             self.delete(key)
         return CACHE_MISS
 
@@ -90,15 +122,15 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             lock: A lock to use for the operation.
         """
         with lock or self._lock:
-            if key in self._cache:
-                # Remove existing key before re-inserting to update order
-                self.delete(key)
-            elif self.max_size and len(self._cache) >= self.max_size:
-                # Remove least recently used item
-                self._cache.popitem(last=False)
-            # pickle locally to mimic Redis
-
-            self._cache[key] = {"value": value, "time": time.time()}
+            size = _item_size(self._cache.get(key), value)
+            # Remove existing key before re-inserting to update order
+            self.delete(key)
+            if self.max_bytes and size > self.max_bytes:
+                logger.debug(f"Not caching '{key}': {size} bytes exceed the cache budget of {self.max_bytes} bytes")
+                return
+            self.total_bytes = _evict_to_fit(self._cache, self.total_bytes, size, self.max_size, self.max_bytes)
+            self._cache[key] = {"value": value, "time": time.time(), "size": size}
+            self.total_bytes += size
 
     def upsert(self, key, value, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Inserts or updates a value in the cache.
@@ -139,12 +171,14 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
 
     def delete(self, key, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         with lock or self._lock:
-            self._cache.pop(key, None)
+            if (item := self._cache.pop(key, None)) is not None:
+                self.total_bytes -= item["size"]
 
     def clear(self, lock: Union[threading.Lock, None] = None) -> None:  # noqa: UP007
         """Clear all items from the cache."""
         with lock or self._lock:
             self._cache.clear()
+            self.total_bytes = 0
 
     def contains(self, key) -> bool:
         """Check if the key is in the cache."""
@@ -172,7 +206,10 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
 
     def __repr__(self) -> str:
         """Return a string representation of the InMemoryCache instance."""
-        return f"InMemoryCache(max_size={self.max_size}, expiration_time={self.expiration_time})"
+        return (
+            f"InMemoryCache(max_size={self.max_size}, expiration_time={self.expiration_time},"
+            f" max_bytes={self.max_bytes})"
+        )
 
 
 class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
@@ -242,19 +279,25 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         if key is None:
             return CACHE_MISS
         value = await self._client.get(str(key))
-        return dill.loads(value) if value else CACHE_MISS
+        if not value:
+            return CACHE_MISS
+        try:
+            return decode_payload(value)
+        except CodecError:
+            logger.debug(f"Ignoring cache item for key '{key}' written by another codec version")
+            return CACHE_MISS
 
     @override
     async def set(self, key, value, lock=None) -> None:
         try:
-            if pickled := dill.dumps(value, recurse=True):
-                result = await self._client.setex(str(key), self.expiration_time, pickled)
-                if not result:
-                    msg = "RedisCache could not set the value."
-                    raise ValueError(msg)
-        except pickle.PicklingError as exc:
+            payload = encode_payload(value)
+        except TypeError as exc:
             msg = "RedisCache only accepts values that can be pickled. "
             raise TypeError(msg) from exc
+        result = await self._client.setex(str(key), self.expiration_time, payload)
+        if not result:
+            msg = "RedisCache could not set the value."
+            raise ValueError(msg)
 
     @override
     async def upsert(self, key, value, lock=None) -> None:
@@ -297,12 +340,16 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
 
 
 class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, max_size=None, expiration_time=3600) -> None:
+    stores_references = True
+
+    def __init__(self, max_size=None, expiration_time=3600, max_bytes=None) -> None:
         self.cache: OrderedDict = OrderedDict()
 
         self.lock = asyncio.Lock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
 
     async def get(self, key, lock: asyncio.Lock | None = None):
         async with lock or self.lock:
@@ -313,7 +360,7 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         if item:
             if time.time() - item["time"] < self.expiration_time:
                 self.cache.move_to_end(key)
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+                return item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             await self._delete(key)  # Log before deleting the expired item
         return CACHE_MISS
@@ -326,18 +373,22 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
             )
 
     async def _set(self, key, value) -> None:
-        if self.max_size and len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)
-        self.cache[key] = {"value": value, "time": time.time()}
-        self.cache.move_to_end(key)
+        size = _item_size(self.cache.get(key), value)
+        await self._delete(key)
+        if self.max_bytes and size > self.max_bytes:
+            logger.debug(f"Not caching '{key}': {size} bytes exceed the cache budget of {self.max_bytes} bytes")
+            return
+        self.total_bytes = _evict_to_fit(self.cache, self.total_bytes, size, self.max_size, self.max_bytes)
+        self.cache[key] = {"value": value, "time": time.time(), "size": size}
+        self.total_bytes += size
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
         async with lock or self.lock:
             await self._delete(key)
 
     async def _delete(self, key) -> None:
-        if key in self.cache:
-            del self.cache[key]
+        if (item := self.cache.pop(key, None)) is not None:
+            self.total_bytes -= item["size"]
 
     async def clear(self, lock: asyncio.Lock | None = None) -> None:
         async with lock or self.lock:
@@ -345,6 +396,7 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
 
     async def _clear(self) -> None:
         self.cache.clear()
+        self.total_bytes = 0
 
     async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
         await self._upsert(key, value, lock)
@@ -3,13 +3,23 @@ from collections import defaultdict
 from threading import RLock
 from typing import Any
 
+from loguru import logger
+
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
-from langflow.services.deps import get_cache_service
+from langflow.services.cache.service import AsyncInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.deps import get_cache_service, get_settings_service
 
 
 class ChatService(Service):
-    """Service class for managing chat-related operations."""
+    """Service class for managing chat-related operations.
+
+    Graphs are process-local: they hold running components, locks and clients, and serializing
+    them on every vertex build is what made Redis and disk caches slow. When the configured cache
+    serializes its values, graphs and values that cannot be pickled are kept in `local_cache` by
+    reference instead, and only shareable payloads are sent to the cache service.
+    """
 
     name = "chat_service"
 
@@ -17,6 +27,17 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        settings = get_settings_service().settings
+        self.local_cache: AsyncInMemoryCache = AsyncInMemoryCache(
+            expiration_time=settings.cache_expire, max_bytes=settings.cache_max_bytes or None
+        )
+
+    def _keep_local(self, data: Any) -> bool:
+        if self.cache_service.stores_references:
+            return False
+        from langflow.graph.graph.base import Graph
+
+        return isinstance(data, Graph)
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -33,12 +54,21 @@ class ChatService(Service):
             "result": data,
             "type": type(data),
         }
+        if self._keep_local(data):
+            await self.local_cache.set(str(key), result_dict, lock=lock or self.async_cache_locks[key])
+            return await self.local_cache.contains(str(key))
+        # Both keys are always replaced, so there is no need to read (and decode) the old value first
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
+            try:
+                await self.cache_service.set(str(key), result_dict, lock=lock or self.async_cache_locks[key])
+            except TypeError:
+                logger.debug(f"Keeping unpicklable cache value for '{key}' in process")
+                await self.local_cache.set(str(key), result_dict, lock=lock or self.async_cache_locks[key])
+                return await self.local_cache.contains(str(key))
+            if not self.cache_service.stores_references:
+                await self.local_cache.delete(str(key), lock=lock or self.async_cache_locks[key])
             return await self.cache_service.contains(key)
-        await asyncio.to_thread(
-            self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
-        )
+        await asyncio.to_thread(self.cache_service.set, str(key), result_dict, lock=lock or self._sync_cache_locks[key])
         return key in self.cache_service
 
     async def get_cache(self, key: str, lock: asyncio.Lock | None = None) -> Any:
@@ -52,6 +82,10 @@ class ChatService(Service):
             Any: The cached data.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
+            if not self.cache_service.stores_references:
+                result = await self.local_cache.get(str(key), lock=lock or self.async_cache_locks[key])
+                if result is not CACHE_MISS:
+                    return result
             return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
 
@@ -63,5 +97,7 @@ class ChatService(Service):
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
+            if not self.cache_service.stores_references:
+                await self.local_cache.delete(str(key), lock=lock or self.async_cache_locks[key])
             return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
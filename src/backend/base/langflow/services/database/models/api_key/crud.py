@@ -1,16 +1,22 @@
 import asyncio
 import datetime
+import hashlib
 import secrets
+import threading
+import time
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from loguru import logger
+from sqlalchemy import case, update
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models import User
 from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
-from langflow.services.deps import session_scope
+from langflow.services.database.models.user.model import UserRead
+from langflow.services.deps import get_db_service, session_scope
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
@@ -48,31 +54,155 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
-
-
-update_total_uses_tasks: set[asyncio.Task] = set()
+    get_api_key_cache().invalidate_key(api_key_id)
+
+
+class ApiKeyCache:
+    """The users of recently checked API keys, so that authenticating a request doesn't query the database.
+
+    Keys are stored hashed. Entries expire after `ttl` seconds and are invalidated when the key is deleted
+    or its user is updated or deleted by this process. Other processes keep their entries until they expire.
+    """
+
+    def __init__(self, ttl: float = 0.0, max_size: int = 10_000) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict[str, tuple[float, UUID, UserRead]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def get(self, api_key: str) -> tuple[UUID, UserRead] | None:
+        """Returns the id of the key and its user, if the key was checked less than `ttl` seconds ago."""
+        digest = self._digest(api_key)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(digest, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def set(self, api_key: str, api_key_id: UUID, user: UserRead) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                now = time.monotonic()
+                self._entries = {digest: entry for digest, entry in self._entries.items() if entry[0] >= now}
+                if len(self._entries) >= self.max_size:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[self._digest(api_key)] = (time.monotonic() + self.ttl, api_key_id, user)
+
+    def invalidate_key(self, api_key_id: UUID) -> None:
+        with self._lock:
+            self._entries = {digest: entry for digest, entry in self._entries.items() if entry[1] != api_key_id}
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        with self._lock:
+            self._entries = {digest: entry for digest, entry in self._entries.items() if entry[2].id != user_id}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class ApiKeyUsageCounter:
+    """Counts the uses of API keys in memory and writes them to the database every `flush_interval` seconds.
+
+    A flush updates `total_uses` and `last_used_at` of every used key in a single statement, instead of a
+    read-modify-commit per request.
+    """
+
+    def __init__(self, flush_interval: float = 10.0) -> None:
+        self.flush_interval = flush_interval
+        self._pending: dict[UUID, tuple[int, datetime.datetime]] = {}
+        self._flush_task: asyncio.Task | None = None
+        self.flushes = 0
+
+    def record(self, api_key_id: UUID) -> None:
+        uses, _ = self._pending.get(api_key_id, (0, None))
+        self._pending[api_key_id] = (uses + 1, datetime.datetime.now(datetime.timezone.utc))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Error updating the usage of API keys: {e!s}")
+
+    async def close(self) -> None:
+        """Cancels the scheduled flush and writes the pending uses."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        uses = {api_key_id: count for api_key_id, (count, _) in pending.items()}
+        last_used = {api_key_id: used_at for api_key_id, (_, used_at) in pending.items()}
+        stmt = (
+            update(ApiKey)
+            .where(col(ApiKey.id).in_(list(pending)))
+            .values(
+                total_uses=ApiKey.total_uses + case(uses, value=col(ApiKey.id)),
+                last_used_at=case(last_used, value=col(ApiKey.id)),
+            )
+        )
+        async with session_scope() as session:
+            await session.exec(stmt)
+        self.flushes += 1
+
+
+def get_api_key_cache() -> ApiKeyCache:
+    """Returns the API key cache of the database service."""
+    return get_db_service().api_key_cache
+
+
+def get_api_key_usage_counter() -> ApiKeyUsageCounter:
+    """Returns the API key usage counter of the database service."""
+    return get_db_service().api_key_usage_counter
+
+
+async def _get_api_key(session: AsyncSession, api_key: str) -> ApiKey | None:
+    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
+    return (await session.exec(query)).first()
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
     """Check if the API key is valid."""
-    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
-    api_key_object: ApiKey | None = (await session.exec(query)).first()
+    api_key_object = await _get_api_key(session, api_key)
     if api_key_object is not None:
-        task = asyncio.create_task(update_total_uses(api_key_object.id))
-        task.add_done_callback(update_total_uses_tasks.discard)
-        update_total_uses_tasks.add(task)
+        get_api_key_usage_counter().record(api_key_object.id)
         return api_key_object.user
     return None
 
 
-async def update_total_uses(api_key_id: UUID):
-    """Update the total uses and last used at."""
-    async with session_scope() as session:
-        new_api_key = await session.get(ApiKey, api_key_id)
-        if new_api_key is None:
-            msg = "API Key not found"
-            raise ValueError(msg)
-        new_api_key.total_uses += 1
-        new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-        session.add(new_api_key)
-        await session.commit()
+async def check_key_cached(session: AsyncSession, api_key: str) -> UserRead | None:
+    """Check if the API key is valid, using the users of the recently checked keys."""
+    cache = get_api_key_cache()
+    if (cached := cache.get(api_key)) is not None:
+        api_key_id, user = cached
+        get_api_key_usage_counter().record(api_key_id)
+        return user
+    api_key_object = await _get_api_key(session, api_key)
+    if api_key_object is None or api_key_object.user is None:
+        return None
+    get_api_key_usage_counter().record(api_key_object.id)
+    user = UserRead.model_validate(api_key_object.user, from_attributes=True)
+    cache.set(api_key, api_key_object.id, user)
+    return user
@@ -1,9 +1,89 @@
 from uuid import UUID
 
+from sqlalchemy import and_, or_
+from sqlmodel import col, select
+from sqlmodel.sql.expression import SelectOfScalar
+
 from langflow.services.database.models.message.model import MessageTable, MessageUpdate
 from langflow.services.deps import session_scope
 from langflow.utils.async_helpers import run_until_complete
 
+# Columns needed to build a Message or a MessageResponse. Selecting them directly returns plain rows
+# instead of MessageTable instances, which skips the ORM identity map and the model validators.
+MESSAGE_READ_COLUMNS = (
+    MessageTable.id,
+    MessageTable.flow_id,
+    MessageTable.timestamp,
+    MessageTable.sender,
+    MessageTable.sender_name,
+    MessageTable.session_id,
+    MessageTable.text,
+    MessageTable.files,
+    MessageTable.error,
+    MessageTable.edit,
+    MessageTable.properties,
+    MessageTable.category,
+    MessageTable.content_blocks,
+)
+
+
+def get_messages_query(
+    *,
+    sender: str | None = None,
+    sender_name: str | None = None,
+    session_id: str | UUID | None = None,
+    flow_id: UUID | None = None,
+    order_by: str | None = "timestamp",
+    order: str | None = "ASC",
+    limit: int | None = None,
+    after: UUID | str | None = None,
+    exclude_errors: bool = False,
+) -> SelectOfScalar:
+    """Build a query returning the read columns of the messages matching the filters.
+
+    Results are paginated with a keyset instead of an offset: pass the id of the last message of
+    the previous page as `after` to get the messages that come after it in the requested order.
+    Messages that share the ordering value of the cursor are then ordered by id.
+
+    Args:
+        sender: The sender of the messages (e.g., "Machine" or "User").
+        sender_name: The name of the sender.
+        session_id: The session ID associated with the messages.
+        flow_id: The flow ID associated with the messages.
+        order_by: The field to order the messages by.
+        order: "ASC" or "DESC".
+        limit: The maximum number of messages to return.
+        after: The id of the message the page starts after.
+        exclude_errors: Whether to leave out error messages.
+    """
+    stmt = select(*MESSAGE_READ_COLUMNS)
+    if exclude_errors:
+        stmt = stmt.where(MessageTable.error == False)  # noqa: E712
+    if sender:
+        stmt = stmt.where(MessageTable.sender == sender)
+    if sender_name:
+        stmt = stmt.where(MessageTable.sender_name == sender_name)
+    if session_id:
+        stmt = stmt.where(MessageTable.session_id == session_id)
+    if flow_id:
+        stmt = stmt.where(MessageTable.flow_id == flow_id)
+    if order_by:
+        column = getattr(MessageTable, order_by)
+        descending = order == "DESC"
+        stmt = stmt.order_by(column.desc() if descending else column.asc())
+        if after:
+            after_id = after if isinstance(after, UUID) else UUID(after)
+            cursor = select(column).where(MessageTable.id == after_id).scalar_subquery()
+            if descending:
+                stmt = stmt.where(or_(column < cursor, and_(column == cursor, MessageTable.id < after_id)))
+                stmt = stmt.order_by(col(MessageTable.id).desc())
+            else:
+                stmt = stmt.where(or_(column > cursor, and_(column == cursor, MessageTable.id > after_id)))
+                stmt = stmt.order_by(col(MessageTable.id).asc())
+    if limit:
+        stmt = stmt.limit(limit)
+    return stmt
+
 
 async def _update_message(message_id: UUID | str, message: MessageUpdate | dict):
     if not isinstance(message, MessageUpdate):
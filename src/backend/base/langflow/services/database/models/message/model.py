@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Annotated
 from uuid import UUID, uuid4
 
 from pydantic import field_serializer, field_validator
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from langflow.schema.content_block import ContentBlock
@@ -111,6 +111,7 @@ class MessageBase(SQLModel):
 
 class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
     __tablename__ = "message"
+    __table_args__ = (Index("ix_message_session_id_flow_id_timestamp", "session_id", "flow_id", "timestamp"),)
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     flow_id: UUID | None = Field(default=None)
     files: list[str] = Field(sa_column=Column(JSON))
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlmodel import col, delete, func, select
@@ -130,6 +131,81 @@ async def log_vertex_build(
     return table
 
 
+async def log_vertex_builds(db: AsyncSession, vertex_builds: list[VertexBuildBase]) -> list[VertexBuildTable]:
+    """Insert a batch of vertex builds in a single transaction.
+
+    Unlike `log_vertex_build`, this does not enforce the retention limits. Callers are expected to
+    run `prune_vertex_builds` periodically for the vertices they have written.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertex_builds (list[VertexBuildBase]): The vertex builds to insert.
+
+    Returns:
+        list[VertexBuildTable]: The newly created vertex build records.
+    """
+    tables = [VertexBuildTable(**vertex_build.model_dump()) for vertex_build in vertex_builds]
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def prune_vertex_builds(
+    db: AsyncSession,
+    vertex_keys: Iterable[tuple[UUID, str]],
+    *,
+    max_builds_to_keep: int | None = None,
+    max_builds_per_vertex: int | None = None,
+) -> None:
+    """Enforce the vertex build retention limits.
+
+    Removes the older builds of each given (flow_id, vertex_id) pair, keeping the newest
+    `max_builds_per_vertex`, and then the older builds across all vertices, keeping the newest
+    `max_builds_to_keep`.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertex_keys (Iterable[tuple[UUID, str]]): The (flow_id, vertex_id) pairs to prune.
+        max_builds_to_keep (int | None, optional): Maximum number of builds to keep globally.
+            If None, uses system settings.
+        max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
+            If None, uses system settings.
+    """
+    settings = get_settings_service().settings
+    max_global = max_builds_to_keep or settings.max_vertex_builds_to_keep
+    max_per_vertex = max_builds_per_vertex or settings.max_vertex_builds_per_vertex
+    try:
+        for flow_id, vertex_id in vertex_keys:
+            keep_vertex_subq = (
+                select(VertexBuildTable.build_id)
+                .where(VertexBuildTable.flow_id == flow_id, VertexBuildTable.id == vertex_id)
+                .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+                .limit(max_per_vertex)
+            )
+            await db.exec(
+                delete(VertexBuildTable).where(
+                    VertexBuildTable.flow_id == flow_id,
+                    VertexBuildTable.id == vertex_id,
+                    col(VertexBuildTable.build_id).not_in(keep_vertex_subq),
+                )
+            )
+
+        keep_global_subq = (
+            select(VertexBuildTable.build_id)
+            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+            .limit(max_global)
+        )
+        await db.exec(delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq)))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
@@ -26,6 +26,7 @@ from tenacity import retry, stop_after_attempt, wait_fixed
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.services.base import Service
 from langflow.services.database import models
+from langflow.services.database.models.api_key.crud import ApiKeyCache, ApiKeyUsageCounter
 from langflow.services.database.models.user.crud import get_user_by_username
 from langflow.services.database.utils import Result, TableResults
 from langflow.services.deps import get_settings_service
@@ -68,6 +69,12 @@ class DatabaseService(Service):
         else:
             self.alembic_log_path = Path(langflow_dir) / alembic_log_file
 
+        # Cached keys are only valid for this database, and only invalidated by the changes of this process
+        self.api_key_cache = ApiKeyCache(ttl=settings_service.settings.api_key_cache_ttl)
+        self.api_key_usage_counter = ApiKeyUsageCounter(
+            flush_interval=settings_service.settings.api_key_usage_flush_interval
+        )
+
     async def initialize_alembic_log_file(self):
         # Ensure the directory and file for the alembic log file exists
         await anyio.Path(self.alembic_log_path.parent).mkdir(parents=True, exist_ok=True)
@@ -471,6 +478,11 @@ class DatabaseService(Service):
 
     async def teardown(self) -> None:
         logger.debug("Tearing down database")
+        try:
+            await self.api_key_usage_counter.close()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error writing the usage of API keys")
+        self.api_key_cache.clear()
         try:
             settings_service = get_settings_service()
             # remove the default superuser if auto_login is enabled
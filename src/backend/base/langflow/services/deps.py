@@ -12,9 +12,11 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.build_log.service import BuildLogService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.http_client.service import HTTPClientService
     from langflow.services.job_queue.service import JobQueueService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
@@ -247,3 +249,17 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_build_log_service() -> BuildLogService:
+    """Retrieves the BuildLogService instance from the service manager."""
+    from langflow.services.build_log.factory import BuildLogServiceFactory
+
+    return get_service(ServiceType.BUILD_LOG_SERVICE, BuildLogServiceFactory())
+
+
+def get_http_client_service() -> HTTPClientService:
+    """Retrieves the HTTPClientService instance from the service manager."""
+    from langflow.services.http_client.factory import HTTPClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HTTPClientServiceFactory())
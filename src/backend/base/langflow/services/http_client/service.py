@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING
+
+import httpx
+from loguru import logger
+
+from langflow.services.base import Service
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from langflow.services.settings.service import SettingsService
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream calling `release` once the response is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class HostLimitedAsyncClient(httpx.AsyncClient):
+    """Client sending at most `max_connections_per_host` requests to the same host at the same time.
+
+    A request holds its slot until its response is closed, so that streamed responses count as in flight.
+    """
+
+    def __init__(self, *, max_connections_per_host: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.max_connections_per_host = max_connections_per_host
+        self._semaphores: dict[tuple[bytes, bytes, int | None], asyncio.Semaphore] = {}
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        host = (request.url.raw_scheme, request.url.raw_host, request.url.port)
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        await semaphore.acquire()
+        try:
+            response = await super().send(request, **kwargs)
+        except BaseException:
+            semaphore.release()
+            raise
+        if response.is_closed:
+            semaphore.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, semaphore.release)  # type: ignore[arg-type]
+        return response
+
+
+class HTTPClientService(Service):
+    """Registry of shared `httpx.AsyncClient` instances.
+
+    Creating a client for every request means paying for DNS resolution, the TCP connection and the TLS
+    handshake every time. Components get a client from this service instead, so that connections are
+    pooled and kept alive across builds. Clients are shared by every caller using the same timeout, proxy,
+    TLS verification and redirect settings, in the same event loop, and are closed when the service is torn
+    down. Callers must not close them. Clients never store the cookies set by responses, which would be sent
+    along with the requests of other users, callers pass the cookies of each request instead.
+    """
+
+    name = "http_client_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.limits = httpx.Limits(
+            max_connections=settings.http_client_max_connections or None,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections or None,
+            keepalive_expiry=settings.http_client_keepalive_expiry,
+        )
+        self.max_connections_per_host = settings.http_client_max_connections_per_host
+        self.http2 = settings.http_client_http2 and importlib.util.find_spec("h2") is not None
+        self._clients: dict[tuple, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def get_client(
+        self,
+        *,
+        timeout: float | None = 5.0,
+        verify: bool | str = True,
+        proxy: str | None = None,
+        follow_redirects: bool = False,
+    ) -> httpx.AsyncClient:
+        """Return the shared client for these settings in the running event loop.
+
+        Args:
+            timeout: Default timeout in seconds of the requests, None for no timeout. Defaults to the httpx
+                default, requests can still pass their own `timeout`.
+            verify: Whether to verify TLS certificates, or the path of a CA bundle.
+            proxy: URL of the proxy to send the requests through.
+            follow_redirects: Default redirect behavior of the requests.
+        """
+        loop = asyncio.get_running_loop()
+        # Connections are bound to the event loop they were opened in
+        key = (id(loop), timeout, verify, proxy, follow_redirects)
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry[0] is loop and not entry[1].is_closed:
+                self.reused += 1
+                return entry[1]
+            self._forget_closed_loops()
+            client = self._create_client(timeout=timeout, verify=verify, proxy=proxy, follow_redirects=follow_redirects)
+            self._clients[key] = (loop, client)
+            self.created += 1
+            return client
+
+    def _create_client(
+        self, *, timeout: float | None, verify: bool | str, proxy: str | None, follow_redirects: bool
+    ) -> httpx.AsyncClient:
+        kwargs = {
+            "timeout": timeout,
+            "verify": verify,
+            "proxy": proxy,
+            "follow_redirects": follow_redirects,
+            "limits": self.limits,
+            "http2": self.http2,
+            # The client copies a `Cookies` into a new jar, losing its policy, but keeps a `CookieJar` as is
+            "cookies": CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        }
+        if self.max_connections_per_host > 0:
+            return HostLimitedAsyncClient(max_connections_per_host=self.max_connections_per_host, **kwargs)
+        return httpx.AsyncClient(**kwargs)
+
+    def _forget_closed_loops(self) -> None:
+        # Clients of a closed event loop can not be closed anymore, their connections are gone with the loop
+        for key, (loop, _) in list(self._clients.items()):
+            if loop.is_closed():
+                del self._clients[key]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"clients": len(self._clients), "created": self.created, "reused": self.reused}
+
+    async def teardown(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        loop = asyncio.get_running_loop()
+        for client_loop, client in clients:
+            if client_loop is not loop:
+                continue
+            try:
+                await client.aclose()
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Error closing a shared HTTP client")
@@ -1,11 +1,23 @@
-from langflow.services.base import Service
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
 from langflow.services.factory import ServiceFactory
 from langflow.services.job_queue.service import JobQueueService
 
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
-        return JobQueueService()
+    @override
+    def create(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        return JobQueueService(
+            max_queue_size=settings.event_queue_max_size, overflow_policy=settings.event_queue_overflow_policy
+        )
@@ -5,6 +5,7 @@ import asyncio
 from loguru import logger
 
 from langflow.events.event_manager import EventManager, create_default_event_manager
+from langflow.events.event_queue import EventQueue, OverflowPolicy
 from langflow.services.base import Service
 
 
@@ -61,12 +62,19 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, *, max_queue_size: int = 0, overflow_policy: OverflowPolicy = "drop") -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            max_queue_size (int): The number of events each job's queue holds in memory, 0 for no limit.
+            overflow_policy (OverflowPolicy): What the queue of a job does with the events produced while it
+                is full, see `EventQueue`.
         """
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
@@ -143,7 +151,7 @@ class JobQueueService(Service):
             logger.error(msg)
             raise RuntimeError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
+        main_queue = EventQueue(max_size=self.max_queue_size, policy=self.overflow_policy)
         event_manager = create_default_event_manager(main_queue)
 
         # Register the queue without an active task.
@@ -209,6 +217,20 @@ class JobQueueService(Service):
         except KeyError as exc:
             raise JobQueueNotFoundError(job_id) from exc
 
+    def get_queue_stats(self) -> dict[str, dict[str, int | str]]:
+        """Return the depth and memory gauges of the queue of every job.
+
+        Returns:
+            dict[str, dict[str, int | str]]: For each job ID, the number of queued events (`depth`), the
+            bytes they hold in memory (`bytes`), the highest depth reached (`max_depth`) and how many
+            events were merged or spilled to disk because the queue was full.
+        """
+        return {
+            job_id: main_queue.stats()
+            for job_id, (main_queue, *_rest) in self._queues.items()
+            if isinstance(main_queue, EventQueue)
+        }
+
     async def cleanup_job(self, job_id: str) -> None:
         """Clean up and release resources for a specific job.
 
@@ -247,6 +269,9 @@ class JobQueueService(Service):
             except asyncio.QueueEmpty:
                 break
 
+        if isinstance(main_queue, EventQueue):
+            logger.debug(f"Queue stats for job_id {job_id}: {main_queue.stats()}")
+            main_queue.close()
         logger.debug(f"Removed {items_cleared} items from queue for job_id {job_id}")
         # Remove the job entry from the registry
         self._queues.pop(job_id, None)
@@ -126,6 +126,9 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_max_bytes: int = 512 * 1024 * 1024
+    """Approximate number of bytes the cache may hold before evicting the least recently used items.
+    Set to 0 to only limit the cache by its expiration time."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -182,6 +185,18 @@ class Settings(BaseSettings):
     do_not_track: bool = False
     """If set to True, Langflow will not track telemetry."""
     telemetry_base_url: str = "https://langflow.gateway.scarf.sh"
+    telemetry_batch_url: str | None = None
+    """URL accepting batches of telemetry events in a single JSON POST. If not set, the events of a batch are
+    sent to `telemetry_base_url` one request at a time over a pooled connection."""
+    telemetry_batch_size: int = 100
+    """The maximum number of telemetry events of the same type sent in a batch."""
+    telemetry_flush_interval: float = 30.0
+    """The number of seconds after which buffered telemetry events are sent, even if their batch is not full."""
+    telemetry_max_queue_size: int = 1000
+    """The maximum number of telemetry events kept in memory. Beyond it, events are moved to the outbox."""
+    telemetry_outbox_max_size: int = 10000
+    """The maximum number of telemetry events kept on disk, in the config dir, until they can be sent. Beyond
+    it, events are dropped."""
     transactions_storage_enabled: bool = True
     """If set to True, Langflow will track transactions between flows."""
     vertex_builds_storage_enabled: bool = True
@@ -212,14 +227,31 @@ class Settings(BaseSettings):
     """The maximum number of retries for the health check."""
     max_file_size_upload: int = 100
     """The maximum file size for the upload in MB."""
+    cancel_requests_on_disconnect: bool = False
+    """If set to True, the handling of a request is cancelled as soon as its client disconnects, instead of
+    running until the response is complete."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    tracing_buffer_size: int = 10000
+    """The maximum number of traces waiting to be sent to each tracer. Traces are dropped, and counted, when a
+    tracer falls behind."""
+    tracing_batch_size: int = 100
+    """The maximum number of traces sent to a tracer at a time."""
+    tracing_flush_timeout: float = 5.0
+    """The number of seconds to wait for the traces of a run, or of all runs on shutdown, to be sent."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    build_log_batch_size: int = 100
+    """The number of buffered vertex builds and transactions that triggers a bulk insert.
+    Set to 0 to write every record to the database as soon as it is logged."""
+    build_log_flush_interval: float = 1.0
+    """The maximum time in seconds a buffered vertex build or transaction waits before it is written."""
+    build_log_prune_interval: float = 30.0
+    """The interval in seconds between runs of the vertex build and transaction retention pruning."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -235,6 +267,39 @@ class Settings(BaseSettings):
     mcp_server_enable_progress_notifications: bool = False
     """If set to False, Langflow will not send progress notifications in the MCP server."""
 
+    # API keys
+    api_key_cache_ttl: float = 0.0
+    """Seconds for which the user of a checked API key is reused without querying the database. Keys are
+    invalidated when they are deleted or their user is updated, in the process making the change only: with
+    several workers or replicas, the others keep accepting a deleted key for up to this many seconds. Defaults
+    to 0, which checks every request against the database."""
+    api_key_usage_flush_interval: float = 10.0
+    """Interval in seconds at which the number of uses and last use of API keys are written to the database."""
+
+    # MCP Client
+    mcp_session_idle_timeout: float = 300.0
+    """Seconds after which an unused MCP client session is closed. Sessions are shared by every MCP component
+    connecting to the same server, so that stdio servers are not started again for each build."""
+    mcp_session_health_check_interval: float = 30.0
+    """A pooled MCP client session that was not used for this many seconds is pinged before it is reused."""
+    mcp_tools_cache_ttl: float = 60.0
+    """Seconds for which the tools listed by an MCP server are reused. Set to 0 to list them on every build."""
+
+    # HTTP Client
+    http_client_max_connections: int = 100
+    """Maximum number of connections opened by each shared HTTP client. Components making HTTP requests share
+    these clients, so that connections to a host are kept alive and reused across builds."""
+    http_client_max_keepalive_connections: int = 20
+    """Maximum number of idle connections kept alive by each shared HTTP client."""
+    http_client_keepalive_expiry: float = 30.0
+    """Seconds after which an idle connection of a shared HTTP client is closed."""
+    http_client_max_connections_per_host: int = 0
+    """Maximum number of requests sent to the same host at the same time by a shared HTTP client. Further
+    requests wait for one to finish. Set to 0 for no limit."""
+    http_client_http2: bool = True
+    """If set to True, the shared HTTP clients negotiate HTTP/2 with servers supporting it, when the h2 package
+    is installed."""
+
     # Public Flow Settings
     public_flow_cleanup_interval: int = Field(default=3600, gt=600)
     """The interval in seconds at which public temporary flows will be cleaned up.
@@ -247,6 +312,52 @@ class Settings(BaseSettings):
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
+    cache_component_index: bool = True
+    """If set to True, the component templates are stored in an index in the config directory together with
+    the modification time and hash of each file. On the next start only the files that changed are built again,
+    and workers starting together share the index instead of each building the templates. With
+    lazy_load_components the index is used once it exists."""
+    component_build_workers: int = 0
+    """The number of processes used to build the component templates at startup. Each file is built in one of
+    the processes and the results are merged in file order. Set to 0 to build them in the server process."""
+    stream_token_window_ms: int = 0
+    """If set above 0, the tokens streamed to the client are sent in frames of up to this many milliseconds
+    instead of one event per token, which saves most of the per-token overhead with many concurrent streams."""
+    stream_token_window_bytes: int = 256
+    """A token frame is sent as soon as it holds this many bytes, even if its time window has not elapsed."""
+    event_queue_max_size: int = 10_000
+    """The number of events each build job keeps in memory for its client. Set to 0 for no limit."""
+    event_queue_overflow_policy: Literal["block", "drop", "spill"] = "drop"
+    """What to do with the events of a job whose queue is full: 'block' pauses the build until the client
+    catches up, 'drop' merges new tokens into the last queued token of the same message, and 'spill' writes
+    the events to a temporary file. Events other than tokens are never dropped."""
+    graph_scheduler: Literal["layered", "as_completed"] = "layered"
+    """How graphs schedule their vertices. 'layered' runs the graph one layer at a time, while 'as_completed'
+    starts each component as soon as the components it depends on are built."""
+    graph_max_concurrency: int = 0
+    """The maximum number of components of a graph built at the same time by the 'as_completed' scheduler.
+    Set to 0 for no limit."""
+    run_graph_cache_size: int = 100
+    """The maximum number of prepared flow graphs kept in memory by the run endpoints.
+    Each entry is keyed by flow id, flow version and tweaks. Set to 0 to build the graph on every run."""
+    message_history_cache_size: int = 0
+    """The maximum number of chat sessions whose message history is kept in memory for the memory components.
+    Messages written by other processes are not seen by the cache, so only enable it when a single process writes
+    messages. It is always disabled when running more than one worker. Defaults to 0, which always reads the
+    history from the database."""
+    message_history_cache_max_messages: int = 1000
+    """Sessions with more messages than this are not cached."""
+    component_result_cache_max_bytes: int = 256 * 1024 * 1024
+    """Approximate number of bytes held by the results of components that declare `cacheable = True`.
+    Results are shared across runs, flows and users of the process. Set to 0 to disable the cache."""
+    component_result_cache_ttl: int = 3600
+    """The number of seconds a cached component result is reused. Set to 0 to keep results until evicted."""
+    component_class_cache_size: int = 1024
+    """The number of component classes kept in memory, keyed by a hash of their code. Set to 0 to disable."""
+    component_bytecode_cache: bool = True
+    """If set to True, the bytecode compiled from component code is stored in the config directory and reused
+    by other workers and after restarts. Classes created on the event loop are written from a thread and never
+    read from the disk, so that the loop does not wait on it."""
 
     @field_validator("event_delivery", mode="before")
     @classmethod
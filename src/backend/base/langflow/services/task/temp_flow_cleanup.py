@@ -64,6 +64,12 @@ async def cleanup_orphaned_records() -> None:
                             logger.error(f"Failed to list files for flow {flow_id}: {exc!s}")
 
                     await session.commit()
+                    if table is MessageTable:
+                        from langflow.memory import get_session_history_cache
+
+                        session_history_cache = get_session_history_cache()
+                        for flow_id in orphaned_flow_ids:
+                            session_history_cache.invalidate_flow(flow_id)
                     logger.debug(f"Successfully deleted orphaned records from {table.__name__}")
 
             except Exception as exc:  # noqa: BLE001
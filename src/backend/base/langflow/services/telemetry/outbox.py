@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from filelock import FileLock
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+TELEMETRY_OUTBOX_FILE = "telemetry_outbox.jsonl"
+TELEMETRY_OUTBOX_LOCK_TIMEOUT = 10
+
+
+class TelemetryOutbox:
+    """Telemetry events waiting on disk to be sent, one JSON line per event, oldest first.
+
+    The outbox holds at most `max_size` events, and keeps nothing if `path` is None. Every worker of the
+    same config dir shares the outbox, the file is locked while it is read or written. Its methods do file
+    I/O and are meant to be called from a thread.
+    """
+
+    def __init__(self, path: Path | None, max_size: int) -> None:
+        self.path = path
+        self.max_size = max_size if path is not None else 0
+        self._lock = threading.Lock()
+        self._file_lock = (
+            FileLock(f"{path}.lock", timeout=TELEMETRY_OUTBOX_LOCK_TIMEOUT, thread_local=False)
+            if path is not None
+            else None
+        )
+        self._size = 0
+
+    def __len__(self) -> int:
+        """The number of events in the outbox when it was last read or written by this process."""
+        return self._size
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            if self._file_lock is None or self.path is None:
+                yield
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_lock:
+                yield
+
+    def load(self) -> int:
+        """Count the events left in the outbox by previous processes and the other workers."""
+        try:
+            with self._locked():
+                return self._load()
+        except OSError as e:
+            logger.warning(f"Error reading telemetry events from {self.path}: {e}")
+            return self._size
+
+    def append(self, events: list[dict[str, Any]]) -> int:
+        """Write events to the outbox, returns the number of events dropped because it is full."""
+        if self.path is None:
+            return len(events)
+        try:
+            with self._locked():
+                size = self._load()
+                kept = events[: max(self.max_size - size, 0)]
+                if kept:
+                    with self.path.open("ab") as f:
+                        f.writelines(orjson.dumps(event) + b"\n" for event in kept)
+                    self._size = size + len(kept)
+        except OSError as e:
+            logger.warning(f"Error writing telemetry events to {self.path}: {e}")
+            return len(events)
+        return len(events) - len(kept)
+
+    def pop(self, count: int) -> list[dict[str, Any]]:
+        """Remove and return the `count` oldest events of the outbox."""
+        if self.path is None:
+            return []
+        try:
+            with self._locked():
+                if not self._load():
+                    return []
+                try:
+                    lines = [line for line in self.path.read_bytes().splitlines() if line.strip()]
+                    events = [orjson.loads(line) for line in lines[:count]]
+                    remaining = lines[count:]
+                    if remaining:
+                        self._replace(self.path, b"\n".join(remaining) + b"\n")
+                    else:
+                        self.path.unlink()
+                except (OSError, orjson.JSONDecodeError) as e:
+                    logger.warning(f"Error reading telemetry events from {self.path}, discarding the outbox: {e}")
+                    self.path.unlink(missing_ok=True)
+                    self._size = 0
+                    return []
+                self._size = len(remaining)
+                return events
+        except OSError as e:
+            logger.warning(f"Error reading telemetry events from {self.path}: {e}")
+            return []
+
+    @staticmethod
+    def _replace(path: Path, content: bytes) -> None:
+        # A temporary file of its own, so that a failed write never leaves a partial outbox behind
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            temp_path.replace(path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _load(self) -> int:
+        # Other workers write to the outbox too, so it is counted again every time the lock is taken
+        self._size = 0
+        if self.path is not None and self.path.exists():
+            with self.path.open("rb") as f:
+                self._size = sum(1 for line in f if line.strip())
+        return self._size
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
 import platform
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from loguru import logger
 
 from langflow.services.base import Service
 from langflow.services.telemetry.opentelemetry import OpenTelemetry
+from langflow.services.telemetry.outbox import TELEMETRY_OUTBOX_FILE, TelemetryOutbox
 from langflow.services.telemetry.schema import (
     ComponentPayload,
     PlaygroundPayload,
@@ -27,13 +31,30 @@ if TYPE_CHECKING:
 
 
 class TelemetryService(Service):
+    """Sends anonymous usage events to `telemetry_base_url`.
+
+    Events are buffered in memory by type, and sent in batches of at most `telemetry_batch_size` events once
+    a batch is full or every `telemetry_flush_interval` seconds. A batch is sent in a single request to
+    `telemetry_batch_url` when it is set, and one event at a time over the pooled connection of the client
+    otherwise.
+
+    At most `telemetry_max_queue_size` events are kept in memory. Beyond that, and for the events that could
+    not be sent, events are moved to an outbox in the config dir, which is sent again a batch at a time once
+    the endpoint accepts events, including after a restart. Events that do not fit in the outbox either are
+    dropped, and every outcome is counted in `stats`.
+    """
+
     name = "telemetry_service"
 
     def __init__(self, settings_service: SettingsService):
         super().__init__()
         self.settings_service = settings_service
-        self.base_url = settings_service.settings.telemetry_base_url
-        self.telemetry_queue: asyncio.Queue = asyncio.Queue()
+        settings = settings_service.settings
+        self.base_url = settings.telemetry_base_url
+        self.batch_url = settings.telemetry_batch_url
+        self.batch_size = max(settings.telemetry_batch_size, 1)
+        self.flush_interval = settings.telemetry_flush_interval
+        self.max_queue_size = settings.telemetry_max_queue_size
         self.client = httpx.AsyncClient(timeout=10.0)  # Set a reasonable timeout
         self.running = False
         self._stopping = False
@@ -47,49 +68,141 @@ class TelemetryService(Service):
         )
         self.log_package_version_task: asyncio.Task | None = None
 
+        outbox_path = Path(settings.config_dir) / TELEMETRY_OUTBOX_FILE if settings.config_dir else None
+        self.outbox = TelemetryOutbox(outbox_path, settings.telemetry_outbox_max_size)
+        self._events: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._queued = 0
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+
+        self.sent = 0
+        self.failed = 0
+        self.spilled = 0
+        self.dropped = 0
+        self.batches = 0
+
     async def telemetry_worker(self) -> None:
+        await asyncio.to_thread(self.outbox.load)
         while self.running:
-            func, payload, path = await self.telemetry_queue.get()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            self._flush_requested.clear()
             try:
-                await func(payload, path)
+                await self.flush()
             except Exception:  # noqa: BLE001
-                logger.error("Error sending telemetry data")
-            finally:
-                self.telemetry_queue.task_done()
+                logger.exception("Error sending telemetry data")
 
     async def send_telemetry_data(self, payload: BaseModel, path: str | None = None) -> None:
         if self.do_not_track:
             logger.debug("Telemetry tracking is disabled.")
             return
+        await self._send_event(self._dump(payload), path)
 
+    async def _send_event(self, event: dict[str, Any], path: str | None) -> bool:
         url = f"{self.base_url}"
         if path:
             url = f"{url}/{path}"
         try:
-            payload_dict = payload.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
-            response = await self.client.get(url, params=payload_dict)
+            response = await self.client.get(url, params=event)
             if response.status_code != httpx.codes.OK:
                 logger.error(f"Failed to send telemetry data: {response.status_code} {response.text}")
-            else:
-                logger.debug("Telemetry data sent successfully.")
-        except httpx.HTTPStatusError:
-            logger.error("HTTP error occurred")
+                return False
         except httpx.RequestError:
             logger.error("Request error occurred")
+            return False
         except Exception:  # noqa: BLE001
             logger.error("Unexpected error occurred")
+            return False
+        return True
+
+    async def _send_batch(self, path: str, events: list[dict[str, Any]]) -> bool:
+        """Sends a batch of events of the same type, moving the events that were not sent to the outbox."""
+        sent = 0
+        if self.batch_url:
+            try:
+                response = await self.client.post(self.batch_url, json={"type": path, "events": events})
+                if response.status_code in {httpx.codes.OK, httpx.codes.ACCEPTED, httpx.codes.NO_CONTENT}:
+                    sent = len(events)
+                else:
+                    logger.error(f"Failed to send telemetry data: {response.status_code} {response.text}")
+            except httpx.RequestError:
+                logger.error("Request error occurred")
+            except Exception:  # noqa: BLE001
+                logger.error("Unexpected error occurred")
+        else:
+            for event in events:
+                if not await self._send_event(event, path or None):
+                    break
+                sent += 1
+        self.sent += sent
+        if sent:
+            self.batches += 1
+            logger.debug(f"Sent {sent} telemetry events")
+        if sent < len(events):
+            self.failed += len(events) - sent
+            await self._to_outbox(path, events[sent:])
+            return False
+        return True
+
+    @staticmethod
+    def _dump(payload: BaseModel) -> dict[str, Any]:
+        return payload.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+
+    def _take_events(self) -> dict[str, list[dict[str, Any]]]:
+        events, self._events = self._events, defaultdict(list)
+        self._queued = 0
+        return events
+
+    async def _to_outbox(self, path: str, events: list[dict[str, Any]]) -> None:
+        dropped = await asyncio.to_thread(self.outbox.append, [{"path": path, "payload": event} for event in events])
+        self.spilled += len(events) - dropped
+        if dropped:
+            self.dropped += dropped
+            logger.warning(f"Telemetry outbox is full, dropped {dropped} events")
+
+    async def _spill(self) -> None:
+        """Moves the events buffered in memory to the outbox."""
+        for path, events in self._take_events().items():
+            await self._to_outbox(path, events)
+
+    async def _send_buffered(self) -> bool:
+        ok = True
+        for path, events in self._take_events().items():
+            for start in range(0, len(events), self.batch_size):
+                batch = events[start : start + self.batch_size]
+                if ok:
+                    ok = await self._send_batch(path, batch)
+                else:
+                    # The endpoint is failing, keep the rest for later instead of waiting on every batch
+                    self.failed += len(batch)
+                    await self._to_outbox(path, batch)
+        return ok
+
+    async def _send_outbox_batch(self) -> None:
+        records = await asyncio.to_thread(self.outbox.pop, self.batch_size)
+        batches: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            batches[record.get("path", "")].append(record.get("payload", {}))
+        for path, events in batches.items():
+            await self._send_batch(path, events)
 
     async def log_package_run(self, payload: RunPayload) -> None:
-        await self._queue_event((self.send_telemetry_data, payload, "run"))
+        await self._queue_event(payload, "run")
 
     async def log_package_shutdown(self) -> None:
         payload = ShutdownPayload(time_running=(datetime.now(timezone.utc) - self._start_time).seconds)
-        await self._queue_event(payload)
+        await self._queue_event(payload, "shutdown")
 
-    async def _queue_event(self, payload) -> None:
+    async def _queue_event(self, payload: BaseModel, path: str | None = None) -> None:
         if self.do_not_track or self._stopping:
             return
-        await self.telemetry_queue.put(payload)
+        events = self._events[path or ""]
+        events.append(self._dump(payload))
+        self._queued += 1
+        if len(events) >= self.batch_size:
+            self._flush_requested.set()
+        if self._queued >= self.max_queue_size:
+            await self._spill()
 
     def _get_langflow_desktop(self) -> bool:
         # Coerce to bool, could be 1, 0, True, False, "1", "0", "True", "False"
@@ -111,13 +224,13 @@ class TelemetryService(Service):
             auto_login=self.settings_service.auth_settings.AUTO_LOGIN,
             desktop=self._get_langflow_desktop(),
         )
-        await self._queue_event((self.send_telemetry_data, payload, None))
+        await self._queue_event(payload)
 
     async def log_package_playground(self, payload: PlaygroundPayload) -> None:
-        await self._queue_event((self.send_telemetry_data, payload, "playground"))
+        await self._queue_event(payload, "playground")
 
     async def log_package_component(self, payload: ComponentPayload) -> None:
-        await self._queue_event((self.send_telemetry_data, payload, "component"))
+        await self._queue_event(payload, "component")
 
     def start(self) -> None:
         if self.running or self.do_not_track:
@@ -131,13 +244,27 @@ class TelemetryService(Service):
             logger.exception("Error starting telemetry service")
 
     async def flush(self) -> None:
+        """Sends the buffered events, then a batch of the outbox if the endpoint accepted them."""
         if self.do_not_track:
             return
         try:
-            await self.telemetry_queue.join()
+            async with self._flush_lock:
+                if await self._send_buffered() and len(self.outbox):
+                    await self._send_outbox_batch()
         except Exception:  # noqa: BLE001
             logger.exception("Error flushing logs")
 
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queued,
+            "outbox": len(self.outbox),
+            "sent": self.sent,
+            "failed": self.failed,
+            "spilled": self.spilled,
+            "dropped": self.dropped,
+            "batches": self.batches,
+        }
+
     @staticmethod
     async def _cancel_task(task: asyncio.Task, cancel_msg: str) -> None:
         task.cancel(cancel_msg)
@@ -152,13 +279,16 @@ class TelemetryService(Service):
             return
         try:
             self._stopping = True
-            # flush all the remaining events and then stop
-            await self.flush()
             self.running = False
-            if self.worker_task:
-                await self._cancel_task(self.worker_task, "Cancel telemetry worker task")
             if self.log_package_version_task:
                 await self._cancel_task(self.log_package_version_task, "Cancel telemetry log package version task")
+            if self.worker_task:
+                # Wake the worker up so it sends the buffered events and leaves the loop
+                self._flush_requested.set()
+                await self.worker_task
+            # What can not be sent is kept in the outbox for the next start
+            async with self._flush_lock:
+                await self._send_buffered()
             await self.client.aclose()
         except Exception:  # noqa: BLE001
             logger.exception("Error stopping tracing service")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
@@ -15,6 +16,14 @@ if TYPE_CHECKING:
 
 class BaseTracer(ABC):
     trace_id: UUID
+    lock: threading.RLock
+
+    def __new__(cls, *args, **kwargs):  # noqa: ARG004
+        tracer = super().__new__(cls)
+        # Guards the state runs read while the exporter thread changes it, such as the open spans. It is never
+        # held across calls to the tracer SDK, which may block on the network while the event loop waits
+        tracer.lock = threading.RLock()
+        return tracer
 
     @abstractmethod
     def __init__(
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from langflow.graph.vertex.base import Vertex
+    from langflow.services.tracing.base import BaseTracer
+
+_STOP = object()
+
+
+class TraceRecord(NamedTuple):
+    """A call to a tracer, captured on the event loop and replayed by the exporter of the tracer.
+
+    The inputs, outputs and logs are snapshots taken when the record is created, so the exporter never reads
+    state that a run is still modifying.
+    """
+
+    kind: Literal["start", "end", "end_run"]
+    tracer: BaseTracer
+    trace_id: str = ""
+    trace_name: str = ""
+    trace_type: str = ""
+    inputs: dict[str, Any] | None = None
+    outputs: dict[str, Any] | None = None
+    metadata: dict[str, Any] | None = None
+    logs: Sequence[Any] = ()
+    error: Exception | None = None
+    vertex: Vertex | None = None
+
+
+class TraceExporter:
+    """Exports the records of one kind of tracer from a dedicated thread.
+
+    Tracer SDKs make blocking calls, which would stall every request served by the event loop if they were
+    made there. Records wait in a buffer of at most `buffer_size` records, and are exported by batches of at
+    most `batch_size` records each time the thread wakes up. A tracer that falls behind loses the records that
+    do not fit in the buffer, which are counted in `dropped`, instead of slowing down runs or growing memory.
+    """
+
+    def __init__(self, name: str, *, buffer_size: int = 10000, batch_size: int = 100) -> None:
+        self.name = name
+        self.buffer_size = buffer_size
+        self.batch_size = max(batch_size, 1)
+        self.exported = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=f"trace-exporter-{name}", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, record: TraceRecord) -> bool:
+        """Queues a record for export, returns False if the buffer is full and the record was dropped."""
+        with self._lock:
+            if self._pending >= self.buffer_size:
+                self.dropped += 1
+                return False
+            self._pending += 1
+        self._queue.put(record)
+        return True
+
+    def flush(self) -> Future:
+        """Returns a future completed once every record submitted before the call has been exported."""
+        future: Future = Future()
+        if not self._thread.is_alive():
+            future.set_result(None)
+        else:
+            self._queue.put(future)
+        return future
+
+    def close(self, timeout: float | None = None) -> None:
+        """Exports the buffered records and stops the thread, waiting at most `timeout` seconds."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        if self._pending or self.dropped:
+            logger.debug(f"Trace exporter {self.name} closed with {self._pending} pending, {self.dropped} dropped")
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "exported": self.exported,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "pending": self._pending,
+            "batches": self.batches,
+        }
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for item in batch:
+                try:
+                    if item is _STOP:
+                        stop = True
+                    elif isinstance(item, Future):
+                        # The future is cancelled when the flush waiting on it timed out
+                        if item.set_running_or_notify_cancel():
+                            item.set_result(None)
+                    else:
+                        self._export(item)
+                except Exception:  # noqa: BLE001
+                    logger.exception(f"Error in the trace exporter {self.name}")
+            self.batches += 1
+            if stop:
+                return
+
+    def _export(self, record: TraceRecord) -> None:
+        try:
+            self._call_tracer(record)
+            self.exported += 1
+        except Exception:  # noqa: BLE001
+            self.failed += 1
+            logger.exception(f"Error exporting {record.kind} trace {record.trace_name} to {self.name}")
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    @staticmethod
+    def _call_tracer(record: TraceRecord) -> None:
+        if record.kind == "start":
+            record.tracer.add_trace(
+                record.trace_id,
+                record.trace_name,
+                record.trace_type,
+                record.inputs or {},
+                record.metadata or {},
+                record.vertex,
+            )
+        elif record.kind == "end":
+            record.tracer.end_trace(
+                trace_id=record.trace_id,
+                trace_name=record.trace_name,
+                outputs=record.outputs or {},
+                error=record.error,
+                logs=record.logs,
+            )
+        else:
+            record.tracer.end(
+                record.inputs or {},
+                outputs=record.outputs or {},
+                error=record.error,
+                metadata=record.metadata or {},
+            )
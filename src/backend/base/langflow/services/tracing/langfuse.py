@@ -111,7 +111,8 @@ class LangFuseTracer(BaseTracer):
         # else:
         span = self.trace.span(**serialize(content_span))
 
-        self.spans[trace_id] = span
+        with self.lock:
+            self.spans[trace_id] = span
 
     @override
     def end_trace(
@@ -126,7 +127,8 @@ class LangFuseTracer(BaseTracer):
         if not self._ready:
             return
 
-        span = self.spans.pop(trace_id, None)
+        with self.lock:
+            span = self.spans.pop(trace_id, None)
         if span:
             output: dict = {}
             output |= outputs or {}
@@ -158,7 +160,8 @@ class LangFuseTracer(BaseTracer):
             return None
 
         # get callback from parent span
-        stateful_client = self.spans[next(reversed(self.spans))] if len(self.spans) > 0 else self.trace
+        with self.lock:
+            stateful_client = self.spans[next(reversed(self.spans))] if len(self.spans) > 0 else self.trace
         return stateful_client.get_langchain_handler()
 
     @staticmethod
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import threading
 from collections import defaultdict
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
@@ -10,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.services.base import Service
+from langflow.services.tracing.exporter import TraceExporter, TraceRecord
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -75,10 +77,6 @@ class TraceContext:
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
 
-        self.traces_queue: asyncio.Queue = asyncio.Queue()
-        self.running = False
-        self.worker_task: asyncio.Task | None = None
-
 
 class ComponentTraceContext:
     def __init__(
@@ -104,6 +102,9 @@ class ComponentTraceContext:
 class TracingService(Service):
     """Tracing service.
 
+    The calls to the tracers are captured as records and made from a dedicated thread per kind of tracer,
+    see `TraceExporter`, so that slow tracer backends do not block the event loop.
+
     To trace a graph run:
         1. start_tracers: start a trace for a graph run
         2. with trace_component: start a sub-trace for a component build, three methods are available:
@@ -120,25 +121,48 @@ class TracingService(Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
         self.deactivated = self.settings_service.settings.deactivate_tracing
+        self._exporters: dict[str, TraceExporter] = {}
+        self._exporters_lock = threading.Lock()
+
+    def _get_exporter(self, tracer_name: str) -> TraceExporter:
+        exporter = self._exporters.get(tracer_name)
+        if exporter is None:
+            with self._exporters_lock:
+                exporter = self._exporters.get(tracer_name)
+                if exporter is None:
+                    settings = self.settings_service.settings
+                    exporter = TraceExporter(
+                        tracer_name,
+                        buffer_size=settings.tracing_buffer_size,
+                        batch_size=settings.tracing_batch_size,
+                    )
+                    self._exporters[tracer_name] = exporter
+        return exporter
 
-    async def _trace_worker(self, trace_context: TraceContext) -> None:
-        while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
-            try:
-                trace_func(*args)
-            except Exception:  # noqa: BLE001
-                logger.exception("Error processing trace_func")
-            finally:
-                trace_context.traces_queue.task_done()
-
-    async def _start(self, trace_context: TraceContext) -> None:
-        if trace_context.running:
+    def _export(self, tracer_name: str, record: TraceRecord) -> None:
+        if not self._get_exporter(tracer_name).submit(record):
+            logger.debug(f"Dropped {record.kind} trace {record.trace_name} for {tracer_name}, its buffer is full")
+
+    async def _flush(self, tracer_names: list[str]) -> None:
+        """Waits until the records submitted so far to these tracers are exported, or the flush timeout."""
+        futures = [asyncio.wrap_future(self._get_exporter(name).flush()) for name in tracer_names]
+        if not futures:
             return
-        try:
-            trace_context.running = True
-            trace_context.worker_task = asyncio.create_task(self._trace_worker(trace_context))
-        except Exception:  # noqa: BLE001
-            logger.exception("Error starting tracing service")
+        _, pending = await asyncio.wait(futures, timeout=self.settings_service.settings.tracing_flush_timeout)
+        for future in pending:
+            future.cancel()
+
+    def export_stats(self) -> dict[str, dict[str, int]]:
+        """Returns the counters of the exporter of each tracer."""
+        return {name: exporter.stats() for name, exporter in list(self._exporters.items())}
+
+    async def teardown(self) -> None:
+        with self._exporters_lock:
+            exporters = list(self._exporters.values())
+            self._exporters.clear()
+        timeout = self.settings_service.settings.tracing_flush_timeout
+        for exporter in exporters:
+            await asyncio.to_thread(exporter.close, timeout)
 
     def _initialize_langsmith_tracer(self, trace_context: TraceContext) -> None:
         langsmith_tracer = _get_langsmith_tracer()
@@ -213,7 +237,6 @@ class TracingService(Service):
             project_name = project_name or os.getenv("LANGCHAIN_PROJECT", "Langflow")
             trace_context = TraceContext(run_id, run_name, project_name, user_id, session_id)
             trace_context_var.set(trace_context)
-            await self._start(trace_context)
             self._initialize_langsmith_tracer(trace_context)
             self._initialize_langwatch_tracer(trace_context)
             self._initialize_langfuse_tracer(trace_context)
@@ -222,38 +245,30 @@ class TracingService(Service):
         except Exception as e:  # noqa: BLE001
             logger.debug(f"Error initializing tracers: {e}")
 
-    async def _stop(self, trace_context: TraceContext) -> None:
-        try:
-            trace_context.running = False
-            # check the qeue is empty
-            if not trace_context.traces_queue.empty():
-                await trace_context.traces_queue.join()
-            if trace_context.worker_task:
-                trace_context.worker_task.cancel()
-                trace_context.worker_task = None
-
-        except Exception:  # noqa: BLE001
-            logger.exception("Error stopping tracing service")
-
     def _end_all_tracers(self, trace_context: TraceContext, outputs: dict, error: Exception | None = None) -> None:
-        for tracer in trace_context.tracers.values():
+        all_inputs = {name: dict(inputs) for name, inputs in trace_context.all_inputs.items()}
+        all_outputs = {name: dict(outputs_) for name, outputs_ in trace_context.all_outputs.items()}
+        for tracer_name, tracer in trace_context.tracers.items():
             if tracer.ready:
-                try:
-                    # why all_inputs and all_outputs? why metadata=outputs?
-                    tracer.end(
-                        trace_context.all_inputs,
-                        outputs=trace_context.all_outputs,
+                # why all_inputs and all_outputs? why metadata=outputs?
+                self._export(
+                    tracer_name,
+                    TraceRecord(
+                        "end_run",
+                        tracer,
+                        trace_name=trace_context.run_name or "",
+                        inputs=all_inputs,
+                        outputs=all_outputs,
+                        metadata=dict(outputs or {}),
                         error=error,
-                        metadata=outputs,
-                    )
-                except Exception:  # noqa: BLE001
-                    logger.error("Error ending all traces")
+                    ),
+                )
 
     async def end_tracers(self, outputs: dict, error: Exception | None = None) -> None:
         """End the trace for a graph run.
 
-        - stop worker for current trace_context
         - call end for all the tracers
+        - wait for the traces of the run to be exported
         """
         if self.deactivated:
             return
@@ -261,8 +276,8 @@ class TracingService(Service):
         if trace_context is None:
             msg = "called end_tracers but no trace context found"
             raise RuntimeError(msg)
-        await self._stop(trace_context)
         self._end_all_tracers(trace_context, outputs, error)
+        await self._flush(list(trace_context.tracers))
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
@@ -280,20 +295,22 @@ class TracingService(Service):
         inputs = self._cleanup_inputs(component_trace_context.inputs)
         component_trace_context.inputs = inputs
         component_trace_context.inputs_metadata = component_trace_context.inputs_metadata or {}
-        for tracer in trace_context.tracers.values():
+        for tracer_name, tracer in trace_context.tracers.items():
             if not tracer.ready:
                 continue
-            try:
-                tracer.add_trace(
-                    component_trace_context.trace_id,
-                    component_trace_context.trace_name,
-                    component_trace_context.trace_type,
-                    inputs,
-                    component_trace_context.inputs_metadata,
-                    component_trace_context.vertex,
-                )
-            except Exception:  # noqa: BLE001
-                logger.exception(f"Error starting trace {component_trace_context.trace_name}")
+            self._export(
+                tracer_name,
+                TraceRecord(
+                    "start",
+                    tracer,
+                    trace_id=component_trace_context.trace_id,
+                    trace_name=component_trace_context.trace_name,
+                    trace_type=component_trace_context.trace_type,
+                    inputs=inputs,
+                    metadata=dict(component_trace_context.inputs_metadata),
+                    vertex=component_trace_context.vertex,
+                ),
+            )
 
     def _end_component_traces(
         self,
@@ -301,18 +318,23 @@ class TracingService(Service):
         trace_context: TraceContext,
         error: Exception | None = None,
     ) -> None:
-        for tracer in trace_context.tracers.values():
+        trace_name = component_trace_context.trace_name
+        outputs = dict(trace_context.all_outputs[trace_name])
+        logs = list(component_trace_context.logs[trace_name])
+        for tracer_name, tracer in trace_context.tracers.items():
             if tracer.ready:
-                try:
-                    tracer.end_trace(
+                self._export(
+                    tracer_name,
+                    TraceRecord(
+                        "end",
+                        tracer,
                         trace_id=component_trace_context.trace_id,
-                        trace_name=component_trace_context.trace_name,
-                        outputs=trace_context.all_outputs[component_trace_context.trace_name],
+                        trace_name=trace_name,
+                        outputs=outputs,
+                        logs=logs,
                         error=error,
-                        logs=component_trace_context.logs[component_trace_context.trace_name],
-                    )
-                except Exception:  # noqa: BLE001
-                    logger.exception(f"Error ending trace {component_trace_context.trace_name}")
+                    ),
+                )
 
     @asynccontextmanager
     async def trace_component(
@@ -345,18 +367,14 @@ class TracingService(Service):
             msg = "called trace_component but no trace context found"
             raise RuntimeError(msg)
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        self._start_component_traces(component_trace_context, trace_context)
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            self._end_component_traces(component_trace_context, trace_context, e)
             raise
         else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
-            )
+            self._end_component_traces(component_trace_context, trace_context, None)
 
     @property
     def project_name(self):
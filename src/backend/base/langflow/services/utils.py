@@ -17,7 +17,7 @@ from langflow.services.database.utils import initialize_database
 from langflow.services.schema import ServiceType
 from langflow.services.settings.constants import DEFAULT_SUPERUSER, DEFAULT_SUPERUSER_PASSWORD
 
-from .deps import get_db_service, get_service, get_settings_service
+from .deps import get_build_log_service, get_db_service, get_service, get_settings_service
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -131,11 +131,23 @@ async def teardown_superuser(settings_service, session: AsyncSession) -> None:
 
 async def teardown_services() -> None:
     """Teardown all the services."""
+    try:
+        # Write the buffered vertex builds and transactions while the database is still available
+        await get_build_log_service().stop()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
     try:
         async with get_db_service().with_session() as session:
             await teardown_superuser(get_settings_service(), session)
     except Exception as exc:  # noqa: BLE001
         logger.exception(exc)
+    try:
+        from langflow.memory import get_session_history_cache
+
+        # The cached histories belong to the database that is going away
+        get_session_history_cache().clear()
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
     try:
         from langflow.services.manager import service_manager
 
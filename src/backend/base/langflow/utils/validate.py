@@ -1,8 +1,17 @@
 import ast
+import asyncio
 import contextlib
+import functools
+import hashlib
 import importlib
+import importlib.util
+import marshal
+import os
+import threading
 import warnings
-from types import FunctionType
+from collections import OrderedDict
+from pathlib import Path
+from types import CodeType, FunctionType
 from typing import Optional, Union
 
 from langchain_core._api.deprecation import LangChainDeprecationWarning
@@ -11,6 +20,14 @@ from pydantic import ValidationError
 
 from langflow.field_typing.constants import CUSTOM_COMPONENT_SUPPORTED_TYPES, DEFAULT_IMPORT_STRING
 
+# An import spec is ("import", module name, variable name) or ("from", module name, attribute name)
+ImportSpec = tuple[str, str, str]
+CompiledClass = tuple[list[ImportSpec], CodeType | None, CodeType]
+
+BYTECODE_CACHE_DIR_NAME = "component_bytecode"
+_class_cache: OrderedDict[str, type] = OrderedDict()
+_class_cache_lock = threading.Lock()
+
 
 def add_type_ignores() -> None:
     if not hasattr(ast, "TypeIgnore"):
@@ -192,14 +209,30 @@ def create_class(code, class_name):
     )
 
     code = DEFAULT_IMPORT_STRING + "\n" + code
+    cache_key = hashlib.sha256(f"{class_name}\0{code}".encode()).hexdigest()
+    with _class_cache_lock:
+        if (cached_class := _class_cache.get(cache_key)) is not None:
+            _class_cache.move_to_end(cache_key)
+            return cached_class
     try:
-        module = ast.parse(code)
-        exec_globals = prepare_global_scope(module)
-
-        class_code = extract_class_code(module, class_name)
-        compiled_class = compile_class_code(class_code)
+        loop = _get_running_loop()
+        # The event loop never waits on the disk: it only writes the bytecode, from a thread, for the others
+        compiled = _load_compiled_class(cache_key) if loop is None else None
+        if compiled is None:
+            module = ast.parse(code)
+            compiled = (
+                get_import_specs(module),
+                compile_definitions(module),
+                compile_class_code(extract_class_code(module, class_name)),
+            )
+            if loop is None:
+                _store_compiled_class(cache_key, compiled)
+            else:
+                loop.run_in_executor(None, _store_compiled_class, cache_key, compiled)
+        import_specs, definitions_code, compiled_class = compiled
+        exec_globals = build_global_scope(import_specs, definitions_code)
 
-        return build_class_constructor(compiled_class, exec_globals, class_name)
+        created_class = build_class_constructor(compiled_class, exec_globals, class_name)
 
     except SyntaxError as e:
         msg = f"Syntax error in code: {e!s}"
@@ -215,6 +248,83 @@ def create_class(code, class_name):
         msg = f"Error creating class: {e!s}"
         raise ValueError(msg) from e
 
+    _cache_class(cache_key, created_class)
+    return created_class
+
+
+def _cache_class(cache_key: str, created_class: type) -> None:
+    from langflow.services.deps import get_settings_service
+
+    max_size = get_settings_service().settings.component_class_cache_size
+    if max_size <= 0:
+        return
+    with _class_cache_lock:
+        _class_cache[cache_key] = created_class
+        _class_cache.move_to_end(cache_key)
+        while len(_class_cache) > max_size:
+            _class_cache.popitem(last=False)
+
+
+def clear_class_cache() -> None:
+    """Forgets every class created by `create_class`, e.g. after the component modules were reloaded."""
+    with _class_cache_lock:
+        _class_cache.clear()
+
+
+def _get_running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_bytecode_cache_dir() -> Path | None:
+    from langflow.services.deps import get_settings_service
+
+    settings = get_settings_service().settings
+    if not settings.component_bytecode_cache or not settings.config_dir:
+        return None
+    return Path(settings.config_dir) / BYTECODE_CACHE_DIR_NAME
+
+
+def _load_compiled_class(cache_key: str) -> CompiledClass | None:
+    """Reads the code objects compiled by an earlier process, if any.
+
+    Files start with the bytecode magic number of the interpreter that wrote them, so a cache left
+    behind by another Python version is ignored.
+    """
+    if (cache_dir := _get_bytecode_cache_dir()) is None:
+        return None
+    try:
+        data = (cache_dir / f"{cache_key}.bin").read_bytes()
+    except OSError:
+        return None
+    magic = importlib.util.MAGIC_NUMBER
+    if not data.startswith(magic):
+        return None
+    try:
+        # The cache directory is only written by Langflow itself
+        import_specs, definitions_code, class_code = marshal.loads(data[len(magic) :])  # noqa: S302
+    except (EOFError, ValueError, TypeError):
+        logger.debug(f"Ignoring corrupted component bytecode {cache_key}")
+        return None
+    return [tuple(spec) for spec in import_specs], definitions_code, class_code
+
+
+def _store_compiled_class(cache_key: str, compiled: CompiledClass) -> None:
+    if (cache_dir := _get_bytecode_cache_dir()) is None:
+        return
+    import_specs, definitions_code, class_code = compiled
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{cache_key}.bin"
+        # Written to a temporary file first so that other workers never read a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(importlib.util.MAGIC_NUMBER + marshal.dumps((import_specs, definitions_code, class_code)))
+        tmp_path.replace(path)
+    except OSError:
+        logger.opt(exception=True).debug(f"Could not write component bytecode {cache_key}")
+
 
 def create_type_ignore_class():
     """Create a TypeIgnore class for AST module if it doesn't exist.
@@ -241,32 +351,67 @@ def prepare_global_scope(module):
     Raises:
         ModuleNotFoundError: If a module is not found in the code
     """
-    exec_globals = globals().copy()
-    imports = []
-    import_froms = []
-    definitions = []
+    return build_global_scope(get_import_specs(module), compile_definitions(module))
+
+
+def get_import_specs(module) -> list[ImportSpec]:
+    """Lists the imports of the module, plain imports first.
+
+    Args:
+        module: AST parsed module
 
+    Returns:
+        List of import specs that `build_global_scope` can resolve without the AST
+    """
+    imports: list[ImportSpec] = []
+    import_froms: list[ImportSpec] = []
     for node in module.body:
         if isinstance(node, ast.Import):
-            imports.append(node)
+            imports.extend(("import", alias.name, alias.asname or alias.name) for alias in node.names)
         elif isinstance(node, ast.ImportFrom) and node.module is not None:
-            import_froms.append(node)
-        elif isinstance(node, ast.ClassDef | ast.FunctionDef | ast.Assign):
-            definitions.append(node)
+            import_froms.extend(("from", node.module, alias.name) for alias in node.names)
+    return imports + import_froms
+
+
+def compile_definitions(module) -> CodeType | None:
+    """Compiles the top-level classes, functions and assignments of the module.
+
+    Args:
+        module: AST parsed module
+
+    Returns:
+        Compiled code object of the definitions, or None if there are none
+    """
+    definitions = [node for node in module.body if isinstance(node, ast.ClassDef | ast.FunctionDef | ast.Assign)]
+    if not definitions:
+        return None
+    return compile(ast.Module(body=definitions, type_ignores=[]), "<string>", "exec")
+
+
+def build_global_scope(import_specs: list[ImportSpec], definitions_code: CodeType | None) -> dict:
+    """Builds the global scope of a component from its imports and compiled definitions.
 
-    for node in imports:
-        for alias in node.names:
+    Args:
+        import_specs: Imports returned by `get_import_specs`
+        definitions_code: Code object returned by `compile_definitions`
+
+    Returns:
+        Dictionary representing the global scope with imported modules
+
+    Raises:
+        ModuleNotFoundError: If a module is not found in the code
+    """
+    exec_globals = globals().copy()
+
+    for kind, module_name, name in import_specs:
+        if kind == "import":
             try:
-                module_name = alias.name
-                variable_name = alias.asname or alias.name
-                exec_globals[variable_name] = importlib.import_module(module_name)
+                exec_globals[name] = importlib.import_module(module_name)
             except ModuleNotFoundError as e:
-                msg = f"Module {alias.name} not found. Please install it and try again."
+                msg = f"Module {module_name} not found. Please install it and try again."
                 raise ModuleNotFoundError(msg) from e
-
-    for node in import_froms:
+            continue
         try:
-            module_name = node.module
             # Apply warning suppression only when needed
             if "langchain" in module_name:
                 with warnings.catch_warnings():
@@ -275,22 +420,18 @@ def prepare_global_scope(module):
             else:
                 imported_module = importlib.import_module(module_name)
 
-            for alias in node.names:
-                try:
-                    # First try getting it as an attribute
-                    exec_globals[alias.name] = getattr(imported_module, alias.name)
-                except AttributeError:
-                    # If that fails, try importing the full module path
-                    full_module_path = f"{module_name}.{alias.name}"
-                    exec_globals[alias.name] = importlib.import_module(full_module_path)
+            try:
+                # First try getting it as an attribute
+                exec_globals[name] = getattr(imported_module, name)
+            except AttributeError:
+                # If that fails, try importing the full module path
+                exec_globals[name] = importlib.import_module(f"{module_name}.{name}")
         except ModuleNotFoundError as e:
-            msg = f"Module {node.module} not found. Please install it and try again"
+            msg = f"Module {module_name} not found. Please install it and try again"
             raise ModuleNotFoundError(msg) from e
 
-    if definitions:
-        combined_module = ast.Module(body=definitions, type_ignores=[])
-        compiled_code = compile(combined_module, "<string>", "exec")
-        exec(compiled_code, exec_globals)
+    if definitions_code is not None:
+        exec(definitions_code, exec_globals)
 
     return exec_globals
 
@@ -388,6 +529,7 @@ def extract_function_name(code):
     raise ValueError(msg)
 
 
+@functools.lru_cache(maxsize=256)
 def extract_class_name(code: str) -> str:
     """Extract the name of the first Component subclass found in the code.
 
@@ -1,12 +1,24 @@
+from __future__ import annotations
+
 import asyncio
 import base64
+import math
+import queue
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-from scipy.signal import resample
+import webrtcvad
+from scipy.signal import firwin, resample, upfirdn
 
 from langflow.logging import logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 SAMPLE_RATE_24K = 24000
 VAD_SAMPLE_RATE_16K = 16000
 FRAME_DURATION_MS = 20
@@ -75,6 +87,183 @@ def resample_24k_to_16k(frame_24k_bytes):
 #
 
 
+@lru_cache
+def _polyphase_filter(up: int, down: int) -> np.ndarray:
+    """Return the anti-aliasing filter `scipy.signal.resample_poly` designs to resample by `up / down`.
+
+    It is computed once per ratio and shared by every resampler.
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    h = firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)) * up
+    h.setflags(write=False)
+    return h
+
+
+class StreamingResampler:
+    """Resamples a stream of 16-bit PCM chunks with a polyphase filter.
+
+    The input samples the filter still needs are carried from one chunk to the next, so chunks of any
+    size, including an odd number of bytes, produce the same samples as resampling the whole stream at
+    once, delayed by the filter. Each chunk is resampled by a single `scipy.signal.upfirdn` call instead
+    of a FFT per frame.
+    """
+
+    def __init__(self, up: int = 2, down: int = 3) -> None:
+        divisor = math.gcd(up, down)
+        self.up = up // divisor
+        self.down = down // divisor
+        self._filter = _polyphase_filter(self.up, self.down)
+        self._taps = -(-len(self._filter) // self.up)
+        # The carried samples always start at a multiple of `down` in the stream, which is where an output
+        # sample starts, so that the outputs of upfirdn line up with the outputs of the stream.
+        self._history = np.zeros(-(-self._taps // self.down) * self.down)
+        self._input_count = 0
+        self._output_count = 0
+        self._pending_byte = b""
+
+    def process(self, pcm: bytes) -> np.ndarray:
+        """Resample a chunk of 16-bit PCM, returning the int16 output samples it completes."""
+        if self._pending_byte:
+            pcm = self._pending_byte + pcm
+            self._pending_byte = b""
+        if len(pcm) % BYTES_PER_SAMPLE:
+            self._pending_byte = pcm[-1:]
+            pcm = pcm[:-1]
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        if not len(samples):
+            return np.zeros(0, dtype=np.int16)
+
+        buffer = np.concatenate([self._history, samples])
+        # Index in the output stream of the first output sample of the buffer
+        offset = (self._input_count - len(self._history)) * self.up // self.down
+        self._input_count += len(samples)
+        # The last output sample whose input samples have all been received
+        end = (self._input_count - 1) * self.up // self.down + 1
+        # The next output sample can depend on the last `taps` input samples
+        keep = len(buffer) - (len(buffer) - self._taps) // self.down * self.down
+        self._history = buffer[len(buffer) - keep :]
+        if end <= self._output_count:
+            return np.zeros(0, dtype=np.int16)
+
+        output = upfirdn(self._filter, buffer, self.up, self.down)[self._output_count - offset : end - offset]
+        self._output_count = end
+        return np.clip(np.rint(output), -32768, 32767).astype(np.int16)
+
+
+class VoiceActivityPipeline:
+    """Detects speech in the 24kHz audio of a voice session from a dedicated thread.
+
+    `feed` only queues the base64 chunks received from the client, so the event loop does not decode,
+    resample or run the VAD on audio. The thread resamples each chunk to 16kHz, writes it to a ring buffer
+    of whole 20ms frames and runs the VAD on memoryview slices of the ring, without copying the frames.
+    `on_speech` is called, on `loop` when given, once per chunk in which speech was detected.
+
+    The thread CPU time spent per second of audio is tracked in `stats`. Chunks that arrive while more
+    than `max_pending_chunks` are waiting are dropped, so a slow session cannot grow memory.
+    """
+
+    def __init__(
+        self,
+        on_speech: Callable[[], object],
+        *,
+        loop: asyncio.AbstractEventLoop | None = None,
+        mode: int = 3,
+        ring_frames: int = 50,
+        max_pending_chunks: int = 500,
+    ) -> None:
+        self.on_speech = on_speech
+        self.loop = loop
+        self.max_pending_chunks = max_pending_chunks
+        self.frames = 0
+        self.speech_frames = 0
+        self.dropped = 0
+        self.failed = 0
+        self.audio_bytes = 0
+        self.cpu_seconds = 0.0
+        self._vad = webrtcvad.Vad(mode)
+        self._resampler = StreamingResampler(2, 3)
+        self._ring = bytearray(ring_frames * BYTES_PER_16K_FRAME)
+        self._view = memoryview(self._ring)
+        # Positions in the stream of the next byte to read and to write, the ring holds write - read bytes
+        self._read = 0
+        self._write = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="voice-activity", daemon=True)
+        self._thread.start()
+
+    def feed(self, audio_base64: str) -> bool:
+        """Queue a base64 chunk of 24kHz PCM, returns False if it was dropped."""
+        with self._lock:
+            if self._pending >= self.max_pending_chunks:
+                self.dropped += 1
+                return False
+            self._pending += 1
+        self._queue.put(audio_base64)
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """Process the queued chunks and stop the thread, waiting at most `timeout` seconds."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self._view.release()
+
+    def stats(self) -> dict[str, float]:
+        audio_seconds = self.audio_bytes / (SAMPLE_RATE_24K * BYTES_PER_SAMPLE)
+        return {
+            "audio_seconds": audio_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "cpu_per_audio_second": self.cpu_seconds / audio_seconds if audio_seconds else 0.0,
+            "frames": self.frames,
+            "speech_frames": self.speech_frames,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def _run(self) -> None:
+        while (audio_base64 := self._queue.get()) is not None:
+            started = time.thread_time()
+            try:
+                self._process(base64.b64decode(audio_base64))
+            except Exception as e:  # noqa: BLE001
+                # A bad chunk, or a failing callback, must not stop the VAD of the rest of the stream
+                self.failed += 1
+                logger.error(f"VAD processing failed: {e}")
+            finally:
+                self.cpu_seconds += time.thread_time() - started
+                with self._lock:
+                    self._pending -= 1
+
+    def _process(self, chunk_24k: bytes) -> None:
+        self.audio_bytes += len(chunk_24k)
+        data = memoryview(self._resampler.process(chunk_24k)).cast("B")
+        capacity = len(self._ring)
+        has_speech = False
+        while data:
+            start = self._write % capacity
+            size = min(len(data), capacity - (self._write - self._read), capacity - start)
+            self._view[start : start + size] = data[:size]
+            self._write += size
+            data = data[size:]
+            # The capacity is a multiple of the frame size, so frames never wrap around the ring
+            while self._write - self._read >= BYTES_PER_16K_FRAME:
+                start = self._read % capacity
+                self.frames += 1
+                if self._vad.is_speech(self._view[start : start + BYTES_PER_16K_FRAME], VAD_SAMPLE_RATE_16K):
+                    self.speech_frames += 1
+                    has_speech = True
+                self._read += BYTES_PER_16K_FRAME
+        if has_speech:
+            if self.loop is None:
+                self.on_speech()
+            else:
+                self.loop.call_soon_threadsafe(self.on_speech)
+
+
 async def write_audio_to_file(audio_base64: str, filename: str = "output_audio.raw") -> None:
     """Decode the base64-encoded audio and write (append) it to a file asynchronously."""
     try:
@@ -0,0 +1,90 @@
+"""Benchmark of the request cancellation middleware against the previous polling implementation.
+
+Run with `pytest tests/performance/test_request_cancellation.py -s` to print the requests per second and
+the p99 latency of both middlewares under concurrent long-running requests.
+"""
+
+import asyncio
+import statistics
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+from langflow.middleware import RequestCancelledMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+REQUESTS = 2000
+CONCURRENCY = 200
+HANDLER_SECONDS = 0.05
+
+
+class PollingRequestCancelledMiddleware(BaseHTTPMiddleware):
+    """The previous middleware, which checked for a disconnect every 100 ms."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        sentinel = object()
+
+        async def cancel_handler():
+            while True:
+                if await request.is_disconnected():
+                    return sentinel
+                await asyncio.sleep(0.1)
+
+        handler_task = asyncio.create_task(call_next(request))
+        cancel_task = asyncio.create_task(cancel_handler())
+
+        done, pending = await asyncio.wait([handler_task, cancel_task], return_when=asyncio.FIRST_COMPLETED)
+
+        for task in pending:
+            task.cancel()
+
+        if cancel_task in done:
+            return Response("Request was cancelled", status_code=499)
+        return await handler_task
+
+
+def create_app(middleware) -> FastAPI:
+    app = FastAPI()
+
+    # The polling middleware consumes the request body when checking for a disconnect, so the
+    # benchmarked endpoint doesn't read one
+    @app.get("/run")
+    async def run(index: int) -> dict:
+        await asyncio.sleep(HANDLER_SECONDS)
+        return {"index": index}
+
+    app.add_middleware(middleware)
+    return app
+
+
+async def run_load(app: FastAPI) -> dict[str, float]:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def request(index: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get("/run", params={"index": index})
+                latencies.append(time.perf_counter() - start)
+                assert response.json() == {"index": index}
+
+        start = time.perf_counter()
+        await asyncio.gather(*(request(index) for index in range(REQUESTS)))
+        elapsed = time.perf_counter() - start
+    return {
+        "requests_per_second": REQUESTS / elapsed,
+        "p99_ms": statistics.quantiles(latencies, n=100)[98] * 1000,
+    }
+
+
+@pytest.mark.parametrize("middleware", [PollingRequestCancelledMiddleware, RequestCancelledMiddleware])
+async def test_request_cancellation_throughput(middleware):
+    """Benchmark the throughput and tail latency of a request cancellation middleware."""
+    results = await run_load(create_app(middleware))
+    print(  # noqa: T201
+        f"{middleware.__name__}: {results['requests_per_second']:.0f} requests/s, p99 {results['p99_ms']:.1f} ms"
+    )
+    assert results["p99_ms"] > HANDLER_SECONDS * 1000
@@ -0,0 +1,114 @@
+import asyncio
+from contextlib import AsyncExitStack
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langflow.base.mcp import util
+from langflow.base.mcp.util import MCPSessionPool
+
+
+class FakeStdioClient:
+    connections = 0
+
+    def __init__(self):
+        self.session = None
+        self.exit_stack = AsyncExitStack()
+
+    async def connect_to_server(self, command, env=None):  # noqa: ARG002
+        type(self).connections += 1
+        await asyncio.sleep(0.01)
+        tool = MagicMock()
+        tool.name = "fetch"
+        self.session = AsyncMock()
+        self.session.list_tools.return_value.tools = [tool]
+        return [tool]
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    FakeStdioClient.connections = 0
+    monkeypatch.setattr(util, "MCPStdioClient", FakeStdioClient)
+    return FakeStdioClient
+
+
+async def test_sessions_are_shared_by_server_and_options(fake_client):
+    pool = MCPSessionPool()
+    sessions = await asyncio.gather(*(pool.get_stdio_session("uvx mcp-server-fetch", ["A=1"]) for _ in range(5)))
+    other_env = await pool.get_stdio_session("uvx mcp-server-fetch", ["A=2"])
+
+    assert all(session.pooled is sessions[0].pooled for session in sessions)
+    assert other_env.pooled is not sessions[0].pooled
+    assert fake_client.connections == 2
+    assert pool.stats() == {"sessions": 2, "hits": 4, "misses": 2, "evictions": 0}
+
+    await sessions[0].call_tool("fetch", arguments={"url": "https://example.com"})
+    sessions[0].session.call_tool.assert_awaited_once_with("fetch", arguments={"url": "https://example.com"})
+    await pool.close_all()
+    assert pool.stats()["sessions"] == 0
+    assert sessions[0].session is None
+
+
+async def test_tool_listing_is_cached_for_the_ttl(fake_client):  # noqa: ARG001
+    pool = MCPSessionPool(tools_ttl=60)
+    session = await pool.get_stdio_session("uvx mcp-server-fetch")
+
+    await session.list_tools(ttl=pool.tools_ttl)
+    session.session.list_tools.assert_not_awaited()
+    await session.list_tools(ttl=0)
+    session.session.list_tools.assert_awaited_once()
+    await pool.close_all()
+
+
+async def test_unhealthy_and_idle_sessions_are_replaced(fake_client):
+    pool = MCPSessionPool(idle_timeout=60, health_check_interval=0)
+    session = await pool.get_stdio_session("uvx mcp-server-fetch")
+    session.session.send_ping.side_effect = ConnectionError("server exited")
+
+    reconnected = await pool.get_stdio_session("uvx mcp-server-fetch")
+    assert reconnected.pooled is not session.pooled
+    assert fake_client.connections == 2
+
+    # The lease on the closed session moves to the new one
+    pool.health_check_interval = 60
+    await session.call_tool("fetch")
+    assert session.pooled is reconnected.pooled
+
+    pool.idle_timeout = 0
+    pooled = reconnected.pooled
+    del session, reconnected
+    await pool.evict_idle()
+    assert pool.stats()["sessions"] == 0
+    assert pool.stats()["evictions"] == 1
+    assert pooled.session is None
+
+
+async def test_leased_sessions_are_not_evicted(fake_client):  # noqa: ARG001
+    pool = MCPSessionPool(idle_timeout=0)
+    session = await pool.get_stdio_session("uvx mcp-server-fetch")
+    tool = util.create_tool_coroutine("fetch", MagicMock(), session)
+
+    await pool.evict_idle()
+    assert pool.stats()["sessions"] == 1
+
+    pooled = session.pooled
+    del session, tool
+    await pool.evict_idle()
+    assert pool.stats()["evictions"] == 1
+    assert pooled.session is None
+
+
+async def test_idle_sessions_are_evicted_in_the_background(fake_client):  # noqa: ARG001
+    pool = MCPSessionPool(idle_timeout=0)
+    pooled = (await pool.get_stdio_session("uvx mcp-server-fetch")).pooled
+    pool.start()
+
+    # The reaper wakes up every second at most
+    for _ in range(30):
+        if not pool.stats()["sessions"]:
+            break
+        await asyncio.sleep(0.1)
+    assert pool.stats()["evictions"] == 1
+    assert pooled.session is None
+
+    await pool.close_all()
+    assert pool._reaper is None
@@ -1,9 +1,11 @@
+import asyncio
 from uuid import UUID
 
 import orjson
 import pytest
 from httpx import AsyncClient
 from langflow.components.logic.loop import LoopComponent
+from langflow.graph import Graph
 from langflow.memory import aget_messages
 from langflow.schema.data import Data
 from langflow.services.database.models.flow import FlowCreate
@@ -100,3 +102,27 @@ class TestLoopComponentWithAPI(ComponentTestBaseWithClient):
         assert "outputs" in data
         assert "session_id" in data
         assert len(data["outputs"][-1]["outputs"]) > 0
+
+    async def _run_loop_graph(self, json_loop_test, **loop_params):
+        data = orjson.loads(json_loop_test)["data"]
+        for node in data["nodes"]:
+            template = node["data"]["node"]["template"]
+            if node["data"]["type"] == "ChatInput":
+                template["input_value"]["value"] = TEXT
+            elif node["data"]["type"] == "LoopComponent":
+                for name, value in loop_params.items():
+                    template[name] = {"name": name, "type": type(value).__name__, "value": value, "show": True}
+        graph = await asyncio.to_thread(Graph.from_payload, data)
+        await graph.process(fallback_to_env_vars=False)
+        loop = next(vertex for vertex in graph.vertices if vertex.id.startswith("LoopComponent"))
+        chat_output = next(vertex for vertex in graph.vertices if vertex.id.startswith("ChatOutput"))
+        return loop.results["done"], chat_output.results["message"].text
+
+    @pytest.mark.usefixtures("client")
+    async def test_parallel_mode_matches_sequential_mode(self, json_loop_test):
+        sequential, sequential_text = await self._run_loop_graph(json_loop_test)
+        parallel, parallel_text = await self._run_loop_graph(json_loop_test, parallel=True, max_concurrency=2)
+
+        assert len(parallel) == len(sequential) == 3
+        assert [data.text for data in parallel] == [data.text for data in sequential]
+        assert parallel_text == sequential_text
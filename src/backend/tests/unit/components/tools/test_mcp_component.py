@@ -2,7 +2,8 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from langflow.components.tools.mcp_component import MCPSseClient, MCPStdioClient, MCPToolsComponent
+from langflow.base.mcp.util import MCPSseClient, MCPStdioClient
+from langflow.components.tools.mcp_component import MCPToolsComponent
 
 from tests.base import ComponentTestBaseWithoutClient, VersionComponentMapping
 
@@ -122,7 +123,12 @@ class TestMCPToolsComponent(ComponentTestBaseWithoutClient):
         # Mock get_inputs_for_all_tools to return our mock input
         mock_input = MagicMock()
         mock_input.name = "test_param"
-        with patch.object(component, "get_inputs_for_all_tools") as mock_get_inputs:
+        mock_pool = MagicMock()
+        mock_pool.get_stdio_session = AsyncMock(return_value=AsyncMock(list_tools=AsyncMock(return_value=[mock_tool])))
+        with (
+            patch("langflow.components.tools.mcp_component.get_mcp_session_pool", return_value=mock_pool),
+            patch.object(component, "get_inputs_for_all_tools") as mock_get_inputs,
+        ):
             mock_get_inputs.return_value = {"test_tool": [mock_input]}
             output = await component.build_output()
 
@@ -0,0 +1,36 @@
+import pytest
+from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class {name}(Component):
+    display_name = "{name}"
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        return Message(text=self.text)
+"""
+
+
+@pytest.fixture
+def components_path(tmp_path):
+    category = tmp_path / "custom"
+    category.mkdir()
+    for name in ["Alpha", "Beta", "Gamma"]:
+        (category / f"{name.lower()}.py").write_text(COMPONENT_CODE.format(name=name), encoding="utf-8")
+    (category / "broken.py").write_text("class Broken(:\n", encoding="utf-8")
+    return str(tmp_path)
+
+
+async def test_process_pool_build_matches_in_process_build(components_path):
+    in_process = await abuild_custom_component_list_from_path(components_path)
+    in_pool = await abuild_custom_component_list_from_path(components_path, max_workers=2)
+
+    assert in_pool == in_process
+    assert list(in_pool["custom"]) == list(in_process["custom"])
+    assert {"Alpha", "Beta", "Gamma"} <= set(in_pool["custom"])
@@ -4,8 +4,10 @@ import time
 import uuid
 
 import pytest
+from fastapi.encoders import jsonable_encoder
 from langflow.events.event_manager import EventManager
 from langflow.schema.log import LoggableType
+from langflow.schema.playground_events import create_event_by_type
 
 
 class TestEventManager:
@@ -210,3 +212,58 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+
+class TestTokenFrames:
+    @staticmethod
+    def decode(queue: asyncio.Queue) -> list[dict]:
+        events = []
+        while not queue.empty():
+            _, data, _ = queue.get_nowait()
+            events.append(json.loads(data))
+        return events
+
+    def test_token_fast_path_matches_the_token_event(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        manager.on_token(data={"chunk": "Hi", "id": "message-1"})
+        (event,) = self.decode(queue)
+
+        expected = json.loads(
+            json.dumps(
+                {"event": "token", "data": jsonable_encoder(create_event_by_type("token", chunk="Hi", id="message-1"))}
+            )
+        )
+        assert event == expected
+
+    async def test_tokens_are_sent_in_frames(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue, token_window=0.02, token_window_bytes=8)
+        manager.register_event("on_token", "token")
+        manager.register_event("on_end", "end")
+        for chunk in ["a", "b", "cdefgh", "i"]:
+            manager.on_token(data={"chunk": chunk, "id": "message-1"})
+
+        # The byte window was reached, the time window has not elapsed yet
+        assert [event["data"]["chunk"] for event in self.decode(queue)] == ["abcdefgh"]
+        await asyncio.sleep(0.05)
+        assert [event["data"]["chunk"] for event in self.decode(queue)] == ["i"]
+
+        manager.on_token(data={"chunk": "j", "id": "message-1"})
+        manager.on_end(data={})
+        assert [event["event"] for event in self.decode(queue)] == ["token", "end"]
+
+        stats = manager.token_stats.as_dict()
+        assert (stats["tokens"], stats["frames"]) == (5, 3)
+        assert stats["tokens_per_second"] > 0
+
+    def test_custom_token_callbacks_are_not_loop_safe(self):
+        def callback(manager, event_type, data):
+            pass
+
+        manager = EventManager(asyncio.Queue())
+        manager.register_event("on_token", "token")
+        assert manager.is_loop_safe("on_token")
+        manager.register_event("on_token", "token", callback)
+        assert not manager.is_loop_safe("on_token")
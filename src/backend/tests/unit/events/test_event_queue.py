@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+from langflow.events.event_manager import EventManager
+from langflow.events.event_queue import EventQueue
+
+
+def make_manager(queue: EventQueue) -> EventManager:
+    manager = EventManager(queue)
+    manager.register_event("on_token", "token")
+    manager.register_event("on_end_vertex", "end_vertex")
+    return manager
+
+
+def decode(event) -> tuple[str, dict | None]:
+    event_id, data, _ = event
+    return event_id, json.loads(data) if data is not None else None
+
+
+def drain(queue: EventQueue) -> list[tuple[str, dict | None]]:
+    events = []
+    while not queue.empty():
+        events.append(decode(queue.get_nowait()))
+    return events
+
+
+async def adrain(queue: EventQueue) -> list[tuple[str, dict | None]]:
+    events = []
+    while not queue.empty():
+        events.append(decode(await queue.get()))
+    return events
+
+
+def test_drop_policy_merges_tokens_of_the_same_message():
+    queue = EventQueue(max_size=2, policy="drop")
+    manager = make_manager(queue)
+    for chunk in ["a", "b", "c", "d"]:
+        manager.on_token(data={"chunk": chunk, "id": "message-1"})
+    manager.on_end_vertex(data={"build_data": {"id": "vertex"}})
+
+    events = [event for _, event in drain(queue)]
+    assert [event["data"]["chunk"] for event in events[:2]] == ["a", "bcd"]
+    # Other events are kept even though the queue is full
+    assert events[2]["event"] == "end_vertex"
+    assert queue.stats()["merged"] == 2
+    assert queue.stats()["bytes"] == 0
+
+
+async def test_spill_policy_keeps_every_event_in_order():
+    queue = EventQueue(max_size=3, policy="spill")
+    manager = make_manager(queue)
+    for index in range(10):
+        manager.on_token(data={"chunk": str(index), "id": "message-1"})
+    queue.put_nowait((None, None, 0.0))
+
+    stats = queue.stats()
+    assert (stats["depth"], stats["spilled"], stats["max_depth"]) == (11, 8, 11)
+    events = [decode(await queue.get())]
+    # Events put while others are spilled go to the file too, after them
+    manager.on_token(data={"chunk": "10", "id": "message-1"})
+    events += await adrain(queue)
+    chunks = [event["data"]["chunk"] for _, event in events if event is not None]
+    assert chunks == [str(index) for index in range(11)]
+    assert events[-2] == (None, None)
+    assert queue.stats()["bytes"] == 0
+    queue.close()
+
+
+async def test_block_policy_waits_for_the_consumer():
+    queue = EventQueue(max_size=2, policy="block")
+    manager = make_manager(queue)
+    for chunk in ["a", "b"]:
+        manager.on_token(data={"chunk": chunk, "id": "message-1"})
+
+    waiter = asyncio.create_task(manager.wait_for_capacity())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await queue.get()
+    await asyncio.wait_for(waiter, timeout=1)
@@ -131,6 +131,37 @@ def test_graph_functional_start_end():
     assert results[-1] == Finish()
 
 
+async def test_clone_shares_structure_but_not_run_state():
+    chat_input = ChatInput(_id="chat_input", input_value="hello", should_store_message=False)
+    chat_output = ChatOutput(_id="chat_output", should_store_message=False)
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+
+    clone = graph.clone(user_id="other-user")
+    clone_input = clone.get_vertex("chat_input")
+    clone_output = clone.get_vertex("chat_output")
+    assert clone.edges[0] is graph.edges[0]
+    assert clone.plan is graph.plan
+    assert clone_input.data is graph.get_vertex("chat_input").data
+    assert clone_output.params["input_value"] is clone_input
+    # Components are only copied once used
+    assert clone_output._custom_component is None
+    assert clone_input.custom_component is not chat_input
+    assert clone_input.custom_component._vertex is clone_input
+    assert clone_input.custom_component.user_id == "other-user"
+
+    clone.prepare()
+    results = [result async for result in clone.async_start()]
+    assert results[-1] == Finish()
+    assert clone_output.built
+    assert clone_output.results["message"].text == "hello"
+    assert not graph.get_vertex("chat_output").built
+    assert graph.get_vertex("chat_output").custom_component._outputs_map["message"].value is not (
+        clone_output.custom_component._outputs_map["message"].value
+    )
+
+
 @pytest.mark.skip(reason="Temporarily disabled")
 def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
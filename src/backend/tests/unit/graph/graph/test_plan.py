@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.components.prompts import PromptComponent
+from langflow.graph import Graph
+from langflow.graph.graph.plan import ExecutionPlan
+
+
+def _edge(source_id: str, target_id: str):
+    return SimpleNamespace(source_id=source_id, target_id=target_id)
+
+
+def _graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    prompt = PromptComponent(_id="prompt")
+    prompt.set(template="{question}", question=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=prompt.build_prompt)
+    return Graph(chat_input, chat_output)
+
+
+def test_plan_adjacency():
+    edges = [_edge("a", "b"), _edge("a", "c"), _edge("b", "d"), _edge("c", "d"), _edge("a", "b"), _edge("x", "a")]
+    plan = ExecutionPlan.build(["a", "b", "c", "d"], edges)
+
+    assert len(plan) == 4
+    assert plan.predecessors("d") == ["b", "c"]
+    assert plan.predecessors("a") == []
+    # The first of the duplicated edges, and nothing for edges to unknown vertices
+    assert plan.edge_position("a", "b") == 0
+    assert plan.edge_position("x", "a") is None
+    assert plan.predecessor_map() == {"b": ["a", "a"], "c": ["a"], "d": ["b", "c"]}
+    assert sorted(plan.descendants("a")) == ["b", "c", "d"]
+    assert plan.descendants("d") == []
+
+
+def test_plan_sorted_layers_are_computed_once():
+    plan = ExecutionPlan.build(["a", "b"], [_edge("a", "b")])
+    calls = []
+
+    def sort():
+        calls.append(1)
+        return ["a"], [["b"]]
+
+    first_layer, remaining_layers = plan.sorted_layers(None, None, sort)
+    first_layer.append("mutated")
+    remaining_layers[0].append("mutated")
+
+    assert plan.sorted_layers(None, None, sort) == (["a"], [["b"]])
+    assert len(calls) == 1
+    plan.sorted_layers("b", None, sort)
+    assert len(calls) == 2
+
+
+def test_graph_plan_matches_graph_structure():
+    graph = _graph()
+    plan = graph.plan
+
+    assert plan.vertex_ids == tuple(graph.get_vertex_ids())
+    predecessor_map, _ = graph.build_adjacency_maps(graph.edges)
+    assert {key: sorted(value) for key, value in plan.predecessor_map().items()} == {
+        key: sorted(value) for key, value in predecessor_map.items()
+    }
+    assert graph.get_edge("chat_input", "prompt").target_id == "prompt"
+    assert graph.get_edge("chat_output", "chat_input") is None
+    assert {vertex.id for vertex in graph.get_all_successors(graph.get_vertex("chat_input"))} == {
+        "prompt",
+        "chat_output",
+    }
+
+
+def test_graph_plan_is_shared_by_clones_and_rebuilt_on_change():
+    graph = _graph()
+    graph.prepare()
+    plan = graph.plan
+
+    clone = graph.clone()
+    assert clone.plan is plan
+    assert clone.get_edge("prompt", "chat_output").source_id == "prompt"
+
+    graph.remove_vertex("chat_output")
+    assert graph.plan is not plan
+    assert "chat_output" not in graph.plan.index
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.io import FloatInput, MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class DelayedEcho(Component):
+    display_name = "Delayed Echo"
+    build_log: list[tuple[str, str, float]] = []
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        MessageTextInput(name="other", display_name="Other"),
+        FloatInput(name="delay", display_name="Delay", value=0.0),
+    ]
+    outputs = [Output(display_name="Message", name="message", method="echo")]
+
+    async def echo(self) -> Message:
+        self.build_log.append(("start", self._id, time.perf_counter()))
+        await asyncio.sleep(self.delay)
+        self.build_log.append(("end", self._id, time.perf_counter()))
+        return Message(text=f"{self.text}{self.other or ''}")
+
+
+@pytest.fixture(autouse=True)
+def _no_build_logging(mocker):
+    mocker.patch("langflow.graph.graph.base.log_vertex_build")
+    DelayedEcho.build_log = []
+
+
+def build_wide_graph() -> Graph:
+    """chat_input feeds a slow branch and a fast two-step branch that meet in a join."""
+    chat_input = ChatInput(_id="chat_input", should_store_message=False)
+    slow = DelayedEcho(_id="slow", delay=0.3)
+    slow.set(text=chat_input.message_response)
+    fast = DelayedEcho(_id="fast")
+    fast.set(text=chat_input.message_response)
+    fast_child = DelayedEcho(_id="fast_child")
+    fast_child.set(text=fast.echo)
+    join = DelayedEcho(_id="join")
+    join.set(text=slow.echo, other=fast_child.echo)
+    return Graph(chat_input, join)
+
+
+def starts(vertex_id: str) -> float:
+    return next(ts for event, v_id, ts in DelayedEcho.build_log if event == "start" and v_id == vertex_id)
+
+
+def ends(vertex_id: str) -> float:
+    return next(ts for event, v_id, ts in DelayedEcho.build_log if event == "end" and v_id == vertex_id)
+
+
+@pytest.mark.parametrize("scheduler", ["layered", "as_completed"])
+async def test_schedulers_build_every_vertex(scheduler):
+    graph = build_wide_graph()
+    await graph.process(fallback_to_env_vars=False, start_component_id="chat_input", scheduler=scheduler)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert ends("join") >= max(ends("slow"), ends("fast_child"))
+
+
+async def test_as_completed_does_not_wait_for_the_slow_branch():
+    graph = build_wide_graph()
+    await graph.process(fallback_to_env_vars=False, start_component_id="chat_input", scheduler="as_completed")
+
+    # fast_child only depends on fast, so it must not wait for the slow vertex of the same layer
+    assert starts("fast_child") < ends("slow")
+
+
+async def test_layered_waits_for_the_whole_layer():
+    graph = build_wide_graph()
+    await graph.process(fallback_to_env_vars=False, start_component_id="chat_input", scheduler="layered")
+
+    assert starts("fast_child") >= ends("slow")
+
+
+async def test_as_completed_respects_max_concurrency():
+    graph = build_wide_graph()
+    await graph.process(
+        fallback_to_env_vars=False, start_component_id="chat_input", scheduler="as_completed", max_concurrency=1
+    )
+
+    running = 0
+    max_running = 0
+    for event, _, _ in sorted(DelayedEcho.build_log, key=lambda entry: entry[2]):
+        running += 1 if event == "start" else -1
+        max_running = max(max_running, running)
+    assert max_running == 1
+
+
+async def test_as_completed_reruns_vertices_that_become_runnable_while_running(mocker):
+    graph = build_wide_graph()
+    get_next_runnable_vertices = graph.get_next_runnable_vertices
+    rescheduled = []
+
+    async def next_runnable_vertices(lock, vertex, *, cache=True):
+        next_vertices = await get_next_runnable_vertices(lock, vertex, cache=cache)
+        if vertex.id == "fast" and not rescheduled:
+            # As a loop would, make the slow vertex runnable again while it is still running
+            rescheduled.append("slow")
+            return [*next_vertices, "slow"]
+        return next_vertices
+
+    mocker.patch.object(graph, "get_next_runnable_vertices", side_effect=next_runnable_vertices)
+    build_vertex = mocker.patch.object(graph, "build_vertex", side_effect=graph.build_vertex)
+    await graph.process(fallback_to_env_vars=False, start_component_id="chat_input", scheduler="as_completed")
+
+    built_vertex_ids = [call.kwargs["vertex_id"] for call in build_vertex.call_args_list]
+    assert rescheduled == ["slow"]
+    assert built_vertex_ids.count("slow") == 2
+
+
+async def test_as_completed_waits_for_cancelled_tasks_on_failure(mocker):
+    graph = build_wide_graph()
+    build_vertex = graph.build_vertex
+
+    async def failing_build_vertex(vertex_id, **kwargs):
+        if vertex_id == "fast":
+            msg = "fast failed"
+            raise ValueError(msg)
+        return await build_vertex(vertex_id, **kwargs)
+
+    mocker.patch.object(graph, "build_vertex", side_effect=failing_build_vertex)
+    with pytest.raises(ValueError, match="fast failed"):
+        await graph.process(fallback_to_env_vars=False, start_component_id="chat_input", scheduler="as_completed")
+
+    assert not [task for task in asyncio.all_tasks() if task.get_name().startswith("slow Run")]
+
+
+async def test_invalid_scheduler():
+    graph = build_wide_graph()
+    with pytest.raises(ValueError, match="Invalid scheduler"):
+        await graph.process(fallback_to_env_vars=False, start_component_id="chat_input", scheduler="unknown")
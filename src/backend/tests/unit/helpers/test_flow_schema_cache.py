@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langflow.helpers import flow as flow_helpers
+from langflow.helpers.flow import aget_flow_input_schemas, get_flow_schema_cache
+from langflow.services.database.models.flow import Flow
+from sqlmodel import select
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    get_flow_schema_cache().clear()
+    yield
+    get_flow_schema_cache().clear()
+
+
+@pytest.fixture
+def schema_calls(monkeypatch):
+    calls = []
+    original = flow_helpers.json_schema_from_flow_data
+
+    def counting(flow_data):
+        calls.append(flow_data)
+        return original(flow_data)
+
+    monkeypatch.setattr(flow_helpers, "json_schema_from_flow_data", counting)
+    return calls
+
+
+async def list_flows(session):
+    return (await session.exec(select(Flow.id, Flow.updated_at))).all()
+
+
+async def test_schemas_are_computed_once_per_flow_version(async_session, schema_calls):
+    flows = [Flow(name=f"Flow {index}", data={"nodes": [], "edges": []}) for index in range(3)]
+    async_session.add_all(flows)
+    await async_session.commit()
+
+    schemas = await aget_flow_input_schemas(async_session, await list_flows(async_session))
+    assert set(schemas) == {flow.id for flow in flows}
+    assert schemas[flows[0].id] == {"type": "object", "properties": {}, "required": []}
+    assert len(schema_calls) == 3
+
+    await aget_flow_input_schemas(async_session, await list_flows(async_session))
+    assert len(schema_calls) == 3
+
+    flows[0].updated_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+    async_session.add(flows[0])
+    await async_session.commit()
+
+    await aget_flow_input_schemas(async_session, await list_flows(async_session))
+    assert len(schema_calls) == 4
+    assert get_flow_schema_cache().stats() == {"size": 3, "hits": 5, "misses": 4}
+
+
+async def test_retain_forgets_deleted_flows(async_session):
+    flows = [Flow(name=f"Flow {index}", data={"nodes": [], "edges": []}) for index in range(2)]
+    async_session.add_all(flows)
+    await async_session.commit()
+    await aget_flow_input_schemas(async_session, await list_flows(async_session))
+
+    get_flow_schema_cache().retain({flows[1].id})
+
+    assert get_flow_schema_cache().stats()["size"] == 1
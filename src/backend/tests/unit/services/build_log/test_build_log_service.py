@@ -0,0 +1,108 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.services.build_log.service import BuildLogService
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture(autouse=True)
+def _use_test_session(mocker, async_session: AsyncSession):
+    @asynccontextmanager
+    async def session_getter(_db_service):
+        yield async_session
+
+    mocker.patch("langflow.services.build_log.service.session_getter", session_getter)
+    mocker.patch("langflow.services.build_log.service.get_db_service")
+
+
+def make_service(batch_size: int = 100, flush_interval: float = 60, prune_interval: float = 30) -> BuildLogService:
+    settings = SimpleNamespace(
+        build_log_batch_size=batch_size,
+        build_log_flush_interval=flush_interval,
+        build_log_prune_interval=prune_interval,
+    )
+    return BuildLogService(SimpleNamespace(settings=settings))
+
+
+def make_build(flow_id, vertex_id="vertex") -> VertexBuildBase:
+    return VertexBuildBase(id=vertex_id, flow_id=flow_id, valid=True, artifacts={})
+
+
+async def count(session: AsyncSession, table) -> int:
+    return (await session.execute(select(func.count()).select_from(table))).scalar()
+
+
+async def test_enqueue_is_rejected_until_started():
+    service = make_service()
+    assert service.enqueue_vertex_build(make_build(uuid4())) is False
+
+    service.start()
+    assert service.enqueue_vertex_build(make_build(uuid4())) is True
+    await service.stop()
+
+
+async def test_disabled_when_batch_size_is_zero():
+    service = make_service(batch_size=0)
+    service.start()
+    assert service.running is False
+    assert service.enqueue_vertex_build(make_build(uuid4())) is False
+
+
+async def test_flushes_when_batch_is_full(async_session):
+    service = make_service(batch_size=3)
+    service.start()
+    flow_id = uuid4()
+    for i in range(2):
+        service.enqueue_vertex_build(make_build(flow_id, f"vertex-{i}"))
+    await asyncio.sleep(0.05)
+    assert await count(async_session, VertexBuildTable) == 0
+
+    service.enqueue_transaction(TransactionBase(vertex_id="vertex-0", status="success", flow_id=flow_id))
+    await asyncio.sleep(0.05)
+    assert await count(async_session, VertexBuildTable) == 2
+    assert await count(async_session, TransactionTable) == 1
+    assert service.stats()["flushes"] == 1
+    await service.stop()
+
+
+async def test_flushes_after_interval(async_session):
+    service = make_service(flush_interval=0.05)
+    service.start()
+    service.enqueue_vertex_build(make_build(uuid4()))
+    await asyncio.sleep(0.2)
+    assert await count(async_session, VertexBuildTable) == 1
+    await service.stop()
+
+
+async def test_stop_flushes_and_prunes(async_session):
+    service = make_service()
+    service.start()
+    flow_id = uuid4()
+    for _ in range(5):
+        service.enqueue_vertex_build(make_build(flow_id))
+
+    await service.stop()
+    assert service.pending == 0
+    # The default per-vertex limit keeps the two newest builds
+    assert await count(async_session, VertexBuildTable) == 2
+    assert service.stats()["written"] == 5
+    assert service.stats()["prunes"] == 1
+
+
+async def test_discard_drops_buffered_records(async_session):
+    service = make_service()
+    service.start()
+    deleted_flow, kept_flow = uuid4(), uuid4()
+    service.enqueue_vertex_build(make_build(deleted_flow))
+    service.enqueue_vertex_build(make_build(kept_flow))
+
+    service.discard(deleted_flow)
+    await service.stop()
+    rows = (await async_session.execute(select(VertexBuildTable.flow_id))).scalars().all()
+    assert rows == [kept_flow]
@@ -0,0 +1,138 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.services.cache.codec import (
+    CODEC_MAGIC,
+    CODEC_VERSION,
+    COMPRESSION_THRESHOLD,
+    CodecError,
+    decode_payload,
+    encode_payload,
+    estimate_size,
+)
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.chat.service import ChatService
+
+
+def test_codec_round_trip():
+    value = {"text": "hello", "numbers": [1, 2, 3]}
+    payload = encode_payload(value)
+
+    assert payload.startswith(CODEC_MAGIC)
+    assert decode_payload(payload) == value
+
+
+def test_codec_compresses_large_payloads():
+    value = "a" * (COMPRESSION_THRESHOLD * 2)
+    payload = encode_payload(value)
+
+    assert len(payload) < COMPRESSION_THRESHOLD
+    assert decode_payload(payload) == value
+
+
+def test_codec_rejects_foreign_payloads():
+    payload = encode_payload("value")
+    stale = CODEC_MAGIC + bytes((CODEC_VERSION + 1,)) + payload[len(CODEC_MAGIC) + 1 :]
+
+    with pytest.raises(CodecError, match="codec version"):
+        decode_payload(stale)
+    with pytest.raises(CodecError, match="no codec header"):
+        decode_payload(b"not a payload")
+    with pytest.raises(TypeError, match="picklable"):
+        encode_payload(threading.Lock())
+
+
+def test_estimate_size_grows_with_the_value():
+    assert estimate_size(["x" * 10_000]) > estimate_size(["x"])
+    assert estimate_size(list(range(100_000)), max_objects=100) < estimate_size(list(range(100_000)))
+
+
+def test_estimate_size_measures_whole_graphs():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    assert estimate_size(graph) == estimate_size(graph, max_objects=10_000_000)
+
+
+def test_in_memory_cache_stores_references_and_evicts_by_bytes():
+    cache = ThreadingInMemoryCache(max_bytes=estimate_size("x" * 1000) * 2 + 100)
+    value = "v" * 1000
+    cache.set("a", "x" * 1000)
+    cache.set("b", value)
+    assert cache.get("b") is value
+
+    cache.set("c", "y" * 1000)
+    assert cache.get("a") is CACHE_MISS
+    assert len(cache) == 2
+    assert cache.total_bytes <= cache.max_bytes
+
+    cache.set("huge", "z" * 10_000)
+    assert "huge" not in cache
+    cache.clear()
+    assert cache.total_bytes == 0
+
+
+async def test_async_in_memory_cache_evicts_by_bytes():
+    cache = AsyncInMemoryCache(max_bytes=estimate_size("x" * 1000) * 2 + 100)
+    await cache.set("a", "x" * 1000)
+    await cache.set("b", "y" * 1000)
+    await cache.set("a", "x" * 1000)
+    await cache.set("c", "z" * 1000)
+
+    # "a" was refreshed, so "b" is the least recently used item
+    assert await cache.get("b") is CACHE_MISS
+    assert await cache.get("a") == "x" * 1000
+    await cache.delete("a")
+    await cache.delete("c")
+    assert cache.total_bytes == 0
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    return AsyncDiskCache(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def chat_service(mocker, disk_cache):
+    settings = SimpleNamespace(cache_expire=3600, cache_max_bytes=0)
+    mocker.patch("langflow.services.chat.service.get_cache_service", return_value=disk_cache)
+    mocker.patch("langflow.services.chat.service.get_settings_service", return_value=SimpleNamespace(settings=settings))
+    return ChatService()
+
+
+async def test_disk_cache_uses_the_codec(disk_cache):
+    await disk_cache.set("key", {"value": 1})
+    assert await disk_cache.get("key") == {"value": 1}
+
+    await disk_cache.set("bytes", b"raw")
+    assert await disk_cache.get("bytes") == b"raw"
+
+
+async def test_chat_service_keeps_graphs_in_process(chat_service, disk_cache):
+    graph = Graph()
+    await chat_service.set_cache("flow", graph)
+
+    assert not await disk_cache.contains("flow")
+    assert (await chat_service.get_cache("flow"))["result"] is graph
+
+    await chat_service.set_cache("flow", "shareable")
+    assert await disk_cache.contains("flow")
+    assert (await chat_service.get_cache("flow"))["result"] == "shareable"
+
+    await chat_service.clear_cache("flow")
+    assert await chat_service.get_cache("flow") is CACHE_MISS
+
+
+async def test_chat_service_keeps_unpicklable_values_in_process(chat_service, disk_cache):
+    lock = threading.Lock()
+    await chat_service.set_cache("key", lock)
+
+    assert not await disk_cache.contains("key")
+    assert (await chat_service.get_cache("key"))["result"] is lock
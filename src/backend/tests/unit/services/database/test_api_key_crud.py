@@ -0,0 +1,77 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from langflow.services.database.models.api_key import crud
+from langflow.services.database.models.api_key.crud import (
+    ApiKeyCache,
+    ApiKeyUsageCounter,
+    check_key_cached,
+    delete_api_key,
+)
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.model import User
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+async def api_key(async_session: AsyncSession):
+    user = User(username="api-key-user", password="hashed", is_active=True)  # noqa: S106
+    async_session.add(user)
+    await async_session.commit()
+    api_key = ApiKey(name="test", api_key="sk-test", user_id=user.id)
+    async_session.add(api_key)
+    await async_session.commit()
+    return api_key
+
+
+@pytest.fixture
+def counter(monkeypatch, async_session: AsyncSession):
+    @asynccontextmanager
+    async def session_scope():
+        yield async_session
+        await async_session.commit()
+
+    counter = ApiKeyUsageCounter(flush_interval=3600)
+    monkeypatch.setattr(crud, "session_scope", session_scope)
+    cache = ApiKeyCache(ttl=60)
+    monkeypatch.setattr(crud, "get_api_key_cache", lambda: cache)
+    monkeypatch.setattr(crud, "get_api_key_usage_counter", lambda: counter)
+    yield counter
+    if counter._flush_task is not None:
+        counter._flush_task.cancel()
+
+
+async def test_checked_keys_are_cached_and_uses_are_flushed_together(async_session, api_key, counter):
+    for _ in range(3):
+        user = await check_key_cached(async_session, "sk-test")
+        assert user.username == "api-key-user"
+    assert await check_key_cached(async_session, "sk-unknown") is None
+    assert crud.get_api_key_cache().stats() == {"size": 1, "hits": 2, "misses": 2}
+
+    await counter.flush()
+    await async_session.refresh(api_key)
+    assert api_key.total_uses == 3
+    assert api_key.last_used_at is not None
+    assert counter.flushes == 1
+
+
+async def test_cached_keys_are_invalidated(async_session, api_key, counter):  # noqa: ARG001
+    user = await check_key_cached(async_session, "sk-test")
+    crud.get_api_key_cache().invalidate_user(user.id)
+    assert crud.get_api_key_cache().stats()["size"] == 0
+
+    await check_key_cached(async_session, "sk-test")
+    await delete_api_key(async_session, api_key.id)
+
+    assert await check_key_cached(async_session, "sk-test") is None
+
+
+async def test_closing_the_counter_writes_pending_uses(async_session, api_key, counter):
+    await check_key_cached(async_session, "sk-test")
+    flush_task = counter._flush_task
+
+    await counter.close()
+    await async_session.refresh(api_key)
+
+    assert flush_task.cancelled()
+    assert api_key.total_uses == 1
@@ -0,0 +1,76 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+from langflow.services.http_client.service import HostLimitedAsyncClient, HTTPClientService
+
+
+def make_service(max_connections_per_host: int = 0) -> HTTPClientService:
+    settings = SimpleNamespace(
+        http_client_max_connections=10,
+        http_client_max_keepalive_connections=5,
+        http_client_keepalive_expiry=30.0,
+        http_client_max_connections_per_host=max_connections_per_host,
+        http_client_http2=False,
+    )
+    return HTTPClientService(SimpleNamespace(settings=settings))
+
+
+async def test_clients_are_shared_by_settings():
+    service = make_service()
+
+    client = service.get_client()
+    assert service.get_client() is client
+    assert service.get_client(timeout=10.0) is not client
+    assert service.stats() == {"clients": 2, "created": 2, "reused": 1}
+
+    await service.teardown()
+    assert client.is_closed
+    assert service.get_client() is not client
+
+
+async def test_clients_do_not_keep_cookies():
+    service = make_service()
+    client = service.get_client()
+
+    # Responses of a shared client must not leak their cookies into the requests of other users
+    request = httpx.Request("GET", "https://example.com/login")
+    client.cookies.extract_cookies(httpx.Response(200, headers={"Set-Cookie": "session=alice"}, request=request))
+    assert not client.cookies
+    assert "cookie" not in client.build_request("GET", "https://example.com/").headers
+
+    # Cookies passed by the caller are still sent
+    assert client.build_request("GET", "https://example.com/", cookies={"session": "bob"}).headers["cookie"] == (
+        "session=bob"
+    )
+    await service.teardown()
+
+
+async def test_requests_to_the_same_host_are_limited():
+    in_flight = {"example.com": 0, "example.org": 0}
+    max_in_flight = dict(in_flight)
+
+    async def body():
+        yield b"ok"
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, content=body())
+
+    async with HostLimitedAsyncClient(max_connections_per_host=2, transport=httpx.MockTransport(handler)) as client:
+        urls = [f"https://{host}/{index}" for host in in_flight for index in range(5)]
+        responses = await asyncio.gather(*(client.get(url) for url in urls))
+
+        # A streamed response holds its slot until it is closed
+        async with client.stream("GET", "https://example.com/stream"), client.stream("GET", "https://example.com/"):
+            request = asyncio.create_task(client.get("https://example.com/waiting"))
+            await asyncio.sleep(0.05)
+            assert not request.done()
+        assert (await request).status_code == 200
+
+    assert all(response.text == "ok" for response in responses)
+    assert max_in_flight == {"example.com": 2, "example.org": 2}
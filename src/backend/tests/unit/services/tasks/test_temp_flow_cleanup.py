@@ -5,8 +5,10 @@ from datetime import timezone
 from uuid import uuid4
 
 import pytest
+from langflow import memory
+from langflow.memory import SessionHistoryCache
 from langflow.services.database.models.flow import Flow as FlowTable
-from langflow.services.database.models.message.model import MessageTable
+from langflow.services.database.models.message.model import MessageRead, MessageTable
 from langflow.services.deps import get_settings_service, get_storage_service, session_scope
 from langflow.services.task.temp_flow_cleanup import (
     CleanupWorker,
@@ -81,6 +83,35 @@ async def test_cleanup_orphaned_records_with_orphans():
         assert message is None
 
 
+@pytest.mark.usefixtures("client")
+async def test_cleanup_orphaned_records_invalidates_cached_histories(monkeypatch):
+    """Test that the cached histories of the deleted messages are not served anymore."""
+    orphaned_flow_id = uuid4()
+    session_id = str(uuid4())
+    message = MessageTable(
+        id=uuid4(),
+        flow_id=orphaned_flow_id,
+        sender="test_user",
+        sender_name="Test User",
+        timestamp=datetime.datetime.now(timezone.utc),
+        session_id=session_id,
+        text="Hello",
+        category="message",
+    )
+    async with session_scope() as session:
+        session.add(message)
+        await session.commit()
+        row = MessageRead.model_validate(message, from_attributes=True).model_dump()
+
+    cache = SessionHistoryCache()
+    monkeypatch.setattr(memory, "_session_history_cache", cache)
+    cache.set(None, session_id, [row], cache.start_load(session_id))
+
+    await cleanup_orphaned_records()
+
+    assert cache.get(None, session_id) is None
+
+
 @pytest.mark.asyncio
 async def test_cleanup_worker_start_stop():
     """Test CleanupWorker start and stop functionality."""
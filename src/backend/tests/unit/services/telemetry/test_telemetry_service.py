@@ -0,0 +1,182 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from langflow.services.settings.base import Settings
+from langflow.services.settings.service import SettingsService
+from langflow.services.telemetry.outbox import TELEMETRY_OUTBOX_FILE, TelemetryOutbox
+from langflow.services.telemetry.schema import ComponentPayload, RunPayload
+from langflow.services.telemetry.service import TelemetryService
+
+
+class StubTelemetryServer(ThreadingHTTPServer):
+    """Telemetry endpoint recording the requests it receives and answering with `status`."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubTelemetryHandler)
+        self.status = 200
+        self.requests: list[tuple[str, str, dict]] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class StubTelemetryHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        url = urlsplit(self.path)
+        self._reply("GET", url.path, dict(parse_qsl(url.query)))
+
+    def do_POST(self):  # noqa: N802
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply("POST", self.path, json.loads(body))
+
+    def _reply(self, method: str, path: str, data: dict) -> None:
+        if self.server.status == 200:
+            self.server.requests.append((method, path, data))
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = StubTelemetryServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def telemetry_settings(stub_server, tmp_path, monkeypatch):
+    monkeypatch.delenv("DO_NOT_TRACK", raising=False)
+    settings = Settings()
+    settings.config_dir = str(tmp_path)
+    settings.do_not_track = False
+    settings.telemetry_base_url = stub_server.url
+    return settings
+
+
+def make_service(settings: Settings, **overrides) -> TelemetryService:
+    for key, value in overrides.items():
+        setattr(settings, key, value)
+    return TelemetryService(SettingsService(settings, MagicMock()))
+
+
+def run_payload(seconds: int) -> RunPayload:
+    return RunPayload(run_seconds=seconds, run_success=True)
+
+
+def component_payload(name: str) -> ComponentPayload:
+    return ComponentPayload(
+        component_name=name, component_seconds=1, component_success=True, component_error_message=None
+    )
+
+
+async def test_events_are_sent_in_batches_per_type(stub_server, telemetry_settings):
+    service = make_service(telemetry_settings, telemetry_batch_url=f"{stub_server.url}/batch", telemetry_batch_size=3)
+    for seconds in range(5):
+        await service.log_package_run(run_payload(seconds))
+    await service.log_package_component(component_payload("ChatInput"))
+    assert service.stats()["queued"] == 6
+
+    await service.flush()
+
+    batches = [
+        (data["type"], [event.get("runSeconds") for event in data["events"]]) for _, _, data in stub_server.requests
+    ]
+    assert batches == [("run", [0, 1, 2]), ("run", [3, 4]), ("component", [None])]
+    assert stub_server.requests[2][2]["events"] == [
+        {"componentName": "ChatInput", "componentSeconds": 1, "componentSuccess": True}
+    ]
+    assert service.stats() == {
+        "queued": 0,
+        "outbox": 0,
+        "sent": 6,
+        "failed": 0,
+        "spilled": 0,
+        "dropped": 0,
+        "batches": 3,
+    }
+    await service.stop()
+
+
+async def test_events_are_sent_to_the_base_url_without_batch_url(stub_server, telemetry_settings):
+    service = make_service(telemetry_settings)
+    await service.log_package_run(run_payload(1))
+    await service.log_package_component(component_payload("ChatOutput"))
+
+    await service.stop()
+
+    assert stub_server.requests == [
+        ("GET", "/run", {"runSeconds": "1", "runSuccess": "true"}),
+        ("GET", "/component", {"componentName": "ChatOutput", "componentSeconds": "1", "componentSuccess": "true"}),
+    ]
+    assert service.stats()["batches"] == 2
+
+
+async def test_events_go_through_the_outbox(stub_server, telemetry_settings, tmp_path):
+    settings = {
+        "telemetry_batch_url": f"{stub_server.url}/batch",
+        "telemetry_max_queue_size": 2,
+        "telemetry_outbox_max_size": 3,
+    }
+    service = make_service(telemetry_settings, **settings)
+    for seconds in range(5):
+        await service.log_package_run(run_payload(seconds))
+    # The memory holds at most 2 events, the others are moved to the outbox until it is full
+    stats = service.stats()
+    assert (stats["queued"], stats["outbox"], stats["spilled"], stats["dropped"]) == (1, 3, 3, 1)
+
+    stub_server.status = 503
+    await service.flush()
+    # The endpoint failed, so the buffered event did not fit in the outbox either
+    assert service.stats()["failed"] == 1
+    assert service.stats()["dropped"] == 2
+    assert service.stats()["outbox"] == 3
+    await service.stop()
+    assert await asyncio.to_thread((tmp_path / TELEMETRY_OUTBOX_FILE).exists)
+
+    # The outbox is sent by the next service once the endpoint accepts events
+    stub_server.status = 200
+    service = make_service(telemetry_settings, **settings)
+    await asyncio.to_thread(service.outbox.load)
+    await service.flush()
+    assert [event["runSeconds"] for _, _, data in stub_server.requests for event in data["events"]] == [0, 1, 2]
+    assert service.stats()["outbox"] == 0
+    assert service.stats()["sent"] == 3
+    assert not await asyncio.to_thread((tmp_path / TELEMETRY_OUTBOX_FILE).exists)
+    await service.stop()
+
+
+def test_outbox_is_shared_by_workers(tmp_path):
+    path = tmp_path / TELEMETRY_OUTBOX_FILE
+    # Every worker of the same config dir has its own outbox on the same file
+    first, second = TelemetryOutbox(path, max_size=3), TelemetryOutbox(path, max_size=3)
+
+    assert first.append([{"event": 1}, {"event": 2}]) == 0
+    assert second.append([{"event": 3}, {"event": 4}]) == 1
+    assert first.pop(2) == [{"event": 1}, {"event": 2}]
+    assert len(first) == 1
+    assert second.pop(2) == [{"event": 3}]
+    assert sorted(child.name for child in tmp_path.iterdir()) == [f"{TELEMETRY_OUTBOX_FILE}.lock"]
+
+
+async def test_do_not_track(stub_server, telemetry_settings):
+    service = make_service(telemetry_settings)
+    service.do_not_track = True
+    await service.log_package_run(run_payload(1))
+    await service.flush()
+
+    assert stub_server.requests == []
+    assert service.stats()["queued"] == 0
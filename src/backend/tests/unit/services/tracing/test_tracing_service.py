@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import uuid
 from unittest.mock import MagicMock, patch
 
@@ -6,6 +7,7 @@ import pytest
 from langflow.services.settings.base import Settings
 from langflow.services.settings.service import SettingsService
 from langflow.services.tracing.base import BaseTracer
+from langflow.services.tracing.exporter import TraceExporter, TraceRecord
 from langflow.services.tracing.service import (
     TracingService,
     component_context_var,
@@ -103,8 +105,10 @@ def mock_settings_service():
 
 
 @pytest.fixture
-def tracing_service(mock_settings_service):
-    return TracingService(mock_settings_service)
+async def tracing_service(mock_settings_service):
+    service = TracingService(mock_settings_service)
+    yield service
+    await service.teardown()
 
 
 @pytest.fixture
@@ -179,9 +183,11 @@ async def test_start_end_tracers(tracing_service):
         assert tracer.metadata_param == outputs
         assert tracer.outputs_param == trace_context.all_outputs
 
-    # Verify worker_task is cancelled
-    assert trace_context.worker_task is None
-    assert not trace_context.running
+    # Every tracer call was made by an exporter thread
+    stats = tracing_service.export_stats()
+    assert set(stats) == set(trace_context.tracers)
+    assert all(tracer_stats["exported"] == 1 for tracer_stats in stats.values())
+    assert all(tracer_stats["pending"] == 0 for tracer_stats in stats.values())
 
 
 @pytest.mark.asyncio
@@ -402,35 +408,91 @@ async def test_start_tracers_with_exception(tracing_service):
 
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("mock_tracers")
-async def test_trace_worker_with_exception(tracing_service):
-    """Test trace worker exception handling."""
+async def test_trace_exporter_with_exception(tracing_service, mock_component):
+    """Test that a failing tracer is counted and does not stop its exporter."""
     run_id = uuid.uuid4()
-    run_name = "test_run"
-    user_id = "test_user"
-    session_id = "test_session"
-    project_name = "test_project"
+    await tracing_service.start_tracers(run_id, "test_run", "test_user", "test_session", "test_project")
+    trace_context = trace_context_var.get()
+    langsmith = trace_context.tracers["langsmith"]
 
-    # Create a trace function that raises an exception
-    def failing_trace_func():
-        msg = "Mock trace function exception"
-        raise ValueError(msg)
+    with (
+        patch.object(langsmith, "add_trace", side_effect=ValueError("Mock tracer exception")),
+        patch("langflow.services.tracing.exporter.logger.exception") as mock_logger,
+    ):
+        async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+            pass
+        await tracing_service.end_tracers({})
 
-    with patch("langflow.services.tracing.service.logger.exception") as mock_logger:
-        # Remove incorrect context manager usage
-        await tracing_service.start_tracers(run_id, run_name, user_id, session_id, project_name)
+    mock_logger.assert_called_once()
+    assert tracing_service.export_stats()["langsmith"]["failed"] == 1
+    assert len(langsmith.end_trace_list) == 1
+    assert langsmith.end_called
 
-        # Get trace_context and add failing trace function to queue
-        trace_context = trace_context_var.get()
-        await trace_context.traces_queue.put((failing_trace_func, ()))
 
-        # Wait for async queue processing
-        await asyncio.sleep(0.1)
+@pytest.mark.asyncio
+async def test_trace_exporter_drops_records_when_full():
+    """Test that a slow tracer drops what does not fit in its buffer instead of blocking."""
+    release = threading.Event()
+    tracer = MockTracer("run", "chain", "project", uuid.uuid4())
+    exporter = TraceExporter("slow", buffer_size=2, batch_size=10)
+    with patch.object(tracer, "add_trace", side_effect=lambda *_: release.wait(5)):
+        submitted = [exporter.submit(TraceRecord("start", tracer, trace_name=str(i))) for i in range(5)]
+        assert submitted == [True, True, False, False, False]
+        assert exporter.stats()["dropped"] == 3
 
-        # Verify exception was logged
-        mock_logger.assert_called_with("Error processing trace_func")
+        release.set()
+        await asyncio.wrap_future(exporter.flush())
+    await asyncio.to_thread(exporter.close, 5)
 
-        # Cleanup
-        await tracing_service.end_tracers({})
+    assert exporter.stats() == {"exported": 2, "failed": 0, "dropped": 3, "pending": 0, "batches": exporter.batches}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_trace_exporter_survives_flush_timeout(tracing_service, mock_component):
+    """Test that a flush cancelled by its timeout does not stop the exporter."""
+    release = threading.Event()
+    tracing_service.settings_service.settings.tracing_flush_timeout = 0.1
+    run_id = uuid.uuid4()
+    await tracing_service.start_tracers(run_id, "test_run", "test_user", "test_session", "test_project")
+    langsmith = trace_context_var.get().tracers["langsmith"]
+
+    with patch.object(langsmith, "add_trace", side_effect=lambda *_: release.wait(5)):
+        async with tracing_service.trace_component(mock_component, "slow_trace", {}):
+            pass
+        await tracing_service._flush(["langsmith"])
+        assert tracing_service.export_stats()["langsmith"]["pending"] > 0
+        release.set()
+
+    tracing_service.settings_service.settings.tracing_flush_timeout = 5
+    await tracing_service.end_tracers({})
+
+    assert langsmith.end_called
+    assert tracing_service.export_stats()["langsmith"]["pending"] == 0
+    assert tracing_service._get_exporter("langsmith")._thread.is_alive()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_get_langchain_callbacks_does_not_wait_for_the_exporter(tracing_service, mock_component):
+    """Test that callbacks are taken while the exporter is blocked in a slow tracer call."""
+    release = threading.Event()
+    run_id = uuid.uuid4()
+    await tracing_service.start_tracers(run_id, "test_run", "test_user", "test_session", "test_project")
+    langsmith = trace_context_var.get().tracers["langsmith"]
+    add_trace_started = threading.Event()
+
+    def slow_add_trace(*_):
+        add_trace_started.set()
+        release.wait(5)
+
+    with patch.object(langsmith, "add_trace", side_effect=slow_add_trace):
+        async with tracing_service.trace_component(mock_component, "slow_trace", {}):
+            await asyncio.to_thread(add_trace_started.wait, 5)
+            tracing_service.get_langchain_callbacks()
+            assert langsmith.get_langchain_callback_called
+            release.set()
+    await tracing_service.end_tracers({})
 
 
 @pytest.mark.asyncio
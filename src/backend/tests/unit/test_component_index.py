@@ -0,0 +1,106 @@
+import asyncio
+import os
+from pathlib import Path
+
+import langflow
+import pytest
+from langflow.custom.utils import abuild_custom_components
+from langflow.interface.component_index import INDEX_FILE_NAME, ComponentIndex, get_environment_fingerprint
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class {name}(Component):
+    display_name = "{display_name}"
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Message", name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        return Message(text=self.text)
+"""
+
+
+def write_component(path: Path, name: str, display_name: str) -> None:
+    path.write_text(COMPONENT_CODE.format(name=name, display_name=display_name), encoding="utf-8")
+
+
+@pytest.fixture
+def components_path(tmp_path):
+    category = tmp_path / "components" / "custom"
+    category.mkdir(parents=True)
+    write_component(category / "first.py", "FirstComponent", "First")
+    write_component(category / "second.py", "SecondComponent", "Second")
+    return str(tmp_path / "components")
+
+
+@pytest.fixture
+def index(tmp_path):
+    return ComponentIndex(tmp_path / "config" / INDEX_FILE_NAME)
+
+
+async def test_index_matches_a_full_build(components_path, index):
+    types_dict = await index.aget_types_dict([components_path])
+
+    assert types_dict == await abuild_custom_components([components_path])
+    assert set(types_dict["custom"]) == {"FirstComponent", "SecondComponent"}
+    assert index.rebuilt == 2
+    assert await asyncio.to_thread(index.index_path.exists)
+
+
+async def test_index_only_rebuilds_changed_files(components_path, index):
+    await index.aget_types_dict([components_path])
+
+    types_dict = await index.aget_types_dict([components_path])
+    assert (index.reused, index.rebuilt) == (2, 0)
+    assert types_dict["custom"]["FirstComponent"]["display_name"] == "First"
+
+    await asyncio.to_thread(write_component, Path(components_path) / "custom" / "first.py", "FirstComponent", "Renamed")
+    types_dict = await index.aget_types_dict([components_path])
+    assert (index.reused, index.rebuilt) == (1, 1)
+    assert types_dict["custom"]["FirstComponent"]["display_name"] == "Renamed"
+
+
+async def test_index_drops_deleted_files(components_path, index):
+    await index.aget_types_dict([components_path])
+    await asyncio.to_thread((Path(components_path) / "custom" / "second.py").unlink)
+
+    types_dict = await index.aget_types_dict([components_path])
+    assert set(types_dict["custom"]) == {"FirstComponent"}
+
+
+async def test_index_is_rebuilt_when_langflow_changes(components_path, index, monkeypatch):
+    await index.aget_types_dict([components_path])
+    monkeypatch.setattr("langflow.interface.component_index.get_environment_fingerprint", lambda: "upgraded")
+
+    await index.aget_types_dict([components_path])
+    assert index.rebuilt == 2
+
+
+def test_fingerprint_depends_on_installed_distributions(tmp_path, monkeypatch):
+    site_packages = tmp_path / "site-packages"
+    (site_packages / "openai-1.0.0.dist-info").mkdir(parents=True)
+    monkeypatch.setattr("sys.path", [str(site_packages)])
+    fingerprint = get_environment_fingerprint()
+    assert get_environment_fingerprint() == fingerprint
+
+    (site_packages / "openai-1.0.0.dist-info").rename(site_packages / "openai-1.1.0.dist-info")
+    assert get_environment_fingerprint() != fingerprint
+
+
+def test_fingerprint_depends_on_bundled_components_and_template_env_vars(monkeypatch):
+    monkeypatch.delenv("ASTRA_ENHANCED", raising=False)
+    fingerprint = get_environment_fingerprint()
+    monkeypatch.setenv("ASTRA_ENHANCED", "true")
+    assert get_environment_fingerprint() != fingerprint
+    monkeypatch.delenv("ASTRA_ENHANCED")
+
+    memory_path = Path(langflow.__file__).parent / "components" / "helpers" / "memory.py"
+    stat = memory_path.stat()
+    try:
+        os.utime(memory_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert get_environment_fingerprint() != fingerprint
+    finally:
+        os.utime(memory_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.processing.graph_cache import CompiledGraphCache, hash_tweaks
+from langflow.services.database.models.flow.model import Flow
+
+
+@pytest.fixture
+def flow():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    return Flow(id=uuid4(), name="cached", data=graph.dump()["data"], updated_at=datetime.now(timezone.utc))
+
+
+def test_hash_tweaks_is_order_independent():
+    assert hash_tweaks({"a": 1, "b": {"c": 2}}) == hash_tweaks({"b": {"c": 2}, "a": 1})
+    assert hash_tweaks({"a": 1}) != hash_tweaks({"a": 2})
+    assert hash_tweaks({"a": 1}, stream=True) != hash_tweaks({"a": 1}, stream=False)
+
+
+def test_get_graph_reuses_template(flow):
+    cache = CompiledGraphCache(max_size=10)
+    first = cache.get_graph(flow, {}, user_id="user")
+    second = cache.get_graph(flow, {}, user_id="user")
+
+    assert first is not second
+    assert first.vertices[0] is not second.vertices[0]
+    assert {v.id for v in first.vertices} == {v.id for v in second.vertices}
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["size"] == 1
+
+
+def test_clones_get_the_user_of_the_caller(flow):
+    cache = CompiledGraphCache(max_size=10)
+    assert cache.get_graph(flow, {}, user_id=uuid4()).user_id is not None
+    assert cache.get_graph(flow, {}, user_id=None).user_id is None
+    assert cache.get_graph(flow, {}, user_id="user").user_id == "user"
+
+
+def test_clones_do_not_share_run_state(flow):
+    cache = CompiledGraphCache(max_size=10)
+    first = cache.get_graph(flow, {}, user_id="user")
+    first.get_vertex("chat_input").update_raw_params({"input_value": "changed"}, overwrite=True)
+
+    second = cache.get_graph(flow, {}, user_id="user")
+    assert second.get_vertex("chat_input").raw_params.get("input_value") != "changed"
+
+
+def test_tweaks_and_versions_get_their_own_entries(flow):
+    cache = CompiledGraphCache(max_size=10)
+    cache.get_graph(flow, {"chat_input": {"input_value": "a"}})
+    graph = cache.get_graph(flow, {"chat_input": {"input_value": "b"}})
+    assert graph.get_vertex("chat_input").raw_params["input_value"] == "b"
+    assert cache.stats()["size"] == 2
+
+    flow.updated_at += timedelta(seconds=1)
+    cache.get_graph(flow, {"chat_input": {"input_value": "a"}})
+    # Entries of the older version of the flow are dropped
+    assert cache.stats()["size"] == 1
+    assert cache.stats()["misses"] == 3
+
+
+def test_invalidate_and_lru_eviction(flow):
+    cache = CompiledGraphCache(max_size=1)
+    cache.get_graph(flow, {"chat_input": {"input_value": "a"}})
+    cache.get_graph(flow, {"chat_input": {"input_value": "b"}})
+    assert cache.stats()["size"] == 1
+
+    cache.invalidate(flow.id)
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_disabled_cache_always_builds(flow):
+    cache = CompiledGraphCache(max_size=0)
+    cache.get_graph(flow, {})
+    cache.get_graph(flow, {})
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["hits"] == 0
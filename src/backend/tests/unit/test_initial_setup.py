@@ -11,18 +11,22 @@ from httpx import AsyncClient
 from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.initial_setup.setup import (
+    create_or_update_starter_projects,
     detect_github_url,
+    get_component_digests,
     get_project_data,
+    get_starter_project_digest,
     load_bundles_from_urls,
     load_starter_projects,
     update_projects_components_with_latest_component_versions,
 )
-from langflow.interface.components import aget_all_types_dict
+from langflow.interface.components import aget_all_types_dict, get_and_cache_all_types_dict
 from langflow.services.database.models import Flow
 from langflow.services.database.models.folder.model import Folder
 from langflow.services.deps import get_settings_service, session_scope
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 async def test_load_starter_projects():
@@ -112,6 +116,71 @@ async def test_create_or_update_starter_projects():
 #         delete_messages(session_id="test")
 
 
+@pytest.mark.usefixtures("client")
+async def test_create_or_update_starter_projects_only_syncs_changes():
+    all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
+
+    async def get_starter_flows():
+        async with session_scope() as session:
+            stmt = select(Folder).options(selectinload(Folder.flows)).where(Folder.name == STARTER_FOLDER_NAME)
+            folder = (await session.exec(stmt)).first()
+            return {flow.name: flow.id for flow in folder.flows}
+
+    flows = await get_starter_flows()
+    with patch("langflow.initial_setup.setup.update_project_file") as update_project_file:
+        await create_or_update_starter_projects(all_types_dict)
+    # Nothing changed since the startup sync, so the flows are kept and the files are not written
+    update_project_file.assert_not_called()
+    assert await get_starter_flows() == flows
+
+    deleted_name, deleted_id = next(iter(flows.items()))
+    async with session_scope() as session:
+        await session.delete(await session.get(Flow, deleted_id))
+    await create_or_update_starter_projects(all_types_dict)
+    new_flows = await get_starter_flows()
+    assert new_flows.keys() == flows.keys()
+    assert new_flows[deleted_name] != deleted_id
+    assert all(new_flows[name] == flow_id for name, flow_id in flows.items() if name != deleted_name)
+
+
+@pytest.mark.usefixtures("client")
+async def test_starter_project_digests_are_saved_after_the_commit():
+    all_types_dict = await get_and_cache_all_types_dict(get_settings_service())
+    with (
+        patch("langflow.initial_setup.setup.load_starter_project_digests", AsyncMock(return_value={})),
+        patch("langflow.initial_setup.setup.save_starter_project_digests") as save_starter_project_digests,
+        patch("langflow.initial_setup.setup.update_project_file"),
+        patch.object(AsyncSession, "commit", side_effect=RuntimeError("commit failed")),
+        pytest.raises(RuntimeError, match="commit failed"),
+    ):
+        await create_or_update_starter_projects(all_types_dict)
+    save_starter_project_digests.assert_not_called()
+
+
+def test_get_starter_project_digest():
+    def node(node_type):
+        return {"id": f"{node_type}-1", "data": {"type": node_type, "node": {}}}
+
+    project = {"name": "Project", "data": {"nodes": [node("ChatInput"), node("ChatOutput")], "edges": []}}
+    all_types_dict = {
+        "inputs": {"ChatInput": {"template": {"code": {"value": "input"}}}},
+        "outputs": {"ChatOutput": {"template": {"code": {"value": "output"}}}},
+        "models": {"OpenAIModel": {"template": {"code": {"value": "model"}}}},
+    }
+    digest = get_starter_project_digest(project, get_component_digests(all_types_dict))
+
+    # Components that the project does not use do not change its digest
+    all_types_dict["models"]["OpenAIModel"]["template"]["code"]["value"] = "new model"
+    assert get_starter_project_digest(project, get_component_digests(all_types_dict)) == digest
+
+    all_types_dict["outputs"]["ChatOutput"]["template"]["code"]["value"] = "new output"
+    new_digest = get_starter_project_digest(project, get_component_digests(all_types_dict))
+    assert new_digest != digest
+
+    project["description"] = "A description"
+    assert get_starter_project_digest(project, get_component_digests(all_types_dict)) != new_digest
+
+
 def find_component_by_name(components, name):
     for children in components.values():
         if name in children:
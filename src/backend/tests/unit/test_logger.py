@@ -1,9 +1,13 @@
+import asyncio
 import json
 import os
-from unittest.mock import patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langflow.api.log_router import event_generator
 from langflow.logging.logger import SizedLogBuffer
+from loguru import logger
 
 
 @pytest.fixture
@@ -99,3 +103,59 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 0
     sized_log_buffer.max = 100
     assert sized_log_buffer.max_size() == 100
+
+
+def test_write_formatted_message(sized_log_buffer):
+    sized_log_buffer.max = 5
+    sink_id = logger.add(sized_log_buffer.write, format="{level} {message}")
+    try:
+        logger.info("Formatted log")
+    finally:
+        logger.remove(sink_id)
+
+    ((timestamp, text),) = sized_log_buffer.buffer
+    assert text == "INFO Formatted log\n"
+    assert abs(timestamp - time.time() * 1000) < 60_000
+
+
+def test_timestamp_lookups_with_out_of_order_messages(sized_log_buffer):
+    sized_log_buffer.max = 4
+    for i, timestamp in enumerate([1, 3, 2, 5, 6, 7]):
+        sized_log_buffer.write(json.dumps({"text": f"Log {i}", "record": {"time": {"timestamp": timestamp}}}))
+
+    # The two oldest messages were overwritten
+    assert list(sized_log_buffer.get_last_n(10).values()) == ["Log 2", "Log 3", "Log 4", "Log 5"]
+    assert list(sized_log_buffer.get_after_timestamp(4000, lines=2).values()) == ["Log 3", "Log 4"]
+    assert list(sized_log_buffer.get_before_timestamp(6000, lines=5).values()) == ["Log 2", "Log 3"]
+    assert list(sized_log_buffer.get_before_timestamp(8000, lines=1).values()) == ["Log 5"]
+
+
+def test_read_from_sequence(sized_log_buffer):
+    sized_log_buffer.max = 3
+    start = sized_log_buffer.next_sequence
+    for i in range(5):
+        sized_log_buffer.write(json.dumps({"text": f"Log {i}", "record": {"time": {"timestamp": 1625097600 + i}}}))
+
+    entries, sequence = sized_log_buffer.read_from(start, limit=2)
+    assert [text for _, text in entries] == ["Log 2", "Log 3"]
+    entries, sequence = sized_log_buffer.read_from(sequence)
+    assert [text for _, text in entries] == ["Log 4"]
+    assert sized_log_buffer.read_from(sequence) == ([], sequence)
+    assert sized_log_buffer.sequence_at(1625097603000) == start + 3
+
+
+async def test_stream_sends_new_messages():
+    buffer = SizedLogBuffer()
+    buffer.max = 10
+    buffer.write(json.dumps({"text": "Old log", "record": {"time": {"timestamp": 1625097600}}}))
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+
+    with patch("langflow.api.log_router.log_buffer", buffer):
+        stream = event_generator(request)
+        next_event = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.1)
+        assert not next_event.done()
+        buffer.write(json.dumps({"text": "New log", "record": {"time": {"timestamp": 1625097601}}}))
+        assert await asyncio.wait_for(next_event, timeout=1) == '{"1625097601000": "New log"}\n\n'
+        await stream.aclose()
@@ -3,6 +3,7 @@ from uuid import UUID, uuid4
 
 import pytest
 from langflow.memory import (
+    SessionHistoryCache,
     aadd_messages,
     aadd_messagetables,
     add_messages,
@@ -20,6 +21,7 @@ from langflow.schema.properties import Properties, Source
 
 # Assuming you have these imports available
 from langflow.services.database.models.message import MessageCreate, MessageRead
+from langflow.services.database.models.message.crud import get_messages_query
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.deps import session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
@@ -356,3 +358,159 @@ async def test_aupdate_message_with_nested_properties(created_message):
     assert updated[0].properties.allow_markdown is True
     assert updated[0].properties.state == "complete"
     assert updated[0].properties.targets == []
+
+
+async def test_get_messages_query_keyset_pagination(async_session):
+    flow_id = uuid4()
+    # Messages 2 and 3 share a timestamp, so the id has to break the tie between them
+    hours = [0, 1, 2, 2, 4, 5]
+    for i, hour in enumerate(hours):
+        async_session.add(
+            MessageTable(
+                text=f"message {i}",
+                sender="User",
+                sender_name="User",
+                session_id="paged_session",
+                flow_id=flow_id,
+                timestamp=datetime(2024, 1, 1, hour, 0, 0, tzinfo=timezone.utc),
+                files=[],
+                category="message",
+            )
+        )
+    await async_session.commit()
+
+    for order in ["ASC", "DESC"]:
+        pages = []
+        after = None
+        while rows := (
+            await async_session.exec(
+                get_messages_query(session_id="paged_session", flow_id=flow_id, order=order, limit=2, after=after)
+            )
+        ).all():
+            pages.append(rows)
+            after = rows[-1].id
+        texts = [row.text for page in pages for row in page]
+        timestamps = [row.timestamp for page in pages for row in page]
+
+        assert [len(page) for page in pages] == [2, 2, 2]
+        assert sorted(texts) == [f"message {i}" for i in range(len(hours))]
+        assert timestamps == sorted(timestamps, reverse=order == "DESC")
+
+
+async def test_message_create_many():
+    rows = [
+        {"text": "hello", "sender": "User", "sender_name": "User", "session_id": "s", "files": []},
+        {"text": "world", "sender": "AI", "sender_name": "AI", "session_id": "s", "id": str(uuid4())},
+    ]
+    messages = await Message.create_many(rows)
+
+    assert [message.text for message in messages] == ["hello", "world"]
+    assert messages[1].data["id"] == rows[1]["id"]
+    assert await Message.create_many([]) == []
+
+
+def history_row(text, session_id="session", flow_id=None, hour=0, **kwargs):
+    return {
+        "id": uuid4(),
+        "text": text,
+        "sender": "User",
+        "sender_name": "User",
+        "session_id": session_id,
+        "flow_id": flow_id,
+        "timestamp": datetime(2024, 1, 1, hour, tzinfo=timezone.utc),
+        "error": False,
+        **kwargs,
+    }
+
+
+def test_session_history_cache_write_through():
+    cache = SessionHistoryCache(max_sessions=10, max_messages=10)
+    flow_id = uuid4()
+    assert cache.get(flow_id, "session") is None
+
+    first = history_row("first", flow_id=flow_id, hour=1)
+    assert cache.set(flow_id, "session", [first], cache.start_load("session"))
+    assert cache.set(None, "session", [first], cache.start_load("session"))
+
+    older = history_row("older", flow_id=flow_id, hour=0)
+    other_flow = history_row("other flow", flow_id=uuid4(), hour=2)
+    error = history_row("error", flow_id=flow_id, hour=3, error=True)
+    cache.add([older, other_flow, error])
+    assert [row["text"] for row in cache.get(flow_id, "session")] == ["older", "first"]
+    assert [row["text"] for row in cache.get(None, "session")] == ["older", "first", "other flow"]
+
+    cache.update([{**first, "text": "edited"}])
+    assert [row["text"] for row in cache.get(flow_id, "session")] == ["older", "edited"]
+
+    cache.update([{**older, "session_id": "renamed"}])
+    assert [row["text"] for row in cache.get(None, "session")] == ["edited", "other flow"]
+
+    cache.discard_messages([first["id"]])
+    assert [row["text"] for row in cache.get(flow_id, "session")] == []
+
+    cache.invalidate_session("session")
+    assert cache.get(flow_id, "session") is None
+    assert cache.get(None, "session") is None
+
+
+def test_session_history_cache_skips_stale_loads():
+    cache = SessionHistoryCache(max_sessions=10, max_messages=10)
+    token = cache.start_load("session")
+    # A message stored while the history was being read would be missing from the loaded rows
+    cache.add([history_row("concurrent")])
+    assert not cache.set(None, "session", [], token)
+    assert cache.get(None, "session") is None
+
+
+def test_session_history_cache_forgets_ended_loads():
+    cache = SessionHistoryCache(max_sessions=10, max_messages=10)
+    # A load that failed must not leave its session marked as being loaded
+    cache.start_load("session")
+    cache.end_load("session")
+    assert not cache._loads_in_flight
+
+    token = cache.start_load("session")
+    assert cache.set(None, "session", [history_row("message")], token)
+    cache.end_load("session")
+    assert cache.get(None, "session") is not None
+
+
+def test_session_history_cache_skips_loads_overtaken_by_writes():
+    cache = SessionHistoryCache(max_sessions=10, max_messages=10)
+    stale_token = cache.start_load("session")
+    # Another load of the same session starts and ends while the first one is still reading
+    token = cache.start_load("session")
+    assert cache.set(None, "session", [], token)
+    cache.end_load("session")
+
+    cache.add([history_row("concurrent")])
+    cache.start_load("session")
+    assert not cache.set(None, "session", [], stale_token)
+    assert [row["text"] for row in cache.get(None, "session")] == ["concurrent"]
+
+
+def test_session_history_cache_limits():
+    cache = SessionHistoryCache(max_sessions=2, max_messages=2)
+    for session_id in ["a", "b", "c"]:
+        cache.set(None, session_id, [history_row("message", session_id=session_id)], cache.start_load(session_id))
+    assert cache.get(None, "a") is None
+    assert cache.stats()["sessions"] == 2
+
+    rows = [history_row(str(i), session_id="big") for i in range(3)]
+    assert not cache.set(None, "big", rows, cache.start_load("big"))
+
+    # An entry that grows past the limit is dropped instead of being served incomplete
+    cache.add([history_row("third", session_id="b")])
+    cache.add([history_row("fourth", session_id="b")])
+    assert cache.get(None, "b") is None
+
+
+def test_session_history_cache_invalidate_flow():
+    cache = SessionHistoryCache()
+    flow_id = uuid4()
+    cache.set(None, "session", [history_row("message", flow_id=flow_id)], cache.start_load("session"))
+    cache.set(None, "other", [history_row("message", session_id="other")], cache.start_load("other"))
+
+    cache.invalidate_flow(flow_id)
+    assert cache.get(None, "session") is None
+    assert cache.get(None, "other") is not None
@@ -0,0 +1,125 @@
+import asyncio
+
+from langflow.middleware import RequestCancelledMiddleware
+
+
+def make_scope():
+    return {"type": "http", "method": "POST", "path": "/api/v1/run/flow"}
+
+
+def make_receive(messages, *, disconnect_after: asyncio.Event | None = None):
+    queue = list(messages)
+
+    async def receive():
+        if queue:
+            return queue.pop(0)
+        if disconnect_after is not None:
+            await disconnect_after.wait()
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+async def send_response(send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def test_disconnect_cancels_the_handler():
+    started = asyncio.Event()
+    disconnect = asyncio.Event()
+    cancelled = []
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        body = await receive()
+        assert body["body"] == b"payload"
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def send(message):  # noqa: ARG001
+        return
+
+    receive = make_receive([{"type": "http.request", "body": b"payload"}], disconnect_after=disconnect)
+    middleware_task = asyncio.create_task(RequestCancelledMiddleware(app)(make_scope(), receive, send))
+    await started.wait()
+    disconnect.set()
+
+    await asyncio.wait_for(middleware_task, timeout=1)
+    assert cancelled == [True]
+    assert not middleware_task.cancelled()
+
+
+async def test_disconnect_cancels_a_handler_that_never_reads_the_request():
+    started = asyncio.Event()
+    disconnect = asyncio.Event()
+    cancelled = []
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def send(message):  # noqa: ARG001
+        return
+
+    receive = make_receive([{"type": "http.request", "body": b""}], disconnect_after=disconnect)
+    middleware_task = asyncio.create_task(RequestCancelledMiddleware(app)(make_scope(), receive, send))
+    await started.wait()
+    disconnect.set()
+
+    await asyncio.wait_for(middleware_task, timeout=1)
+    assert cancelled == [True]
+
+
+async def test_disconnect_after_the_response_does_not_cancel_background_work():
+    finished = []
+    sent = []
+    responded = asyncio.Event()
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        await receive()
+        await send_response(send)
+        # Background tasks run after the response was sent, when the server reports a disconnect
+        await asyncio.sleep(0.05)
+        finished.append(True)
+
+    async def send(message):
+        sent.append(message["type"])
+        if message["type"] == "http.response.body":
+            responded.set()
+
+    # Like the servers, report the disconnect once the response is complete
+    receive = make_receive([{"type": "http.request", "body": b""}], disconnect_after=responded)
+    await RequestCancelledMiddleware(app)(make_scope(), receive, send)
+
+    assert finished == [True]
+    assert sent == ["http.response.start", "http.response.body"]
+
+
+async def test_request_body_is_streamed_to_the_app():
+    chunks = [{"type": "http.request", "body": bytes([i]), "more_body": i < 4} for i in range(5)]
+    received = []
+    responded = asyncio.Event()
+
+    async def app(scope, receive, send):  # noqa: ARG001
+        while True:
+            message = await receive()
+            received.append(message["body"])
+            if not message["more_body"]:
+                break
+        await send_response(send)
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            responded.set()
+
+    receive = make_receive(chunks, disconnect_after=responded)
+    await RequestCancelledMiddleware(app)(make_scope(), receive, send)
+    assert b"".join(received) == bytes(range(5))
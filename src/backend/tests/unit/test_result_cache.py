@@ -0,0 +1,102 @@
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.io import MessageTextInput, Output
+from langflow.processing import result_cache
+from langflow.processing.result_cache import ComponentResultCache, fingerprint_value
+from langflow.schema import Data, DataFrame
+from langflow.schema.message import Message
+
+
+class CountingUpper(Component):
+    display_name = "Counting Upper"
+    cacheable = True
+    calls = 0
+
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Data", name="data", method="upper")]
+
+    def upper(self) -> Data:
+        type(self).calls += 1
+        self.status = "done"
+        return Data(data={"text": self.text.upper()})
+
+
+class NotCacheableUpper(CountingUpper):
+    cacheable = False
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch, mocker):
+    mocker.patch("langflow.graph.graph.base.log_vertex_build")
+    cache = ComponentResultCache(max_bytes=10 * 1024 * 1024, ttl=3600)
+    monkeypatch.setattr(result_cache, "_component_result_cache", cache)
+    CountingUpper.calls = 0
+    NotCacheableUpper.calls = 0
+    return cache
+
+
+def test_fingerprint_value():
+    assert fingerprint_value({"a": 1, "b": [1, 2]}) == fingerprint_value({"b": [1, 2], "a": 1})
+    timestamp = "2024-01-01 00:00:00 UTC"
+    assert fingerprint_value(Message(text="hi", timestamp=timestamp)) == fingerprint_value(
+        Message(text="hi", timestamp=timestamp)
+    )
+    assert fingerprint_value(Message(text="hi", timestamp=timestamp)) != fingerprint_value(
+        Message(text="bye", timestamp=timestamp)
+    )
+    assert fingerprint_value(Data(data={"x": 1})) != fingerprint_value(Data(data={"x": 2}))
+    assert fingerprint_value(DataFrame([{"x": 1}])) == fingerprint_value(DataFrame([{"x": 1}]))
+    assert fingerprint_value(object()) is None
+
+
+def test_messages_from_other_sessions_are_not_shared():
+    timestamp = "2024-01-01 00:00:00 UTC"
+    first = Message(text="hi", sender="User", session_id="first", timestamp=timestamp)
+    second = Message(text="hi", sender="User", session_id="second", timestamp=timestamp)
+    assert fingerprint_value(first) != fingerprint_value(second)
+
+
+async def run_flow(text: str, component_class=CountingUpper) -> Data:
+    chat_input = ChatInput(_id="chat_input", should_store_message=False, input_value=text)
+    upper = component_class(_id="upper")
+    upper.set(text=chat_input.message_response)
+    graph = Graph(chat_input, upper)
+    async for _ in graph.async_start():
+        pass
+    return graph.get_vertex("upper").built_object["data"]
+
+
+async def test_results_are_reused_across_runs(cache):
+    first = await run_flow("hello")
+    second = await run_flow("hello")
+
+    assert first.data == second.data == {"text": "HELLO"}
+    assert first is not second
+    assert CountingUpper.calls == 1
+    assert cache.stats()["hits"] == 1
+
+    await run_flow("other")
+    assert CountingUpper.calls == 2
+
+
+async def test_components_are_not_cached_unless_declared():
+    await run_flow("hello", NotCacheableUpper)
+    await run_flow("hello", NotCacheableUpper)
+    assert NotCacheableUpper.calls == 2
+
+
+def test_cache_evicts_by_bytes_and_expires(monkeypatch):
+    cache = ComponentResultCache(max_bytes=30_000, ttl=10)
+    cache.set("a", {"results": {"data": "a" * 10_000}})
+    cache.set("b", {"results": {"data": "b" * 10_000}})
+    cache.set("c", {"results": {"data": "c" * 10_000}})
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+    assert not cache.set("huge", {"results": {"data": "x" * 50_000}})
+
+    now = result_cache.time.monotonic()
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now + 11)
+    assert cache.get("c") is None
@@ -1,8 +1,11 @@
+import asyncio
 from pathlib import Path
 from unittest import mock
 
 import pytest
+from langflow.utils import validate
 from langflow.utils.validate import (
+    clear_class_cache,
     create_class,
     create_function,
     execute_function,
@@ -190,3 +193,65 @@ class MyComponent(CustomComponent):
     result_variable, result_function = instance.build()
     assert result_variable == "external_value"
     assert result_function == "external_function_value"
+
+
+CACHED_COMPONENT_CODE = """
+from langflow.custom import CustomComponent
+
+GREETING = "hello"
+
+class CachedComponent(CustomComponent):
+    def build(self):
+        return GREETING
+"""
+
+
+def test_create_class_reuses_the_class_for_identical_code():
+    clear_class_cache()
+    first = create_class(CACHED_COMPONENT_CODE, "CachedComponent")
+    second = create_class(CACHED_COMPONENT_CODE, "CachedComponent")
+    other = create_class(CACHED_COMPONENT_CODE.replace("hello", "bye"), "CachedComponent")
+
+    assert first is second
+    assert other is not first
+    assert other().build() == "bye"
+
+
+def test_create_class_loads_persisted_bytecode(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate, "_get_bytecode_cache_dir", lambda: tmp_path)
+    clear_class_cache()
+    first = create_class(CACHED_COMPONENT_CODE, "CachedComponent")
+    assert len(list(tmp_path.glob("*.bin"))) == 1
+
+    # A new process only has the files on disk, so the code must not be parsed again
+    clear_class_cache()
+    with mock.patch.object(validate.ast, "parse", side_effect=AssertionError("parsed")):
+        second = create_class(CACHED_COMPONENT_CODE, "CachedComponent")
+
+    assert second is not first
+    assert second().build() == "hello"
+
+
+def test_create_class_ignores_bytecode_of_other_interpreters(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate, "_get_bytecode_cache_dir", lambda: tmp_path)
+    clear_class_cache()
+    create_class(CACHED_COMPONENT_CODE, "CachedComponent")
+    (path,) = tmp_path.glob("*.bin")
+    path.write_bytes(b"\x00\x00\r\n" + path.read_bytes()[4:])
+
+    clear_class_cache()
+    assert create_class(CACHED_COMPONENT_CODE, "CachedComponent")().build() == "hello"
+
+
+async def test_create_class_does_not_use_the_disk_on_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate, "_get_bytecode_cache_dir", lambda: tmp_path)
+    clear_class_cache()
+    with mock.patch.object(validate, "_load_compiled_class", side_effect=AssertionError("read on the loop")):
+        assert create_class(CACHED_COMPONENT_CODE, "CachedComponent")().build() == "hello"
+
+    # The bytecode is still written for the other workers, from a thread
+    for _ in range(50):
+        if await asyncio.to_thread(lambda: list(tmp_path.glob("*.bin"))):
+            break
+        await asyncio.sleep(0.01)
+    assert len(await asyncio.to_thread(lambda: list(tmp_path.glob("*.bin")))) == 1
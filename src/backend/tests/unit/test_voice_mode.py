@@ -1,3 +1,5 @@
+import base64
+
 import numpy as np
 import pytest
 import webrtcvad
@@ -6,8 +8,12 @@ from langflow.utils.voice_utils import (
     BYTES_PER_24K_FRAME,
     SAMPLE_RATE_24K,
     VAD_SAMPLE_RATE_16K,
+    StreamingResampler,
+    VoiceActivityPipeline,
+    _polyphase_filter,
     resample_24k_to_16k,
 )
+from scipy.signal import upfirdn
 
 
 def test_resample_24k_to_16k_valid_frame():
@@ -99,3 +105,71 @@ def test_webrtcvad_with_real_data():
 
     # Log the speech detection rate
     speech_count / total_frames if total_frames > 0 else 0
+
+
+def test_streaming_resampler_matches_whole_stream():
+    """Resampling chunks of any size gives the samples of resampling the whole stream at once."""
+    rng = np.random.default_rng(seed=42)
+    audio_24k = (rng.standard_normal(SAMPLE_RATE_24K) * 3000).astype(np.int16)
+    expected = np.rint(upfirdn(_polyphase_filter(2, 3), audio_24k.astype(float), 2, 3)).astype(np.int16)
+
+    resampler = StreamingResampler(2, 3)
+    raw = audio_24k.tobytes()
+    chunks = []
+    position = 0
+    while position < len(raw):
+        size = int(rng.integers(1, 3000))
+        chunks.append(resampler.process(raw[position : position + size]))
+        position += size
+    resampled = np.concatenate(chunks)
+
+    assert len(resampled) == VAD_SAMPLE_RATE_16K
+    np.testing.assert_array_equal(resampled, expected[: len(resampled)])
+
+
+def test_voice_activity_pipeline():
+    """The pipeline runs the VAD on every 20ms frame of the stream and reports its CPU time."""
+    t = np.arange(SAMPLE_RATE_24K) / SAMPLE_RATE_24K
+    tone = (np.sin(2 * np.pi * 220 * t) * 8000 + np.sin(2 * np.pi * 660 * t) * 4000).astype(np.int16).tobytes()
+    silence = bytes(len(tone))
+    speech_chunks = []
+    pipeline = VoiceActivityPipeline(lambda: speech_chunks.append(1), mode=0)
+    try:
+        # Chunks that do not line up with frames, or even samples
+        for audio in (silence, tone):
+            for position in range(0, len(audio), 4801):
+                assert pipeline.feed(base64.b64encode(audio[position : position + 4801]).decode())
+    finally:
+        pipeline.close(5)
+
+    stats = pipeline.stats()
+    assert stats["audio_seconds"] == 2
+    assert stats["frames"] == 100
+    assert 0 < stats["speech_frames"] <= 50
+    # Called at most once per chunk, and only for chunks of the tone
+    assert 0 < len(speech_chunks) <= 11
+    assert stats["cpu_seconds"] > 0
+    assert stats["cpu_per_audio_second"] == stats["cpu_seconds"] / 2
+    assert stats["dropped"] == stats["failed"] == 0
+
+
+def test_voice_activity_pipeline_survives_failures():
+    """A chunk that fails, in the VAD or in the callback, is counted and the next chunks are still processed."""
+    t = np.arange(SAMPLE_RATE_24K // 10) / SAMPLE_RATE_24K
+    tone = base64.b64encode((np.sin(2 * np.pi * 220 * t) * 8000).astype(np.int16).tobytes()).decode()
+
+    def on_speech():
+        msg = "callback failed"
+        raise RuntimeError(msg)
+
+    pipeline = VoiceActivityPipeline(on_speech, mode=0)
+    try:
+        assert pipeline.feed("not base64!")
+        assert pipeline.feed(tone)
+        assert pipeline.feed(tone)
+    finally:
+        pipeline.close(5)
+
+    stats = pipeline.stats()
+    assert stats["failed"] == 3
+    assert stats["frames"] == 10